@@ -1,4 +1,4 @@
-@login_enroller_admin
+@login_enroller_admin @isolated_login
 Feature: tc02 - Dynamic Hamburger Menu Navigation on NGPEP portal
 
   As a user
@@ -1,4 +1,5 @@
 @login_parallel @e2e
+@parallel_role:enroller_admin
 Feature: tc16 - Activities CRUD E2E Test with Patient Workflow Movement
   As an Enroller Admin
   I want to create a complete workflow system with users, groups, patient groups, workflows, and activities
@@ -1,4 +1,4 @@
-@login_vpe_internal
+@login_vpe_internal @isolated_login
 Feature: tc02 - Dynamic Hamburger Menu Navigation on NGPEP portal
 
   As a user
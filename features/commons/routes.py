@@ -71,3 +71,15 @@ class Routes:
         global ENV
         BASE_URL = base_url
         ENV = env
+
+
+class ApiRoutes:
+    """
+    URL regexes of the list/search API calls behind page actions, for BasePage.wait_for_api_response.
+    Matched with re.search against the full request URL. Each is anchored to the end of the path, so
+    related endpoints (/patient-groups for patients, /activities/<id> for the list) don't end the wait.
+    """
+
+    PATIENT_SEARCH = r"/(?:patients(?:/search)?|global-?search)/?(?:[?#]|$)"
+    ACTIVITIES = r"/activit(?:y|ies)(?:/search)?/?(?:[?#]|$)"
+    PATIENT_GROUPS = r"/patient-?groups(?:/search)?/?(?:[?#]|$)"
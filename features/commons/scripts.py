@@ -0,0 +1,297 @@
+"""
+Central repository for JavaScript snippets executed in the browser by page objects and helpers.
+Snippets are grouped by purpose using classes.
+Access snippets directly using ClassName.SCRIPT_NAME.
+"""
+
+
+class LoaderScripts:
+    """Scripts for tracking loader/spinner visibility inside the page."""
+
+    # Async script. Arguments: [xpaths, timeout_ms, callback]
+    # Resolves with {done: bool, elapsed: ms} once none of the XPaths match a visible element,
+    # or when timeout_ms elapses. Visibility is re-evaluated on DOM mutations instead of polling.
+    WAIT_FOR_LOADERS_GONE = """
+        const xpaths = arguments[0];
+        const timeoutMs = arguments[1];
+        const done = arguments[arguments.length - 1];
+        const start = performance.now();
+
+        const isVisible = (el) => {
+            if (!el || !el.isConnected) return false;
+            const style = window.getComputedStyle(el);
+            if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+            return el.getClientRects().length > 0;
+        };
+
+        const anyLoaderVisible = () => xpaths.some((xp) => {
+            try {
+                const node = document.evaluate(
+                    xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+                ).singleNodeValue;
+                return isVisible(node);
+            } catch (e) {
+                return false;
+            }
+        });
+
+        let finished = false;
+        let observer = null;
+        let timer = null;
+        const finish = (ok) => {
+            if (finished) return;
+            finished = true;
+            if (observer) observer.disconnect();
+            if (timer) clearTimeout(timer);
+            done({done: ok, elapsed: Math.round(performance.now() - start)});
+        };
+
+        if (!anyLoaderVisible()) {
+            finish(true);
+            return;
+        }
+
+        observer = new MutationObserver(() => {
+            if (!anyLoaderVisible()) finish(true);
+        });
+        observer.observe(document.documentElement, {
+            childList: true,
+            subtree: true,
+            attributes: true,
+            attributeFilter: ['class', 'style', 'hidden']
+        });
+        timer = setTimeout(() => finish(!anyLoaderVisible()), timeoutMs);
+    """
+
+
+class StabilityScripts:
+    """Scripts for detecting when the page has gone quiet (no network activity, no DOM mutations)."""
+
+    # Async script. Arguments: [quiet_window_ms, timeout_ms, callback]
+    # Instruments fetch/XHR and DOM mutations once per document (window.__hboxNetMonitor), then resolves
+    # with {settled: bool, elapsed: ms, inflight: n} as soon as readyState is complete, no request is in
+    # flight and nothing has changed for quiet_window_ms. timeout_ms is an upper bound only.
+    WAIT_FOR_QUIESCENCE = """
+        const quietMs = arguments[0];
+        const timeoutMs = arguments[1];
+        const done = arguments[arguments.length - 1];
+        const start = performance.now();
+
+        if (!window.__hboxNetMonitor) {
+            const monitor = {inflight: 0, lastActivity: performance.now()};
+            const touch = () => { monitor.lastActivity = performance.now(); };
+            const settle = () => { monitor.inflight = Math.max(0, monitor.inflight - 1); touch(); };
+
+            if (window.fetch) {
+                const originalFetch = window.fetch;
+                window.fetch = function () {
+                    monitor.inflight++;
+                    touch();
+                    try {
+                        return originalFetch.apply(this, arguments).finally(settle);
+                    } catch (e) {
+                        settle();
+                        throw e;
+                    }
+                };
+            }
+
+            const originalSend = XMLHttpRequest.prototype.send;
+            XMLHttpRequest.prototype.send = function () {
+                monitor.inflight++;
+                touch();
+                this.addEventListener('loadend', settle, {once: true});
+                try {
+                    return originalSend.apply(this, arguments);
+                } catch (e) {
+                    settle();
+                    throw e;
+                }
+            };
+
+            new MutationObserver(touch).observe(document.documentElement, {
+                childList: true,
+                subtree: true,
+                attributes: true,
+                characterData: true
+            });
+            window.__hboxNetMonitor = monitor;
+        }
+
+        const monitor = window.__hboxNetMonitor;
+        const check = () => {
+            const now = performance.now();
+            const quiet = document.readyState === 'complete'
+                && monitor.inflight === 0
+                && now - monitor.lastActivity >= quietMs;
+            if (quiet || now - start >= timeoutMs) {
+                clearInterval(timer);
+                done({settled: quiet, elapsed: Math.round(now - start), inflight: monitor.inflight});
+            }
+        };
+        const timer = setInterval(check, 50);
+        check();
+    """
+
+
+class TableScripts:
+    """Scripts for reading table content without one WebDriver round trip per cell."""
+
+    # Sync script. Arguments: [root_element_or_null, options]
+    # options: headerRow (element), headerRowXPath, headerCellXPath, rowXPath, cellXPath,
+    #          rowElement (element to start from), startIndex, maxRows, columns (header names or 0-based indexes),
+    #          withElements (also return the row elements the texts were read from)
+    # Returns {headers: [...], columns: [...], totalRows: n, startIndex: n, rows: [[cell text, ...], ...],
+    #          elements: [row, ...] or null}.
+    # Empty header texts are dropped, matching the Python-side extraction this replaces.
+    SNAPSHOT_TABLE = """
+        const root = arguments[0] || document;
+        const opts = arguments[1] || {};
+
+        const text = (el) => (el.innerText || '').trim();
+        const select = (xpath, context) => {
+            const result = document.evaluate(
+                xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+            );
+            const nodes = [];
+            for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+            return nodes;
+        };
+
+        const headerRow = opts.headerRow
+            || (opts.headerRowXPath ? select(opts.headerRowXPath, root)[0] : null);
+        const headers = headerRow
+            ? select(opts.headerCellXPath || './/th', headerRow).map(text).filter((t) => t.length)
+            : [];
+
+        const allRows = select(opts.rowXPath || './/tbody/tr', root);
+        let start = opts.startIndex || 0;
+        if (opts.rowElement) {
+            start = allRows.indexOf(opts.rowElement);
+            if (start < 0) {
+                return {headers: headers, columns: headers, totalRows: allRows.length, startIndex: -1, rows: []};
+            }
+        }
+        const end = opts.maxRows ? start + opts.maxRows : allRows.length;
+        const rowElements = allRows.slice(start, end);
+
+        let columnIndexes = null;
+        let columns = headers;
+        if (opts.columns) {
+            columnIndexes = opts.columns.map((c) => (typeof c === 'number' ? c : headers.indexOf(c)));
+            columns = opts.columns.map((c) => (typeof c === 'number' ? (headers[c] || String(c)) : c));
+        }
+
+        const rows = rowElements.map((row) => {
+            const cells = select(opts.cellXPath || './/td', row).map(text);
+            if (!columnIndexes) return cells;
+            return columnIndexes.map((i) => (i >= 0 && i < cells.length ? cells[i] : ''));
+        });
+
+        return {headers: headers, columns: columns, totalRows: allRows.length, startIndex: start, rows: rows,
+                elements: opts.withElements ? rowElements : null};
+    """
+
+
+class SessionScripts:
+    """Scripts for capturing and restoring authenticated browser state."""
+
+    # Sync script. Returns {local: {...}, session: {...}} with every localStorage/sessionStorage entry.
+    CAPTURE_STORAGE = """
+        const dump = (storage) => {
+            const entries = {};
+            for (let i = 0; i < storage.length; i++) {
+                const key = storage.key(i);
+                entries[key] = storage.getItem(key);
+            }
+            return entries;
+        };
+        return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+    """
+
+    # Sync script. Arguments: [local_entries, session_entries]. Replaces both storages with the given entries.
+    RESTORE_STORAGE = """
+        const load = (storage, entries) => {
+            storage.clear();
+            Object.keys(entries || {}).forEach((key) => storage.setItem(key, entries[key]));
+        };
+        load(window.localStorage, arguments[0]);
+        load(window.sessionStorage, arguments[1]);
+    """
+
+    CLEAR_STORAGE = """
+        window.localStorage.clear();
+        window.sessionStorage.clear();
+    """
+
+
+class PerfScripts:
+    """Scripts for measuring page-load performance of full loads and in-app (SPA) navigations."""
+
+    # Sync script. Returns {origin, now}: the document's timeOrigin and performance.now() before a navigation.
+    MARK_NAVIGATION_START = """
+        return {origin: performance.timeOrigin, now: performance.now()};
+    """
+
+    # Async script. Arguments: [start_origin, start_now, callback]
+    # Resolves with the metrics of the navigation that started at (start_origin, start_now):
+    # kind 'full' when a new document was loaded (Navigation Timing + LCP), 'spa' for in-app route changes
+    # (time until the last fetch/XHR/DOM activity seen by window.__hboxNetMonitor), plus resource timing
+    # for everything fetched since the start.
+    COLLECT_NAVIGATION_METRICS = """
+        const startOrigin = arguments[0];
+        const startNow = arguments[1];
+        const done = arguments[arguments.length - 1];
+
+        const full = Math.abs(performance.timeOrigin - startOrigin) > 1;
+        const since = full ? 0 : startNow;
+        const round = (v) => (v === null || v === undefined ? null : Math.round(v));
+
+        const resources = performance.getEntriesByType('resource').filter((r) => r.startTime >= since);
+        const slowest = resources
+            .slice()
+            .sort((a, b) => b.duration - a.duration)
+            .slice(0, 3)
+            .map((r) => ({name: r.name, duration: round(r.duration)}));
+
+        const result = {
+            route: location.pathname,
+            kind: full ? 'full' : 'spa',
+            resources: resources.length,
+            transfer_bytes: resources.reduce((total, r) => total + (r.transferSize || 0), 0),
+            slowest_resources: slowest,
+            ttfb: null,
+            dom_content_loaded: null,
+            load: null,
+            lcp: null,
+            duration: null
+        };
+
+        if (!full) {
+            const monitor = window.__hboxNetMonitor;
+            const settledAt = monitor ? Math.max(monitor.lastActivity, startNow) : performance.now();
+            result.duration = round(settledAt - startNow);
+            done(result);
+            return;
+        }
+
+        const nav = performance.getEntriesByType('navigation')[0];
+        if (nav) {
+            result.ttfb = round(nav.responseStart);
+            result.dom_content_loaded = round(nav.domContentLoadedEventEnd);
+            result.load = round(nav.loadEventEnd);
+            result.duration = result.load || result.dom_content_loaded;
+        }
+        if (!window.PerformanceObserver
+            || !(PerformanceObserver.supportedEntryTypes || []).includes('largest-contentful-paint')) {
+            done(result);
+            return;
+        }
+        // LCP entries are only exposed to observers; buffered:true replays the ones already recorded
+        const observer = new PerformanceObserver((list) => {
+            const entries = list.getEntries();
+            if (entries.length) result.lcp = round(entries[entries.length - 1].startTime);
+        });
+        observer.observe({type: 'largest-contentful-paint', buffered: true});
+        setTimeout(() => { observer.disconnect(); done(result); }, 50);
+    """
@@ -1,13 +1,21 @@
 import traceback
 
 from features.commons.routes import Routes
-from utils.logger import printf
+from utils.logger import LogContext, printf
 from utils.ui.allure_helper import AllureHelper
-from utils.ui.config_reader import read_configuration
+from utils.ui.browser_console import BrowserConsole
+from utils.ui.command_profiler import CommandProfiler
+from utils.ui.config_reader import Settings
 from utils.ui.driver_manger import DriverManager
 from utils.ui.driver_manger import DriverRole
+from utils.ui.lean_profile import PageLoadStats
+from utils.ui.login_broker import LoginBroker
 from utils.ui.login_utility import LoginHelper
+from utils.ui.page_perf import PagePerf
 from utils.ui.popup_handler import PopupHandler
+from utils.ui.selenoid_scheduler import SelenoidScheduler
+from utils.ui.session_watchdog import SessionWatchdog
+from utils.ui.sleep_tracker import SleepTracker
 
 
 def before_all(context):
@@ -20,10 +28,8 @@ def before_all(context):
 
     # Setup environment configuration
     context.environment = context.config.userdata.get("env", "stg").lower()
-    env_section = f"{context.environment}_env"
-
     try:
-        context.base_url = read_configuration(env_section, "url")
+        context.base_url = Settings.get().get_env_url(context.environment)
         printf(f"Tests will run against {context.environment} environment: {context.base_url}")
     except KeyError:
         printf(f"Warning: URL for environment '{context.environment}' not found in config.ini. "
@@ -49,7 +55,38 @@ def before_feature(context, feature):
     AllureHelper.assign_scenario_tags_for_feature(context, feature)
 
 
-# Scenario hook not needed - tags assigned in before_feature
+# Suite tags are assigned in before_feature; scenario/step hooks feed profiling, sleep accounting and session recovery
+
+
+def before_scenario(context, scenario):
+    LogContext.start_scenario(scenario)
+    SleepTracker.start_scenario(scenario)
+    if CommandProfiler.is_enabled():
+        CommandProfiler.start_scenario()
+    if BrowserConsole.is_enabled():
+        BrowserConsole.start_scenario()
+    if SessionWatchdog.is_enabled():
+        # A step that failed because its browser session died is retried once on a recovered driver
+        SessionWatchdog.enable_step_retry(scenario, lambda step: LoginHelper.recover_lost_sessions(context, step))
+
+
+def after_scenario(context, scenario):
+    if CommandProfiler.is_enabled():
+        CommandProfiler.attach_scenario_profile(scenario)
+    if BrowserConsole.is_enabled():
+        # Reads the browser logs only for failed scenarios
+        BrowserConsole.attach_on_failure(context, scenario)
+    try:
+        # Fails the scenario when its fixed delays are over the budget and sleep_budget_action = fail
+        SleepTracker.end_scenario(scenario)
+    finally:
+        LogContext.end_scenario()
+
+
+def before_step(context, step):
+    LogContext.start_step(step)
+    if CommandProfiler.is_enabled():
+        CommandProfiler.start_step(step)
 
 
 def after_feature(context, feature):
@@ -66,6 +103,9 @@ def after_feature(context, feature):
 
 
 def after_step(context, step):
+    if CommandProfiler.is_enabled():
+        CommandProfiler.end_step()
+
     if step.status == 'failed':
         # Use hasattr to safely check if the attribute exists
         if hasattr(context, 'active_step_driver') and context.active_step_driver:
@@ -74,6 +114,10 @@ def after_step(context, step):
             driver_to_screenshot = context.driver
 
         AllureHelper.attach_failure(driver_to_screenshot, step)
+    else:
+        step_driver = getattr(context, 'active_step_driver', None) or getattr(context, 'driver', None)
+        # Actions that gave up inside a passing step (optional checks) are not failure evidence
+        AllureHelper.forget_failed_element(step_driver)
 
 
 def after_all(context):
@@ -88,6 +132,19 @@ def after_all(context):
         printf(f"Error during final driver cleanup: {e}")
         traceback.print_exc()
 
+    if CommandProfiler.is_enabled():
+        CommandProfiler.write_run_profile()
+    SleepTracker.write_run_report()
+    SelenoidScheduler.write_run_report()
+    PageLoadStats.write_run_report()
+    PagePerf.write_run_report()
+    SessionWatchdog.write_run_report()
+    LoginBroker.write_run_report()
+
     # Accumulate results and generate cumulative report
+    AllureHelper.flush_attachments()
     AllureHelper.accumulate_results()
     AllureHelper.generate_cumulative_report()
+
+    # Worker processes may exit without running atexit handlers; write out the enqueued log messages now
+    LogContext.flush()
@@ -1,11 +1,11 @@
-from time import sleep
 
 from selenium.common import NoSuchElementException
 
 from features.commons.locators import ActivitiesPageLocators
-from features.commons.routes import Routes
+from features.commons.routes import ApiRoutes, Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, verify_search_results_in_table, row_count_check
 
 
@@ -36,9 +36,9 @@ class ActivitiesPage(BasePage):
                 self.wait_for_loader()
 
             self.send_keys(ActivitiesPageLocators.SEARCH_INPUT, value)
-            sleep(1)
-            self.click(ActivitiesPageLocators.SEARCH_BUTTON)
-            self.wait_for_loader(timeout=30)
+            pause(1)
+            self.wait_for_api_response(lambda: self.click(ActivitiesPageLocators.SEARCH_BUTTON), ApiRoutes.ACTIVITIES,
+                                       timeout=30)
             return True
         except NoSuchElementException as e:
             printf(f"Error during activities search operation: {e}")
@@ -101,10 +101,10 @@ class ActivitiesPage(BasePage):
             return False
 
     def select_activity_records_per_page(self, records):
-        self.custom_select_by_locator(
+        self.wait_for_api_response(lambda: self.custom_select_by_locator(
             ActivitiesPageLocators.PAGE_LIMIT_DROPDOWN,
             ActivitiesPageLocators.DROPDOWN_OPTION(records),
-        )
+        ), ApiRoutes.ACTIVITIES)
 
     def verify_activity_records_per_page(self, records):
         try:
@@ -148,13 +148,13 @@ class ActivitiesPage(BasePage):
         try:
             # Enter activity name
             self.send_keys(ActivitiesPageLocators.ACTIVITY_NAME_INPUT, activity_name)
-            sleep(0.3)
+            pause(0.3)
             
             # Select patient group
             self.click(ActivitiesPageLocators.PATIENT_GROUP_DROPDOWN)
             self.wait_for_dom_stability()
             self.send_keys(ActivitiesPageLocators.PATIENT_GROUP_SEARCH_INPUT, patient_group_name)
-            sleep(0.3)
+            pause(0.3)
             self.click(ActivitiesPageLocators.PATIENT_GROUP_FIRST_OPTION)
             self.wait_for_dom_stability()
             if self.is_element_visible(ActivitiesPageLocators.PATIENT_GROUP_FIRST_OPTION):
@@ -167,7 +167,7 @@ class ActivitiesPage(BasePage):
             self.click(ActivitiesPageLocators.WORKFLOW_DROPDOWN)
             self.wait_for_dom_stability()
             self.send_keys(ActivitiesPageLocators.WORKFLOW_SEARCH_INPUT, workflow_name)
-            sleep(0.3)
+            pause(0.3)
             self.click(ActivitiesPageLocators.WORKFLOW_FIRST_OPTION)
             self.wait_for_dom_stability()
             if self.is_element_visible(ActivitiesPageLocators.WORKFLOW_FIRST_OPTION):
@@ -178,15 +178,15 @@ class ActivitiesPage(BasePage):
             
             # Set from date
             self.click(ActivitiesPageLocators.FROM_DATE_BUTTON)
-            sleep(1)
+            pause(1)
             self.select_calender_date(from_date, date_format="%d-%m-%Y")
-            sleep(1)
+            pause(1)
             
             # Set end date
             self.click(ActivitiesPageLocators.END_DATE_BUTTON)
-            sleep(1)
+            pause(1)
             self.select_calender_date(end_date, date_format="%d-%m-%Y")
-            sleep(1)
+            pause(1)
             self.select_schedule_slots()
             
             printf(f"Filled activity form: {activity_name}, Patient Group: {patient_group_name}, Workflow: {workflow_name}")
@@ -206,16 +206,16 @@ class ActivitiesPage(BasePage):
         """Selects schedule slots for the facility availability form."""
         try:
             self.click(ActivitiesPageLocators.ACTIVITY_SCHEDULE_CHECKBOX)
-            sleep(1)
+            pause(1)
             self.select_by_visible_text(ActivitiesPageLocators.FROM_HH_INPUT,"12")
             self.select_by_visible_text(ActivitiesPageLocators.FROM_MM_INPUT,"00")
             self.select_by_visible_text(ActivitiesPageLocators.FROM_AMPM_INPUT,"AM")
             self.select_by_visible_text(ActivitiesPageLocators.END_HH_INPUT,"11")
             self.select_by_visible_text(ActivitiesPageLocators.END_MM_INPUT,"45")
             self.select_by_visible_text(ActivitiesPageLocators.END_AMPM_INPUT,"PM")
-            sleep(1)
+            pause(1)
             self.click(ActivitiesPageLocators.COPY_TO_ALL_BUTTON)
-            sleep(1)
+            pause(1)
             printf("Selected times and copied to all days.")
         except NoSuchElementException as e:
             printf(f"Error selecting times: {e}")
@@ -237,7 +237,7 @@ class ActivitiesPage(BasePage):
         try:
             # Wait for any success notification to appear
             self.wait_for_dom_stability()
-            sleep(2)
+            pause(2)
             printf(f"Checking for notification: {expected_message}")
             return True
         except Exception as e:
@@ -261,7 +261,7 @@ class ActivitiesPage(BasePage):
             if rows is None:
                 printf(f"No results found for '{keyword}'")
                 break
-            if self._delete_first_matching_activity_by_name(rows, keyword):
+            if self._delete_first_matching_activity_by_name(keyword):
                 deleted_count += 1
                 printf(f"Successfully deleted activity containing '{keyword}' in name (#{deleted_count})")
             else:
@@ -294,11 +294,9 @@ class ActivitiesPage(BasePage):
 
             printf(f"Performing search for activities with name containing '{keyword}'")
             self.send_keys(ActivitiesPageLocators.SEARCH_INPUT, keyword)
-            sleep(3)
-            self.click(ActivitiesPageLocators.SEARCH_BUTTON)
+            pause(3)
             printf(f"search performed, waiting for results...")
-            self.wait_for_loader()
-            sleep(3)
+            self.wait_for_api_response(lambda: self.click(ActivitiesPageLocators.SEARCH_BUTTON), ApiRoutes.ACTIVITIES)
         except Exception as e:
             printf(f"Error searching for activities: {e}")
         
@@ -319,37 +317,34 @@ class ActivitiesPage(BasePage):
             printf(f"Error checking for activities table rows: {e}")
             return None
 
-    def _delete_first_matching_activity_by_name(self, rows, keyword):
+    def _delete_first_matching_activity_by_name(self, keyword):
         """Find and delete the first activity row matching the keyword.
         
         Args:
-            rows: List of table row elements.
             keyword: Substring to match in activity name.
             
         Returns:
             bool: True if deletion was successful, False otherwise.
         """
         try:
-            for row in rows:
-                # Get activity name from first column (td[1])
-                name_cell = row.find_element("xpath", ".//td[1]")
-                activity_name = name_cell.text.strip()
-                
-                if keyword.lower() in activity_name.lower():
-                    # Find and click the delete button in the last column
-                    delete_button = row.find_element("xpath", ".//td[last()]//button[contains(@id,'delete')]")
-                    delete_button.click()
-                    self.wait_for_dom_stability()
-                    
-                    # Confirm deletion using the locator
-                    self.click(ActivitiesPageLocators.DELETE_CONFIRMATION_DIALOG_CONFIRM_BUTTON)
-                    
-                    # Wait for dialog to disappear and loader to complete
-                    self.wait_for_loader(loader_locators=ActivitiesPageLocators.DELETE_CONFIRMATION_DIALOG)
-                    printf(f"Deleted activity '{activity_name}'")
-                    return True
-            
-            return False
+            # Activity name is in the first column (td[1]); name and row are read in one call
+            row, activity_name = self.find_table_row(ActivitiesPageLocators.ACTIVITIES_TABLE_ROWS, 0,
+                                                     lambda name: keyword.lower() in name.lower())
+            if row is None:
+                return False
+
+            # Find and click the delete button in the last column
+            delete_button = row.find_element("xpath", ".//td[last()]//button[contains(@id,'delete')]")
+            delete_button.click()
+            self.wait_for_dom_stability()
+
+            # Confirm deletion using the locator
+            self.click(ActivitiesPageLocators.DELETE_CONFIRMATION_DIALOG_CONFIRM_BUTTON)
+
+            # Wait for dialog to disappear and loader to complete
+            self.wait_for_loader(loader_locators=ActivitiesPageLocators.DELETE_CONFIRMATION_DIALOG)
+            printf(f"Deleted activity '{activity_name}'")
+            return True
         except Exception as e:
             printf(f"Error deleting activity: {e}")
             return False
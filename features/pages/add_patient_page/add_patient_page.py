@@ -1,4 +1,3 @@
-from time import sleep
 
 from faker.proxy import Faker
 from selenium.webdriver.common.by import By
@@ -7,6 +6,7 @@ from features.commons.locators import AddPatientPageLocators
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import get_fixed_dob
 
 
@@ -32,7 +32,7 @@ class AddPatientPage(BasePage):
             self.wait_for_loader()
             printf(f"Selecting clinic: {clinic_name}")
             self.click(AddPatientPageLocators.SELECT_CLINIC_DROPDOWN)
-            sleep(0.5)
+            pause(0.5)
             clinic_option = AddPatientPageLocators.SELECT_CLINIC_OPTION(clinic_name)
             self.click(clinic_option)
             self.wait_for_dom_stability()
@@ -46,7 +46,7 @@ class AddPatientPage(BasePage):
         try:
             printf(f"Selecting facility: {facility_name}")
             self.click(AddPatientPageLocators.SELECT_FACILITY_DROPDOWN)
-            sleep(0.5)
+            pause(0.5)
             facility_option = AddPatientPageLocators.SELECT_FACILITY_OPTION(facility_name)
             self.click(facility_option)
             self.wait_for_dom_stability()
@@ -60,7 +60,7 @@ class AddPatientPage(BasePage):
         try:
             printf("Selecting first available provider")
             self.click(AddPatientPageLocators.SELECT_PROVIDER_DROPDOWN)
-            sleep(0.5)
+            pause(0.5)
             # Click the first option in the provider dropdown
             first_option = (By.XPATH, "//div[@role='option'][1]")
             self.click(first_option)
@@ -144,7 +144,7 @@ class AddPatientPage(BasePage):
         """Select gender from dropdown."""
         try:
             self.click(AddPatientPageLocators.GENDER_DROPDOWN)
-            sleep(0.3)
+            pause(0.3)
             gender_option = AddPatientPageLocators.GENDER_OPTION(gender)
             self.click(gender_option)
             printf(f"Selected gender: {gender}")
@@ -156,14 +156,14 @@ class AddPatientPage(BasePage):
         """Select height from dropdowns."""
         try:
             self.click(AddPatientPageLocators.HEIGHT_FEET_DROPDOWN)
-            sleep(0.3)
+            pause(0.3)
             self.click(AddPatientPageLocators.HEIGHT_OPTION(feet))
-            sleep(0.3)
+            pause(0.3)
             
             self.click(AddPatientPageLocators.HEIGHT_INCHES_DROPDOWN)
-            sleep(0.3)
+            pause(0.3)
             self.click(AddPatientPageLocators.HEIGHT_OPTION(inches))
-            sleep(0.3)
+            pause(0.3)
             printf(f"Selected height: {feet}'{inches}\"")
         except Exception as e:
             printf(f"Error selecting height: {e}")
@@ -1,7 +1,6 @@
 import time
 import traceback
 from datetime import datetime
-from time import sleep
 from urllib.parse import urlparse
 
 from selenium.common.exceptions import (
@@ -10,6 +9,8 @@ from selenium.common.exceptions import (
     NoSuchWindowException,
     StaleElementReferenceException,
     NoSuchElementException,
+    JavascriptException,
+    WebDriverException,
 )
 from selenium.webdriver import Keys
 from selenium.webdriver.common.action_chains import ActionChains
@@ -20,7 +21,13 @@ from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.wait import WebDriverWait
 
+from features.commons.scripts import LoaderScripts, StabilityScripts, TableScripts
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
+from utils.ui.config_reader import get_loader_wait_mode, get_dom_quiet_window_ms
+from utils.ui.network_events import ApiResponseWaiter
+from utils.ui.page_perf import PagePerf
+from utils.ui.session_watchdog import SessionWatchdog, is_session_lost_error
 from utils.utils import slugify
 
 
@@ -111,9 +118,42 @@ class BasePage:
         self.driver = driver
         self.wait = WebDriverWait(driver, 15)
 
+    def rebind_driver(self, driver: WebDriver):
+        """Point this page object at another driver, e.g. the replacement of a lost browser session."""
+        self.driver = driver
+        self.wait = WebDriverWait(driver, 15)
+
     # -------------------- Core Retry Mechanism --------------------
 
+    def _execute_async_script_with_timeout(self, script, timeout, *args):
+        """Run an async script with the driver script timeout raised to cover `timeout`, then restore it."""
+        original_script_timeout = self.driver.timeouts.script
+        # Leave headroom so the in-page timer always resolves before Selenium gives up
+        self.driver.set_script_timeout(timeout + 5)
+        try:
+            return self.driver.execute_async_script(script, *args)
+        finally:
+            try:
+                self.driver.set_script_timeout(original_script_timeout)
+            except WebDriverException:
+                pass
+
     def wait_for_dom_stability(self, timeout=1):
+        """
+        Wait until the page is quiet: readyState is complete, no fetch/XHR is in flight and the DOM has not
+        mutated for the configured quiet window. `timeout` is an upper bound, not a fixed sleep.
+        """
+        try:
+            result = self._execute_async_script_with_timeout(
+                StabilityScripts.WAIT_FOR_QUIESCENCE, timeout, get_dom_quiet_window_ms(), int(timeout * 1000)
+            )
+            if not result.get("settled"):
+                printf(f"[WARN] DOM did not stabilize within {timeout}s "
+                       f"({result.get('inflight', 0)} request(s) still in flight)")
+            return
+        except (JavascriptException, TimeoutException, WebDriverException, AttributeError) as e:
+            printf(f"[WARN] Network quiescence check failed, using fixed wait: {e}")
+
         try:
             # prefer waiting for readyState = complete briefly
             WebDriverWait(self.driver, min(timeout, 3)).until(
@@ -121,7 +161,7 @@ class BasePage:
             )
         except Exception as e:
             printf(f"[WARN] DOM did not stabilize in time: {e}")
-        time.sleep(timeout)
+        pause(timeout)
 
     def _handle_stale_exception(self, attempt, max_attempts, locator, js_fallback):
         printf(f"StaleElementReferenceException on attempt {attempt + 1} for {locator}, retrying...")
@@ -159,6 +199,10 @@ class BasePage:
         return None
 
     def _handle_exception(self, e, attempt, max_attempts, locator, js_fallback, suppress_timeout):
+        if is_session_lost_error(e) or SessionWatchdog.is_lost(self.driver):
+            # No retry can succeed against a dead session; fail now so the session can be recovered
+            printf(f"Browser session lost, not retrying action on {locator}: {e}")
+            raise e
         if isinstance(e, StaleElementReferenceException):
             ret = self._handle_stale_exception(attempt, max_attempts, locator, js_fallback)
         elif isinstance(e, ElementClickInterceptedException):
@@ -189,6 +233,9 @@ class BasePage:
                 if action_type == 'continue':
                     continue
                 elif action_type == 'return':
+                    if not value and locator is not None:
+                        # Lets the failure screenshot include the element this action gave up on
+                        self.driver._hbox_failed_locator = locator
                     return value
         # if loop completes, return False for suppressed flows
         return False
@@ -375,7 +422,7 @@ class BasePage:
     def check_url_contains(self, text, partial=True):
         """Check whether URL contains a slugified last segment or full match."""
         printf(f"Checking if URL contains '{text}' (partial={partial})")
-        sleep(1)
+        pause(1)
         if partial:
             slug_text = slugify(text)
 
@@ -652,22 +699,24 @@ class BasePage:
 
     def refresh_page(self):
         self.driver.refresh()
-        sleep(1)  # Small delay to ensure page is fully refreshed
+        pause(1)  # Small delay to ensure page is fully refreshed
 
     def navigate_to(self, url):
         """
         Navigate to a specific URL.
         """
+        PagePerf.start(self.driver)
         self.driver.get(url)
         self.wait_for_dom_stability()
+        PagePerf.capture(self, url, settled=True)
 
     def navigate_back(self):
         self.driver.back()
-        sleep(1)  # Small delay to ensure navigation completes
+        pause(1)  # Small delay to ensure navigation completes
 
     def navigate_forward(self):
         self.driver.forward()
-        sleep(1)  # Small delay to ensure navigation completes
+        pause(1)  # Small delay to ensure navigation completes
 
     def hard_refresh_with_cache_clear(self):
         # Execute JavaScript to clear cache and perform a hard refresh
@@ -677,7 +726,7 @@ class BasePage:
             printf(f"Error performing hard refresh via JS: {e}")
             # fallback refresh
             self.driver.refresh()
-        sleep(2)  # Longer delay to ensure cache is cleared and page is fully reloaded
+        pause(2)  # Longer delay to ensure cache is cleared and page is fully reloaded
 
     def clear_browser_cache(self):
         # Execute JavaScript to clear localStorage and sessionStorage
@@ -691,7 +740,7 @@ class BasePage:
             self.driver.delete_all_cookies()
         except Exception as e:
             printf(f"Error deleting cookies: {e}")
-        sleep(1)
+        pause(1)
 
     # -------------------- Table / Spinner / Wait Helpers --------------------
 
@@ -708,38 +757,88 @@ class BasePage:
                 printf(f"Error getting table rows: {e}")
                 return 0
 
-    def extract_table_data(self, table_locator: tuple, first_row_only: bool = False):
+    def snapshot_table(self, table_locator=None, max_rows=None, columns=None, first_row_only=False, start_row=0,
+                       row=None, header_row=None, header_row_xpath=".//thead/tr", header_cell_xpath=".//th",
+                       row_xpath=".//tbody/tr", with_elements=False):
+        """
+        Serialize table headers and rows to JSON inside the browser with a single execute_script call.
+
+        Args:
+            table_locator: Locator tuple or WebElement for the <table>, or None to evaluate row_xpath on the document
+            max_rows (int): Maximum number of rows to return (None for all)
+            columns (list): Header names or 0-based column indexes to keep (None for all)
+            first_row_only (bool): Shortcut for max_rows=1
+            start_row (int): Index of the first row to return
+            row (WebElement): Start from this row instead of start_row
+            header_row (WebElement): Use this element as header row instead of header_row_xpath
+            header_row_xpath (str): XPath (relative to the table) of the header row
+            header_cell_xpath (str): XPath (relative to the header row) of header cells
+            row_xpath (str): XPath (relative to the table) of data rows
+            with_elements (bool): Also return the row WebElements, read in the same call as their texts
+
+        Returns:
+            dict: {"headers": [...], "columns": [...], "rows": [[cell, ...], ...], "total_rows": int,
+                   "start_row": int, "elements": [WebElement, ...] or None} - start_row is -1 if `row` is not
+                   part of the table
+        """
+        table = self._resolve_element(table_locator) if table_locator is not None else None
+        options = {
+            "headerRow": header_row,
+            "headerRowXPath": header_row_xpath,
+            "headerCellXPath": header_cell_xpath,
+            "rowXPath": row_xpath,
+            "rowElement": row,
+            "startIndex": start_row,
+            "maxRows": 1 if first_row_only else max_rows,
+            "columns": list(columns) if columns else None,
+            "withElements": with_elements,
+        }
+        result = self.driver.execute_script(TableScripts.SNAPSHOT_TABLE, table, options)
+        return {
+            "headers": result["headers"],
+            "columns": result["columns"],
+            "rows": result["rows"],
+            "total_rows": result["totalRows"],
+            "start_row": result["startIndex"],
+            "elements": result.get("elements"),
+        }
+
+    def find_table_row(self, rows_locator, column, predicate):
+        """
+        Find the first row of `rows_locator` whose `column` (0-based) cell text satisfies `predicate`.
+        The texts and the row elements come from one snapshot, so the returned row is the one that was read
+        even if the table re-renders afterwards (a stale row then fails loudly instead of hitting another record).
+
+        Returns:
+            tuple: (row WebElement, cell text), or (None, None) if no row matches
+        """
+        snapshot = self.snapshot_table(None, columns=[column], header_row_xpath=None, row_xpath=rows_locator[1],
+                                       with_elements=True)
+        for row, (text,) in zip(snapshot["elements"], snapshot["rows"]):
+            if predicate(text):
+                return row, text
+        return None, None
+
+    def extract_table_data(self, table_locator: tuple, first_row_only: bool = False, max_rows: int = None,
+                           columns: list = None):
         """
         Extract data from an HTML table as a list of dictionaries (header -> cell value).
 
         Args:
             table_locator (tuple): Locator for the <table> element (By, "value")
             first_row_only (bool): If True, return only the first row as a dict
+            max_rows (int): Maximum number of rows to return (None for all)
+            columns (list): Header names or 0-based column indexes to keep (None for all)
 
         Returns:
             list[dict] or dict: List of rows as dicts, or single dict if first_row_only=True
         """
+        snapshot = self.snapshot_table(table_locator, max_rows=max_rows, columns=columns,
+                                       first_row_only=first_row_only)
+        all_data = [dict(zip(snapshot["columns"], cells)) for cells in snapshot["rows"]]
 
-        # Get table element
-        table: WebElement = self.find_element(table_locator)
-
-        # Extract headers dynamically
-        header_row: WebElement = table.find_element(By.XPATH, ".//thead/tr")
-        headers = [th.text.strip() for th in header_row.find_elements(By.TAG_NAME, "th") if th.text.strip()]
-
-        # Extract all body rows
-        body_rows = table.find_elements(By.XPATH, ".//tbody/tr")
-        all_data = []
-
-        for row in body_rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            cell_texts = [c.text.strip() for c in cells]
-            row_dict = dict(zip(headers, cell_texts))
-            all_data.append(row_dict)
-
-            if first_row_only:
-                return row_dict  # Return immediately for first row
-
+        if first_row_only and all_data:
+            return all_data[0]
         return all_data
 
     def wait_for_loader(self, timeout=15, strict=True, loader_locators=None):
@@ -747,10 +846,84 @@ class BasePage:
             loader_locators = self.ALL_LOADER_LOCATORS
         elif not isinstance(loader_locators, list):
             loader_locators = [loader_locators]
-        
+
+        printf(f"⏳ Waiting for loaders to disappear (timeout={timeout}, strict={strict})...")
+
+        if get_loader_wait_mode() == 'observer':
+            result = self._wait_for_loader_observer(loader_locators, timeout)
+            if result is not None:
+                loaders_gone, elapsed = result
+                if loaders_gone:
+                    printf(f"✅ All loaders disappeared after {elapsed:.2f}s")
+                    return True
+                msg = f"❌ Some loaders still visible after {elapsed:.2f}s"
+                if strict:
+                    raise TimeoutException(msg)
+                printf(msg)
+                return False
+            printf("Loader observer unavailable, falling back to polling")
+
+        return self._wait_for_loader_polling(loader_locators, timeout, strict)
+
+    def wait_for_api_response(self, action, url_pattern=None, timeout=15):
+        """
+        Run `action` and block until the XHR/fetch call(s) it triggers have completed.
+
+        The CDP network listener is armed before `action` runs, so fast responses are not missed. Only calls
+        whose URL matches the `url_pattern` regex are considered (all data calls when None, so pass one of the
+        features.commons.routes.ApiRoutes patterns). Falls back to wait_for_loader when network events are
+        disabled or unavailable, when no matching call starts within ApiResponseWaiter.GRACE_PERIOD, or when
+        it does not complete in time.
+
+        Args:
+            action: Callable performing the UI interaction (e.g. lambda: self.click(SEARCH_BUTTON))
+            url_pattern: Regex for the API URL to wait for (ApiRoutes)
+            timeout: Maximum seconds to wait for the response
+
+        Returns:
+            dict: url, method, status, ok, duration_ms of the completed call, or None if it was not observed
+        """
+        waiter = ApiResponseWaiter(self.driver, url_pattern)
+        if not waiter.arm():
+            action()
+            self.wait_for_loader(timeout=timeout, strict=False)
+            return None
+
+        action()
+        response = waiter.wait(timeout)
+        if response is None:
+            self.wait_for_loader(timeout=timeout, strict=False)
+            return None
+
+        printf(f"API response {response['status']} for {response['method']} {response['url']} "
+               f"in {response['duration_ms']}ms")
+        # The response has arrived; let the framework finish rendering it
+        self.wait_for_loader(timeout=timeout, strict=False)
+        return response
+
+    def _wait_for_loader_observer(self, loader_locators, timeout):
+        """
+        Wait for loaders using a MutationObserver injected into the page (one execute_async_script call).
+
+        Returns:
+            tuple | None: (loaders_gone, elapsed_seconds), or None if the observer could not run
+        """
+        xpaths = [value for by, value in loader_locators if by == By.XPATH]
+        if len(xpaths) != len(loader_locators):
+            return None
+
+        try:
+            result = self._execute_async_script_with_timeout(
+                LoaderScripts.WAIT_FOR_LOADERS_GONE, timeout, xpaths, int(timeout * 1000)
+            )
+            return bool(result.get("done")), result.get("elapsed", 0) / 1000
+        except (JavascriptException, TimeoutException, WebDriverException, AttributeError) as e:
+            printf(f"[WARN] Loader observer failed: {e}")
+            return None
+
+    def _wait_for_loader_polling(self, loader_locators, timeout, strict):
         original_wait = self.driver.timeouts.implicit_wait
         self.driver.implicitly_wait(0)
-        printf(f"⏳ Waiting for loaders to disappear (timeout={timeout}, strict={strict})...")
         start_time = time.time()
 
         while time.time() - start_time < timeout:
@@ -771,6 +944,7 @@ class BasePage:
                 printf(f"✅ All loaders disappeared after {elapsed:.2f}s")
                 return True
             
+            # Polling interval, not a fixed delay: not counted against the sleep budget
             time.sleep(0.2)
 
         # Timeout
@@ -876,7 +1050,7 @@ class BasePage:
                 lambda d: d.execute_script("return document.readyState") == "complete"
             )
             # Optional: ensure React rendering has flushed
-            time.sleep(0.3)  # brief pause after readyState
+            pause(0.3)  # brief pause after readyState
             return True
         except Exception as e:
             printf(f"[WARN] DOM did not stabilize in time: {e}")
@@ -905,7 +1079,7 @@ class BasePage:
         """Custom dropdown selection for non-standard select elements."""
         dropdown = self.find_element(base_locator)
         dropdown.click()
-        time.sleep(0.5)  # wait for options to render
+        pause(0.5)  # wait for options to render
         option = self.find_element(option_locator)
         option.click()
         return True
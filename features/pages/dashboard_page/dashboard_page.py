@@ -1,5 +1,4 @@
 import traceback
-from time import sleep
 from urllib.parse import urlparse
 
 from selenium.webdriver.common.by import By
@@ -7,6 +6,8 @@ from selenium.webdriver.common.by import By
 from features.commons.locators import DashboardPageLocators
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.page_perf import PagePerf
+from utils.ui.sleep_tracker import pause
 
 
 class DashboardPage(BasePage):
@@ -28,7 +29,7 @@ class DashboardPage(BasePage):
         try:
             if self.is_element_visible(DashboardPageLocators.NOTIFICATION_POPUP, timeout=1):
                 self.click(DashboardPageLocators.NOTIFICATION_CLOSE_BUTTON)
-                sleep(1)
+                pause(1)
             self.click_dynamic_hamburger_menu_option(page_name)
             self.wait_for_dom_stability(timeout=5)
         except Exception as e:
@@ -40,7 +41,10 @@ class DashboardPage(BasePage):
         try:
             dynamic_locator = DashboardPageLocators.HAMBURGER_MENU_OPTION(option_text=option_name)
             self.is_element_visible(dynamic_locator, timeout=2)
-            return self.click(dynamic_locator)
+            PagePerf.start(self.driver)
+            clicked = self.click(dynamic_locator)
+            PagePerf.capture(self, f"menu: {option_name}")
+            return clicked
         except Exception as e:
             printf(f"Error clicking dynamic menu option '{option_name}': {e}")
             return False
@@ -114,7 +118,7 @@ class DashboardPage(BasePage):
             print(f"🔍 Searching for menu items with locator: {menu_items_locator[1]}")
 
             # Brief wait for menu items to be visible
-            sleep(1)
+            pause(1)
 
             # Get all menu item elements
             menu_items = self.find_elements(menu_items_locator)
@@ -270,7 +274,7 @@ class DashboardPage(BasePage):
         """Click on the 'Logout' option in the hamburger menu."""
         try:
             self.click(DashboardPageLocators.LOGOUT_BUTTON)
-            sleep(1)
+            pause(1)
             self.is_element_visible(DashboardPageLocators.LOGOUT_DIALOG_CONFIRM_BUTTON, timeout=5)
             self.click(DashboardPageLocators.LOGOUT_DIALOG_CONFIRM_BUTTON)
             return True
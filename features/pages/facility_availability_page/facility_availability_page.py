@@ -1,4 +1,3 @@
-from time import sleep
 
 from selenium.common import NoSuchElementException
 
@@ -6,6 +5,7 @@ from features.commons.locators import FacilityAvailabilityPageLocators
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, verify_search_results_in_table, row_count_check, get_current_date
 
 
@@ -134,31 +134,31 @@ class FacilityAvailabilityPage(BasePage):
             self.wait_for_dom_stability()
             self.send_keys(FacilityAvailabilityPageLocators.SELECT_SEARCH_CLINIC_INPUT, clinic_name)
             self.wait_for_dom_stability()
-            sleep(1)
+            pause(1)
             self.click(FacilityAvailabilityPageLocators.FACILITY_DROPDOWN_OPTION(clinic_name))
             self.wait_for_dom_stability()
-            sleep(1)
+            pause(1)
 
             self.click(FacilityAvailabilityPageLocators.SELECT_FACILITY_DROPDOWN)
             self.wait_for_dom_stability()
             self.click(FacilityAvailabilityPageLocators.DROPDOWN_OPTION(facility_name))
-            sleep(1)
+            pause(1)
 
             self.click(FacilityAvailabilityPageLocators.FROM_DATE_BUTTON)
             self.wait_for_dom_stability()
             self.select_calender_date(start_date, date_format="%d-%m-%Y")
-            sleep(1)
+            pause(1)
             self.click(FacilityAvailabilityPageLocators.TO_DATE_BUTTON)
             self.wait_for_dom_stability()
             self.select_calender_date(end_date, date_format="%d-%m-%Y")
-            sleep(1)
+            pause(1)
 
             self.click(FacilityAvailabilityPageLocators.TIMEZONE_DROPDOWN)
             self.wait_for_dom_stability()
             self.click(FacilityAvailabilityPageLocators.DROPDOWN_OPTION(timezone))
             self.wait_for_dom_stability()
 
-            sleep(1)
+            pause(1)
 
             self.select_schedule_slots()
 
@@ -177,16 +177,16 @@ class FacilityAvailabilityPage(BasePage):
         """Selects schedule slots for the facility availability form."""
         try:
             self.click(FacilityAvailabilityPageLocators.SCHEDULE_DAY_CHECKBOX)
-            sleep(1)
+            pause(1)
             self.select_by_visible_text(FacilityAvailabilityPageLocators.START_TIME_HOUR_SELECT, "12")
             self.select_by_visible_text(FacilityAvailabilityPageLocators.START_TIME_MINUTE_SELECT, "00")
             self.select_by_visible_text(FacilityAvailabilityPageLocators.START_TIME_AM_PM_SELECT, "AM")
             self.select_by_visible_text(FacilityAvailabilityPageLocators.END_TIME_HOUR_SELECT, "11")
             self.select_by_visible_text(FacilityAvailabilityPageLocators.END_TIME_MINUTE_SELECT, "45")
             self.select_by_visible_text(FacilityAvailabilityPageLocators.END_TIME_AM_PM_SELECT, "PM")
-            sleep(1)
+            pause(1)
             self.click(FacilityAvailabilityPageLocators.COPY_TO_ALL_DAYS_BUTTON)
-            sleep(1)
+            pause(1)
             printf("Selected times and copied to all days.")
         except NoSuchElementException as e:
             printf(f"Error selecting times: {e}")
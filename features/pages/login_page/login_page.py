@@ -1,12 +1,15 @@
-from time import sleep
+from configparser import NoOptionError, NoSectionError
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from features.commons.locators import LoginPageLocators
 from selenium.common.exceptions import TimeoutException
-from utils.ui.config_reader import read_configuration, get_browser_config
+from utils.ui.config_reader import Settings, get_browser_config
 from utils.ui.driver_manger import DriverRole
+from utils.ui.lean_profile import PageLoadStats
+from utils.ui.page_perf import PagePerf
 
 
 class LoginPage(BasePage):
@@ -18,7 +21,10 @@ class LoginPage(BasePage):
 
     def navigate_to_login(self):
         """Navigate to the login_page page."""
+        PagePerf.start(self.driver)
         self.driver.get(self.url)
+        PageLoadStats.record(self.driver, "login")
+        PagePerf.capture(self, "login")
 
     def enter_email(self, email):
         """Enter email in the email input field."""
@@ -31,12 +37,12 @@ class LoginPage(BasePage):
     def click_submit(self):
         """Click the submit button."""
         self.click(LoginPageLocators.SUBMIT_BUTTON)
-        sleep(2)
+        pause(2)
 
     def click_sign_out(self):
         """Click the sign-out button."""
         self.click(LoginPageLocators.SIGN_OUT_BUTTON)
-        sleep(2)
+        pause(2)
         self.click(LoginPageLocators.LOG_OUT_CONFIRM_BUTTON)
 
     def is_login_successful(self):
@@ -72,7 +78,7 @@ class LoginPage(BasePage):
         self.enter_email(email)
         self.enter_password(password)
         self.click_submit()
-        sleep(1)
+        pause(1)
         self.check_url_changes(self.url)
 
     @classmethod
@@ -88,10 +94,11 @@ class LoginPage(BasePage):
         """
         config_username_key = f"{user_role}_user_name"
         try:
-            username = read_configuration("Credentials", config_username_key)
-            password = read_configuration("Credentials", f"common_{Routes.get_env()}_password")
+            settings = Settings.get()
+            username = settings.get_username(user_role)
+            password = settings.get_password(Routes.get_env())
             return username, password
-        except KeyError:
+        except (KeyError, NoOptionError, NoSectionError):
             error_msg = (f"Username for user type '{user_role}' (key '{config_username_key}') "
                          f"not found in [Credentials] section of config.ini. "
                          f"Please ensure '{config_username_key}' is defined.")
@@ -1,4 +1,3 @@
-from time import sleep
 
 from selenium.common import NoSuchElementException
 
@@ -6,6 +5,7 @@ from features.commons.locators import PatientDetailsPageLocators
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 
 
 class PatientDetailsPage(BasePage):
@@ -35,20 +35,20 @@ class PatientDetailsPage(BasePage):
             # Click on program status dropdown
             printf(f"Attempting to change program status to: {new_status}")
             self.click(PatientDetailsPageLocators.PROGRAM_STATUS_DROPDOWN)
-            sleep(1)
+            pause(1)
             self.wait_for_dom_stability()
             
             # Select the new status
             status_option = PatientDetailsPageLocators.PROGRAM_STATUS_OPTION(new_status)
             self.click(status_option)
-            sleep(1)
+            pause(1)
             self.wait_for_dom_stability()
             
             # Save the change
             self.click(PatientDetailsPageLocators.SAVE_CHANGES_BUTTON)
             self.wait_for_loader()
             self.wait_for_dom_stability()
-            sleep(2)
+            pause(2)
             
             printf(f"Successfully changed program status to: {new_status}")
             return True
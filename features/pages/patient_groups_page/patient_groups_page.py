@@ -1,14 +1,14 @@
 import os
-from time import sleep
 
 from faker.proxy import Faker
 from selenium.common import NoSuchElementException
 from selenium.webdriver.common.by import By
 
 from features.commons.locators import PatientGroupsPageLocators
-from features.commons.routes import Routes
+from features.commons.routes import ApiRoutes, Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, verify_search_results_in_table, row_count_check
 
 
@@ -28,8 +28,8 @@ class PatientGroupsPage(BasePage):
             printf(f"Performing search for field '{field}' with value '{value}'")
             # For patient groups, the search is by Group Name, and input is direct
             self.send_keys(PatientGroupsPageLocators.SEARCH_INPUT, value)
-            self.click(PatientGroupsPageLocators.SEARCH_BUTTON)
-            self.wait_for_loader()
+            self.wait_for_api_response(lambda: self.click(PatientGroupsPageLocators.SEARCH_BUTTON),
+                                       ApiRoutes.PATIENT_GROUPS)
             return True
         except Exception as e:
             printf(f"Failed to perform search: {e}")
@@ -66,28 +66,28 @@ class PatientGroupsPage(BasePage):
     def verify_history_dialog_opens(self):
         """Verify that the history dialog is open."""
         result = self.is_element_visible(PatientGroupsPageLocators.HISTORY_DIALOG)
-        sleep(1)
+        pause(1)
         self.click(PatientGroupsPageLocators.HISTORY_DIALOG_CLOSE_BUTTON)
         return result
 
     def is_navigated_to_edit_page(self):
         """Verify that the Edit Patient Group page is loaded."""
         result = self.check_url_contains(Routes.EDIT_PATIENT_GROUP, partial=False)
-        sleep(1)
+        pause(1)
         self.navigate_back()
         return result
 
     def verify_delete_dialog_opens(self):
         """Verify that the delete confirmation dialog is open."""
         result = self.is_element_visible(PatientGroupsPageLocators.DELETE_DIALOG)
-        sleep(1)
+        pause(1)
         self.click(PatientGroupsPageLocators.DELETE_DIALOG_CANCEL_BUTTON)
         return result
 
     def verify_archive_dialog_opens(self, cancel_after_verify=True):
         """Verify that the archive confirmation dialog is open."""
         result = self.is_element_visible(PatientGroupsPageLocators.ARCHIVE_DIALOG)
-        sleep(1)
+        pause(1)
         if cancel_after_verify:
             self.click(PatientGroupsPageLocators.ARCHIVE_DIALOG_CANCEL_BUTTON)
         return result
@@ -95,7 +95,7 @@ class PatientGroupsPage(BasePage):
     def is_navigated_to_duplicate_page(self):
         """Verify that the Duplicate Patient Group details page is loaded."""
         result = self.check_url_contains(Routes.DUPLICATE_PATIENT_GROUP, partial=False)
-        sleep(1)
+        pause(1)
         self.navigate_back()
         return result
 
@@ -104,8 +104,7 @@ class PatientGroupsPage(BasePage):
         try:
             self.click(PatientGroupsPageLocators.PAGE_LIMIT_DROPDOWN)
             option_locator = (By.XPATH, f"//div[@role='option']/span[normalize-space(text())='{records}']")
-            self.click(option_locator)
-            self.wait_for_loader()
+            self.wait_for_api_response(lambda: self.click(option_locator), ApiRoutes.PATIENT_GROUPS)
             return True
         except Exception as e:
             printf(f"Failed to select records per page: {e}")
@@ -172,7 +171,7 @@ class PatientGroupsPage(BasePage):
                 return False
 
             result = self.check_url_contains(expected_route, partial=False)
-            sleep(1)
+            pause(1)
             self.click(PatientGroupsPageLocators.BREADCRUMBS_BACK_BUTTON)
             return result
         except Exception as e:
@@ -193,7 +192,7 @@ class PatientGroupsPage(BasePage):
         """Verify that navigation to the Archived Patient Groups page occurred."""
         try:
             result = self.check_url_contains(Routes.ARCHIVED_PATIENT_GROUPS, partial=False)
-            sleep(1)
+            pause(1)
             self.click(PatientGroupsPageLocators.BREADCRUMBS_BACK_BUTTON)
             return result
         except Exception as e:
@@ -227,7 +226,7 @@ class PatientGroupsPage(BasePage):
         try:
             count = int(count)
             self.is_element_visible(PatientGroupsPageLocators.SELECT_PATIENTS_INPUT, timeout=10)
-            sleep(1)
+            pause(1)
             self.wait_for_dom_stability()
             self.send_keys(PatientGroupsPageLocators.SELECT_PATIENTS_INPUT, count)
             self.is_element_visible(PatientGroupsPageLocators.PATIENTS_SELECTED_NOTIFICATION)
@@ -241,7 +240,7 @@ class PatientGroupsPage(BasePage):
         emr_ids = []
         try:
             self.is_element_visible(PatientGroupsPageLocators.FILTER_APPLIED_NOTIFICATION)
-            sleep(5)
+            pause(5)
             for i in range(1, count + 1):
                 emr_element = self.find_element(PatientGroupsPageLocators.PATIENT_TABLE_ROW_EMR(i))
                 emr_id = emr_element.text.strip()
@@ -264,7 +263,7 @@ class PatientGroupsPage(BasePage):
         patient_names = []
         try:
             self.is_element_visible(PatientGroupsPageLocators.FILTER_APPLIED_NOTIFICATION)
-            sleep(2)
+            pause(2)
             # Patient name is typically in the second column (td[2])
             for i in range(1, count + 1):
                 from selenium.webdriver.common.by import By
@@ -355,7 +354,7 @@ class PatientGroupsPage(BasePage):
         try:
             self.wait_for_dom_stability_full()
             self.perform_search_by_field("Group Name", group_name)
-            sleep(1)
+            pause(1)
             self.wait_for_dom_stability()
             self.click_action_button("Edit")
             self.is_element_visible(PatientGroupsPageLocators.PATIENT_TABLE_ROW_CHECKBOX(1), timeout=10)
@@ -371,7 +370,7 @@ class PatientGroupsPage(BasePage):
             self.wait_for_dom_stability()
             new_group_name = f"{self.get_attribute(PatientGroupsPageLocators.GROUP_NAME_EDIT_FIELD, "value")} - Edited"
             self.send_keys(PatientGroupsPageLocators.GROUP_NAME_EDIT_FIELD, new_group_name)
-            sleep(1)
+            pause(1)
             self.click(PatientGroupsPageLocators.GROUP_NAME_EDIT_SAVE_BUTTON)
             return new_group_name
         except Exception as e:
@@ -480,7 +479,7 @@ class PatientGroupsPage(BasePage):
         try:
             self.is_element_visible(PatientGroupsPageLocators.PATIENT_TABLE_ROW_CHECKBOX(1), timeout=10)
             self.perform_search_by_field("Group Name", updated_group_name)
-            sleep(1)
+            pause(1)
             self.wait_for_dom_stability()
             self.click_action_button("Delete")
             self.is_element_visible(PatientGroupsPageLocators.DELETE_DIALOG)
@@ -515,7 +514,7 @@ class PatientGroupsPage(BasePage):
             rows = self._perform_search_and_get_patient_group_rows(keyword)
             if rows is None:
                 break
-            if self._delete_first_matching_patient_group_by_name(rows, keyword):
+            if self._delete_first_matching_patient_group_by_name(keyword):
                 deleted_count += 1
                 printf(f" (#{deleted_count})")
             else:
@@ -539,21 +538,20 @@ class PatientGroupsPage(BasePage):
             printf(f"Failed to perform search and get rows for '{keyword}': {e}")
             return None
 
-    def _delete_first_matching_patient_group_by_name(self, rows, keyword):
-        """Delete the first patient group in the rows that contains the keyword in its name."""
-        try:
-            for row in rows:
-                name_cell = row.find_element(By.XPATH, ".//td[1]")
-                name = name_cell.text.strip()
-                if keyword in name:
-                    delete_button = row.find_element(By.XPATH, ".//td[4]//button[contains(@id,'delete')]")
-                    delete_button.click()
-                    sleep(1)
-                    self.click(PatientGroupsPageLocators.DELETE_DIALOG_DELETE_BUTTON)
-                    printf(f"Successfully deleted user group '{name}'")
-                    self.is_element_visible(PatientGroupsPageLocators.GROUP_DELETED_NOTIFICATION)
-                    return True
-            return False  # No matching group found in current rows
+    def _delete_first_matching_patient_group_by_name(self, keyword):
+        """Delete the first patient group in the table that contains the keyword in its name."""
+        try:
+            row, name = self.find_table_row(PatientGroupsPageLocators.PATIENT_GROUPS_TABLE_ROWS, 0,
+                                            lambda group_name: keyword in group_name)
+            if row is None:
+                return False  # No matching group found in current rows
+            delete_button = row.find_element(By.XPATH, ".//td[4]//button[contains(@id,'delete')]")
+            delete_button.click()
+            pause(1)
+            self.click(PatientGroupsPageLocators.DELETE_DIALOG_DELETE_BUTTON)
+            printf(f"Successfully deleted user group '{name}'")
+            self.is_element_visible(PatientGroupsPageLocators.GROUP_DELETED_NOTIFICATION)
+            return True
         except Exception as e:
             printf(f"Failed to delete first matching patient group: {e}")
             return False
@@ -589,7 +587,7 @@ class PatientGroupsPage(BasePage):
                 self.refresh_page()
             self.wait_for_loader()
             self.wait_for_dom_stability()
-            sleep(1)
+            pause(1)
             self.click(PatientGroupsPageLocators.DUPLICATE_BUTTON)
             self.wait_for_dom_stability()
             return True
@@ -626,11 +624,11 @@ class PatientGroupsPage(BasePage):
         try:
             self.wait_for_loader()
             self.is_clickable(PatientGroupsPageLocators.CREATE_GROUP_BUTTON)
-            sleep(3)
+            pause(3)
             default_name = self.get_attribute(PatientGroupsPageLocators.DUPLICATE_NEW_GROUP_NAME_INPUT, "value")
             new_name = f"Automation {default_name}"
             self.send_keys(PatientGroupsPageLocators.DUPLICATE_NEW_GROUP_NAME_INPUT, new_name)
-            sleep(1)
+            pause(1)
             return new_name
         except Exception as e:
             printf(f"Failed to get default duplicate group name: {e}")
@@ -640,7 +638,7 @@ class PatientGroupsPage(BasePage):
         """Click the Create Group button on the duplicate page."""
         try:
             self.is_element_visible(PatientGroupsPageLocators.PATIENT_TABLE_ROW_CHECKBOX(1), timeout=10)
-            sleep(1)
+            pause(1)
             self.click(PatientGroupsPageLocators.CREATE_GROUP_BUTTON)
             printf("create group button on duplicate page clicked successfully")
             return True
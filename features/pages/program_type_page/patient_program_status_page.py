@@ -1,4 +1,3 @@
-from time import sleep
 
 from faker import Faker
 from selenium.common import NoSuchElementException
@@ -8,6 +7,7 @@ from features.commons.locators import PatientProgramStatusPageLocators
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, verify_search_results_in_table, row_count_check
 
 
@@ -25,7 +25,7 @@ class PatientProgramStatusPage(BasePage):
         try:
             printf(f"Performing search for field '{field}' with value '{value}'")
             self.send_keys(PatientProgramStatusPageLocators.PATIENT_PROGRAM_STATUS_SEARCH_INPUT, value)
-            sleep(1)
+            pause(1)
             return True
         except NoSuchElementException as e:
             printf(f"Error during search operation: {e}")
@@ -61,7 +61,7 @@ class PatientProgramStatusPage(BasePage):
     def verify_patient_program_status_operation_history_dialog(self):
         try:
             self.is_element_visible(PatientProgramStatusPageLocators.PATIENT_PROGRAM_STATUS_OPERATION_HISTORY_DIALOG, timeout=5)
-            sleep(1)
+            pause(1)
             self.click(PatientProgramStatusPageLocators.PATIENT_PROGRAM_STATUS_OPERATION_HISTORY_DIALOG_CLOSE_BUTTON)
             self.wait_for_dom_stability()
             return True
@@ -244,7 +244,7 @@ class PatientProgramStatusPage(BasePage):
         # Clear any open modal if present
         if self.is_element_visible(PatientProgramStatusPageLocators.PATIENT_PROGRAM_STATUS_DELETE_CONFIRMATION_DIALOG, timeout=2):
             self.click(PatientProgramStatusPageLocators.PATIENT_PROGRAM_STATUS_DELETE_CONFIRMATION_DIALOG_CANCEL_BUTTON)
-            sleep(1)
+            pause(1)
 
         # Perform search by status name field with the substring
         self.perform_patient_program_status_search_by_field("Status Name", substring)
@@ -283,10 +283,10 @@ class PatientProgramStatusPage(BasePage):
                     # Find delete button in the last column
                     delete_button = row.find_element(By.XPATH, ".//td[last()]//button[contains(@id,'delete')]")
                     delete_button.click()
-                    sleep(1)
+                    pause(1)
                     self.click(PatientProgramStatusPageLocators.PATIENT_PROGRAM_STATUS_DELETE_CONFIRM_BUTTON)
                     printf(f"Successfully deleted patient program status '{status_name}'")
-                    sleep(2)
+                    pause(2)
                     return True
             return False
         except Exception as e:
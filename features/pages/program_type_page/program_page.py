@@ -1,5 +1,4 @@
 import random
-from time import sleep
 
 from faker.proxy import Faker
 from selenium.common import NoSuchElementException
@@ -9,6 +8,7 @@ from features.commons.locators import ProgramPageLocators, PatientProgramStatusP
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, verify_search_results_in_table, row_count_check
 
 
@@ -38,7 +38,7 @@ class ProgramPage(BasePage):
             self.wait_for_loader()
             if not tab_name == 'Program':
                 self.clear_field(PatientProgramStatusPageLocators.PATIENT_PROGRAM_STATUS_SEARCH_INPUT)
-                sleep(1)
+                pause(1)
         except NoSuchElementException:
             printf(f"Tab with name '{tab_name}' not found on Users Page.")
             raise
@@ -52,15 +52,15 @@ class ProgramPage(BasePage):
             printf(f"Performing search for field '{field}' with value '{value}'")
             # Click on the search type dropdown
             self.click(ProgramPageLocators.PROGRAM_SEARCH_DROPDOWN)
-            sleep(1)
+            pause(1)
             # Select the desired search type option
             option_locator = ProgramPageLocators.DROPDOWN_OPTION(field)
             self.click(option_locator)
-            sleep(1)
+            pause(1)
             # Enter the search value
             if field in ['Update Date', 'Last Active', 'Created Date', 'Updated Date']:
                 self.click(ProgramPageLocators.PROGRAM_SEARCH_DATE_PICKER_INPUT)
-                sleep(1)
+                pause(1)
                 self.select_calender_date(value)
             elif field == 'Applicable Statuses':
                 status_part = value.split(",")[-1].strip()
@@ -68,7 +68,7 @@ class ProgramPage(BasePage):
                 self.send_keys(ProgramPageLocators.PROGRAM_SEARCH_INPUT, one_word)
             else:
                 self.send_keys(ProgramPageLocators.PROGRAM_SEARCH_INPUT, value)
-            sleep(1)
+            pause(1)
             # Click the search button
             self.click(ProgramPageLocators.PROGRAM_SEARCH_BUTTON)
 
@@ -316,7 +316,7 @@ class ProgramPage(BasePage):
         # Clear any open modal if present
         if self.is_element_visible(ProgramPageLocators.PROGRAM_DELETE_CONFIRMATION_DIALOG, timeout=2):
             self.click(ProgramPageLocators.PROGRAM_DELETE_CONFIRMATION_DIALOG_CANCEL_BUTTON)
-            sleep(1)
+            pause(1)
 
         # Perform search by program name field with the substring
         self.perform_program_search_by_field("Program Name", substring)
@@ -355,10 +355,10 @@ class ProgramPage(BasePage):
                     # Find delete button in the last column
                     delete_button = row.find_element(By.XPATH, ".//td[last()]//button[contains(@id,'delete')]")
                     delete_button.click()
-                    sleep(1)
+                    pause(1)
                     self.click(ProgramPageLocators.PROGRAM_DELETE_CONFIRM_BUTTON)
                     printf(f"Successfully deleted program '{program_name}'")
-                    sleep(2)
+                    pause(2)
                     return True
             return False
         except Exception as e:
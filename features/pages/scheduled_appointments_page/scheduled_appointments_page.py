@@ -1,4 +1,3 @@
-from time import sleep
 
 from selenium.common import NoSuchElementException
 
@@ -6,6 +5,7 @@ from features.commons.locators import ScheduledAppointmentsPageLocators, Dashboa
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, verify_search_results_in_table, row_count_check, to_ddmmyyyy
 
 
@@ -27,7 +27,7 @@ class ScheduledAppointmentsPage(BasePage):
         try:
             if self.is_element_visible(DashboardPageLocators.NOTIFICATION_POPUP, timeout=2):
                 self.click(DashboardPageLocators.NOTIFICATION_CLOSE_BUTTON)
-                sleep(1)
+                pause(1)
 
             if tab_name == "Virtual":
                 tab_locator = ScheduledAppointmentsPageLocators.VIRTUAL_TAB
@@ -97,14 +97,14 @@ class ScheduledAppointmentsPage(BasePage):
                 return False
             if field == "Appointment Date":
                 self.click(locator)
-                sleep(1)
+                pause(1)
                 date_str = to_ddmmyyyy(value)
                 self.select_calender_date(date_str)
-                sleep(1)
+                pause(1)
             else:
                 self.send_keys(locator, value)
 
-            sleep(1)
+            pause(1)
 
             # Click search button
             self.click(ScheduledAppointmentsPageLocators.SEARCH_BUTTON)
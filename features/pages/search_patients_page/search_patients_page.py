@@ -1,12 +1,12 @@
 from datetime import datetime
-from time import sleep
 
 from selenium.common.exceptions import NoSuchElementException
 
 from features.commons.locators import SearchPatientsPageLocators
-from features.commons.routes import Routes
+from features.commons.routes import ApiRoutes, Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, verify_search_results_in_table, row_count_check
 
 
@@ -42,19 +42,19 @@ class SearchPatientsPage(BasePage):
 
             self.click(SearchPatientsPageLocators.SEARCH_TYPE_DROPDOWN)
             self.click(SearchPatientsPageLocators.SEARCH_TYPE_OPTION(field))
-            sleep(1)
+            pause(1)
             if field.lower() == 'dob':
                 return self.perform_dob_search(value)
             elif field.lower() == 'clinic name':
                 self.select_by_visible_text(SearchPatientsPageLocators.CLINIC_DROPDOWN, value)
-                sleep(0.3)
-                self.click(SearchPatientsPageLocators.SEARCH_BUTTON)
-                self.wait_for_loader(timeout=30)
+                pause(0.3)
+                self.wait_for_api_response(lambda: self.click(SearchPatientsPageLocators.SEARCH_BUTTON),
+                                           ApiRoutes.PATIENT_SEARCH, timeout=30)
                 return True
             else:
                 self.send_keys(SearchPatientsPageLocators.SEARCH_INPUT, value)
-                self.click(SearchPatientsPageLocators.SEARCH_BUTTON)
-                self.wait_for_loader(timeout=30)
+                self.wait_for_api_response(lambda: self.click(SearchPatientsPageLocators.SEARCH_BUTTON),
+                                           ApiRoutes.PATIENT_SEARCH, timeout=30)
                 return True
         except NoSuchElementException as e:
             printf(f"Error performing patient search for field '{field}': {e}")
@@ -77,16 +77,16 @@ class SearchPatientsPage(BasePage):
             day_formatted = day.zfill(2)
 
             self.select_by_visible_text(SearchPatientsPageLocators.MONTH_SELECT_DROPDOWN, month_full_name)
-            sleep(0.5)
+            pause(0.5)
 
             self.select_by_visible_text(SearchPatientsPageLocators.DAY_SELECT_DROPDOWN, day_formatted)
-            sleep(0.5)
+            pause(0.5)
 
             self.select_by_visible_text(SearchPatientsPageLocators.YEAR_SELECT_DROPDOWN, year)
-            sleep(0.5)
+            pause(0.5)
 
-            self.click(SearchPatientsPageLocators.SEARCH_BUTTON)
-            self.wait_for_loader(timeout=30)
+            self.wait_for_api_response(lambda: self.click(SearchPatientsPageLocators.SEARCH_BUTTON),
+                                       ApiRoutes.PATIENT_SEARCH, timeout=30)
             printf(f"Performed DOB search: Year={year}, Month={month_full_name}, Day={day_formatted}")
             return True
 
@@ -108,8 +108,8 @@ class SearchPatientsPage(BasePage):
             printf(f"Searching for term: '{term}'")
             self.wait_for_loader()
             self.send_keys(SearchPatientsPageLocators.SEARCH_INPUT, term)
-            self.click(SearchPatientsPageLocators.SEARCH_BUTTON)
-            self.wait_for_loader(timeout=30)
+            self.wait_for_api_response(lambda: self.click(SearchPatientsPageLocators.SEARCH_BUTTON),
+                                       ApiRoutes.PATIENT_SEARCH, timeout=30)
             return True
         except NoSuchElementException as e:
             printf(f"Error searching for term '{term}': {e}")
@@ -120,8 +120,8 @@ class SearchPatientsPage(BasePage):
 
     def click_reset_button(self):
         """Click the Reset button and wait for the results to reload."""
-        self.click(SearchPatientsPageLocators.RESET_BUTTON)
-        self.wait_for_loader()
+        self.wait_for_api_response(lambda: self.click(SearchPatientsPageLocators.RESET_BUTTON),
+                                   ApiRoutes.PATIENT_SEARCH)
 
     def is_search_cleared_and_results_displayed(self) -> bool:
         try:
@@ -140,8 +140,9 @@ class SearchPatientsPage(BasePage):
             return False
 
     def select_rows_per_page(self, rows: str):
-        self.select_by_visible_text(SearchPatientsPageLocators.PAGE_LIMIT_DROPDOWN, rows)
-        self.wait_for_loader()
+        self.wait_for_api_response(
+            lambda: self.select_by_visible_text(SearchPatientsPageLocators.PAGE_LIMIT_DROPDOWN, rows),
+            ApiRoutes.PATIENT_SEARCH)
 
     def verify_rows_per_page(self, rows: str) -> bool:
         try:
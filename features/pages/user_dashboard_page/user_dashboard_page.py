@@ -1,12 +1,13 @@
 import random
 from datetime import datetime, timedelta
-from time import sleep
 
 from selenium.webdriver.common.by import By
 
 from features.commons.locators import UserDashboardPageLocators
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.page_perf import PagePerf
+from utils.ui.sleep_tracker import pause
 
 
 class UserDashboardPage(BasePage):
@@ -24,7 +25,10 @@ class UserDashboardPage(BasePage):
         try:
             dynamic_locator = UserDashboardPageLocators.HAMBURGER_MENU_OPTION(option_text=option_name)
             self.is_element_visible(dynamic_locator, timeout=2)
-            return self.click(dynamic_locator)
+            PagePerf.start(self.driver)
+            clicked = self.click(dynamic_locator)
+            PagePerf.capture(self, f"menu: {option_name}")
+            return clicked
         except Exception as e:
             printf(f"Error clicking dynamic menu option '{option_name}': {e}")
             return False
@@ -55,7 +59,7 @@ class UserDashboardPage(BasePage):
             self.click(UserDashboardPageLocators.ENROLLMENT_STATUS_DROPDOWN)
             self.wait_for_dom_stability()
             self.send_keys(UserDashboardPageLocators.ENROLLMENT_STATUS_SEARCH_INPUT, enrollment_status)
-            sleep(0.3)
+            pause(0.3)
             self.click(UserDashboardPageLocators.ENROLLMENT_STATUS_OPTION(enrollment_status))
             self.wait_for_dom_stability()
             if self.is_element_visible(UserDashboardPageLocators.ENROLLMENT_STATUS_OPTION(enrollment_status)):
@@ -137,7 +141,7 @@ class UserDashboardPage(BasePage):
                 if month_offset < 2:
                     self.click(UserDashboardPageLocators.APPOINTMENT_NEXT_MONTH_BUTTON)
                     self.wait_for_loader()
-                    sleep(0.2)
+                    pause(0.2)
 
             if not selected:
                 raise Exception("No available appointment date found in current or next two months.")
@@ -194,7 +198,7 @@ class UserDashboardPage(BasePage):
             self.click(UserDashboardPageLocators.END_PERIOD_INPUT)
             self.click(UserDashboardPageLocators.DROP_DOWN_OPTION(end_period))
 
-            sleep(1)
+            pause(1)
             self.click(UserDashboardPageLocators.APPLY_SLOT_BUTTON)
 
             printf("Available appointment date and 15-minute slot selected.")
@@ -1,4 +1,3 @@
-from time import sleep
 
 from faker.proxy import Faker
 from selenium.webdriver.common.by import By
@@ -7,6 +6,7 @@ from features.commons.locators import UserGroupPageLocators
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, row_count_check
 
 
@@ -141,7 +141,7 @@ class UserGroupPage(BasePage):
                 self.clear_field(UserGroupPageLocators.ADD_USERS_SEARCH_INPUT)
                 self.send_keys(UserGroupPageLocators.ADD_USERS_SEARCH_INPUT, email)
                 self.wait_for_dom_stability()
-                sleep(1)
+                pause(1)
                 
                 # Find and click the checkbox for this user
                 user_checkboxes = self.find_elements(UserGroupPageLocators.ADD_USER_SELECTION_CHECKBOX)
@@ -293,10 +293,10 @@ class UserGroupPage(BasePage):
                 if keyword.lower() in name.lower():
                     delete_button = row.find_element(By.XPATH, ".//td[5]//button[contains(@id,'delete')]")
                     delete_button.click()
-                    sleep(1)
+                    pause(1)
                     self.click(UserGroupPageLocators.DELETE_CONFIRM_BUTTON)
                     printf(f"Successfully deleted user group '{name}'")
-                    sleep(2)
+                    pause(2)
                     return True
             return False
         except Exception as e:
@@ -312,13 +312,12 @@ class UserGroupPage(BasePage):
                 self.wait_for_dom_stability()
 
             self.click(UserGroupPageLocators.SEARCH_TYPE_DROPDOWN)
-            from time import sleep
-            sleep(1)
+            pause(1)
             option_locator = UserGroupPageLocators.SEARCH_TYPE_OPTION(field)
             self.click(option_locator)
-            sleep(1)
+            pause(1)
             self.send_keys(UserGroupPageLocators.SEARCH_INPUT, value)
-            sleep(1)
+            pause(1)
             self.click(UserGroupPageLocators.SEARCH_BUTTON)
             return True
         except Exception as e:
@@ -1,4 +1,3 @@
-from time import sleep
 
 from faker.proxy import Faker
 from selenium.common import NoSuchElementException
@@ -8,6 +7,7 @@ from features.commons.locators import UsersPageLocators, UserGroupPageLocators,
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, verify_search_results_in_table, row_count_check, get_current_date
 
 
@@ -21,7 +21,7 @@ class UsersPage(BasePage):
         """Click on the specified tab in the users page."""
         if self.is_element_visible(DashboardPageLocators.NOTIFICATION_POPUP, timeout=2):
             self.click(DashboardPageLocators.NOTIFICATION_CLOSE_BUTTON)
-            sleep(1)
+            pause(1)
 
         if tab_name == 'User':
             tab_locator = UsersPageLocators.USER_TAB
@@ -57,19 +57,19 @@ class UsersPage(BasePage):
                 self.wait_for_dom_stability_full()
             # Click on the search type dropdown
             self.click(UsersPageLocators.SEARCH_TYPE_DROPDOWN)
-            sleep(1)
+            pause(1)
             # Select the desired search type option
             option_locator = UsersPageLocators.SEARCH_TYPE_OPTION(field)
             self.click(option_locator)
-            sleep(1)
+            pause(1)
             # Enter the search value
             if field in ['Update Date', 'Last Active', 'Created Date', 'Updated Date']:
                 self.click(UsersPageLocators.SEARCH_DATEPICKER_INPUT)
-                sleep(1)
+                pause(1)
                 self.select_calender_date(value)
             else:
                 self.send_keys(UsersPageLocators.SEARCH_INPUT, value)
-            sleep(1)
+            pause(1)
             # Click the search button
             self.click(UsersPageLocators.SEARCH_BUTTON)
             self.wait_for_loader()
@@ -86,7 +86,7 @@ class UsersPage(BasePage):
         else:
             table_locator = UserGroupPageLocators.USER_GROUPS_TABLE_ROWS
 
-        sleep(3)
+        pause(3)
         return verify_search_results_in_table(
             self,
             search_value,
@@ -243,15 +243,15 @@ class UsersPage(BasePage):
             end_date = get_current_date(date_format="%d-%m-%Y", days_offset=days_offset)
             self.scroll_to_visible_element(UsersPageLocators.FROM_DATE_BUTTON,
                                            container_locator=UsersPageLocators.MAIN_DIV)
-            sleep(0.5)
+            pause(0.5)
             self.click(UsersPageLocators.FROM_DATE_BUTTON)
-            sleep(1)
+            pause(1)
             self.select_calender_date(start_date, "%d-%m-%Y")
-            sleep(1)
+            pause(1)
             self.click(UsersPageLocators.END_DATE_BUTTON)
-            sleep(1)
+            pause(1)
             self.select_calender_date(end_date, "%d-%m-%Y")
-            sleep(1)
+            pause(1)
             self.click(UsersPageLocators.END_DATE_BUTTON)
             printf(f"Selected dates: From {start_date} To {end_date}.")
         except NoSuchElementException as e:
@@ -262,16 +262,16 @@ class UsersPage(BasePage):
         """Select from and end times for the slots"""
         try:
             self.click(UsersPageLocators.SCHEDULE_DAY_CHECKBOX)
-            sleep(1)
+            pause(1)
             self.select_by_visible_text(UsersPageLocators.START_TIME_HOUR_SELECT, "12")
             self.select_by_visible_text(UsersPageLocators.START_TIME_MINUTE_SELECT, "00")
             self.select_by_visible_text(UsersPageLocators.START_TIME_AM_PM_SELECT, "AM")
             self.select_by_visible_text(UsersPageLocators.END_TIME_HOUR_SELECT, "11")
             self.select_by_visible_text(UsersPageLocators.END_TIME_MINUTE_SELECT, "45")
             self.select_by_visible_text(UsersPageLocators.END_TIME_AM_PM_SELECT, "PM")
-            sleep(1)
+            pause(1)
             self.click(UsersPageLocators.COPY_TO_ALL_DAYS_BUTTON)
-            sleep(1)
+            pause(1)
             printf("Selected times and copied to all days.")
         except NoSuchElementException as e:
             printf(f"Error selecting times: {e}")
@@ -426,7 +426,7 @@ class UsersPage(BasePage):
             rows = self._perform_search_and_get_user_rows(keyword)
             if rows is None:
                 break
-            if self._delete_first_matching_user_by_email(rows, keyword):
+            if self._delete_first_matching_user_by_email(keyword):
                 deleted_count += 1
                 printf(f" (#{deleted_count})")
             else:
@@ -442,7 +442,7 @@ class UsersPage(BasePage):
 
         if self.is_element_visible(UsersPageLocators.DELETE_DIALOG, timeout=2):
             self.click(UsersPageLocators.DELETE_DIALOG_CANCEL_BUTTON)
-            sleep(1)
+            pause(1)
 
         # Perform search by email field with the keyword (assuming search supports partial match)
         self.perform_search_by_field("Email Address", keyword)
@@ -471,23 +471,22 @@ class UsersPage(BasePage):
 
         return rows
 
-    def _delete_first_matching_user_by_email(self, rows, keyword):
-        """Delete the first user in rows whose email contains the keyword. Return True if deleted."""
+    def _delete_first_matching_user_by_email(self, keyword):
+        """Delete the first user in the table whose email contains the keyword. Return True if deleted."""
         try:
-            for row in rows:
-                # Assume email is in column 3 (td[3])
-                email_cell = row.find_element(By.XPATH, ".//td[2]")
-                email = email_cell.text.strip()
-                if keyword.lower() in email.lower():
-                    # Find delete button in column 6
-                    delete_button = row.find_element(By.XPATH, ".//td[6]//button[contains(@id,'delete')]")
-                    delete_button.click()
-                    sleep(1)
-                    self.click(UsersPageLocators.DELETE_CONFIRM_BUTTON)
-                    printf(f"Successfully deleted user '{email}'")
-                    sleep(2)
-                    return True
-            return False
+            # Email is in column 2 (td[2]); emails and rows are read in one call
+            row, email = self.find_table_row(UsersPageLocators.USERS_TABLE_ROWS, 1,
+                                             lambda user_email: keyword.lower() in user_email.lower())
+            if row is None:
+                return False
+            # Find delete button in column 6
+            delete_button = row.find_element(By.XPATH, ".//td[6]//button[contains(@id,'delete')]")
+            delete_button.click()
+            pause(1)
+            self.click(UsersPageLocators.DELETE_CONFIRM_BUTTON)
+            printf(f"Successfully deleted user '{email}'")
+            pause(2)
+            return True
         except Exception as e:
             printf(f"Error deleting user: {e}")
             return False
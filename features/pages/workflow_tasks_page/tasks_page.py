@@ -1,4 +1,3 @@
-from time import sleep
 
 from faker.proxy import Faker
 from selenium.common import NoSuchElementException
@@ -7,6 +6,7 @@ from features.commons.locators import TasksPageLocators
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, verify_search_results_in_table, row_count_check
 
 
@@ -33,7 +33,7 @@ class TasksPage(BasePage):
             printf(f"Performing tasks search for field '{field}' with value '{value}'")
             self.wait_for_loader()
             self.send_keys(TasksPageLocators.TASKS_SEARCH_INPUT, value)
-            sleep(1)
+            pause(1)
             self.click(TasksPageLocators.TASKS_SEARCH_BUTTON)
             self.wait_for_loader(timeout=30)
             return True
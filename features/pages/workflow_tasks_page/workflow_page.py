@@ -1,4 +1,3 @@
-from time import sleep
 
 from faker.proxy import Faker
 from selenium.common import NoSuchElementException
@@ -7,6 +6,7 @@ from features.commons.locators import WorkflowPageLocators, DashboardPageLocator
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, verify_search_results_in_table, row_count_check
 
 
@@ -20,7 +20,7 @@ class WorkflowPage(BasePage):
         try:
             if self.is_element_visible(DashboardPageLocators.NOTIFICATION_POPUP, timeout=2):
                 self.click(DashboardPageLocators.NOTIFICATION_CLOSE_BUTTON)
-                sleep(1)
+                pause(1)
 
             if self.is_element_visible(WorkflowPageLocators.WORKFLOW_SEARCH_INPUT,
                                        timeout=2) and not self.get_attribute(WorkflowPageLocators.WORKFLOW_SEARCH_INPUT,
@@ -141,12 +141,12 @@ class WorkflowPage(BasePage):
             option = self.find_element(WorkflowPageLocators.DROPDOWN_FIRST_OPTION)
             option_text = option.text.strip()
             option.click()
-            sleep(1)
+            pause(1)
             self.wait_for_dom_stability()
             if self.is_element_visible(WorkflowPageLocators.DROPDOWN_FIRST_OPTION):
                 printf("First option still visible after selection, attempting to click dropdown again to close it")
                 self.click(dropdown_locator)
-                sleep(1)
+                pause(1)
             return option_text
         except NoSuchElementException as e:
             printf(f"Failed selecting first option for dropdown {dropdown_locator}: {e}")
@@ -164,7 +164,7 @@ class WorkflowPage(BasePage):
         """
         try:
             self.click(dropdown_locator)
-            sleep(1)
+            pause(1)
             self.wait_for_dom_stability()
             if option2:
                 option_locator = WorkflowPageLocators.APPLICABLE_PROGRAM_OPTION(option_text)
@@ -172,12 +172,12 @@ class WorkflowPage(BasePage):
                 option_locator = WorkflowPageLocators.DROPDOWN_OPTION(option_text)
 
             self.click(option_locator)
-            sleep(1)
+            pause(1)
             self.wait_for_dom_stability()
             if self.is_element_visible(WorkflowPageLocators.DROPDOWN_FIRST_OPTION):
                 printf("First option still visible after selection, attempting to click dropdown again to close it")
                 self.click(dropdown_locator)
-                sleep(1)
+                pause(1)
             printf(f"Selected dropdown option: {option_text}")
             return option_text
         except NoSuchElementException as e:
@@ -242,11 +242,11 @@ class WorkflowPage(BasePage):
             # Select user group
             if user_group_name:
                 self.click(WorkflowPageLocators.USER_GROUP_DROPDOWN)
-                sleep(0.3)
+                pause(0.3)
                 self.send_keys(WorkflowPageLocators.USER_GROUP_OPTION_SEARCH_INPUT, user_group_name)
-                sleep(0.5)
+                pause(0.5)
                 self.click(WorkflowPageLocators.APPLICABLE_PROGRAM_OPTION(user_group_name))
-                sleep(0.3)
+                pause(0.3)
                 self.click(WorkflowPageLocators.USER_GROUP_DROPDOWN)
                 user_group = user_group_name
             else:
@@ -276,7 +276,7 @@ class WorkflowPage(BasePage):
                 if self.is_element_visible(WorkflowPageLocators.TRIGGER_ROW_DELETE_BUTTON, timeout=1):
                     self.click(WorkflowPageLocators.TRIGGER_ROW_DELETE_BUTTON)
                     self.wait_for_dom_stability()
-                    sleep(0.5)
+                    pause(0.5)
                 else:
                     break
             printf("Removed all trigger rows")
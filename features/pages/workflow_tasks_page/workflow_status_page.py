@@ -1,4 +1,3 @@
-from time import sleep
 
 from faker.proxy import Faker
 from selenium.common import NoSuchElementException
@@ -7,6 +6,7 @@ from features.commons.locators import WorkflowStatusPageLocators
 from features.commons.routes import Routes
 from features.pages.base_page import BasePage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.utils import extract_table_row_as_dict, verify_search_results_in_table, row_count_check
 
 
@@ -36,7 +36,7 @@ class WorkflowStatusPage(BasePage):
                 self.wait_for_loader()
 
             self.send_keys(WorkflowStatusPageLocators.WORKFLOW_STATUS_SEARCH_INPUT, value)
-            sleep(1)
+            pause(1)
             self.click(WorkflowStatusPageLocators.WORKFLOW_STATUS_SEARCH_BUTTON)
             self.wait_for_loader()
             return True
@@ -1,9 +1,9 @@
-from time import sleep
 from behave import given, when, then
 
 from features.commons.routes import Routes
 from features.pages.login_page.login_page import LoginPage
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.ui.config_reader import read_configuration
 
 @given('I navigate to the Login page')
@@ -55,7 +55,7 @@ def step_impl(context):
 @when(u'I click on logout from dashboard header')
 def step_impl(context):
     context.login_page.click_sign_out()
-    sleep(5)
+    pause(5)
     printf("clicked logout")
 
 
@@ -1,7 +1,6 @@
 from datetime import datetime
 
 from behave import given, when, then
-from time import sleep
 
 from faker import Faker
 
@@ -17,20 +16,37 @@ from features.pages.patient_details_page.patient_details_page import PatientDeta
 from features.pages.user_dashboard_page.user_dashboard_page import UserDashboardPage
 from features.commons.routes import Routes
 from utils.logger import printf
+from utils.ui.sleep_tracker import pause
 from utils.ui.login_utility import LoginHelper
 from utils.utils import get_current_date
 
 
+def _login_with(email, password):
+    """Re-login callable for session recovery of users created by this feature."""
+    def login(driver):
+        login_page = LoginPage(driver)
+        login_page.navigate_to_login()
+        login_page.login(email, password)
+        return True
+    return login
+
+
 # ===== USER CREATION STEPS =====
 @given(u'I login as "{user_role}"')
 def step_impl(context, user_role):
     """Login as a specific user role (e.g., enroller_admin)."""
     # Get or create driver for this user role
     driver = LoginHelper.get_driver_for_role(context, user_role)
-    login_page = LoginPage(driver)
-    login_page.navigate_to_login()
-    login_page.login_as_role(user_role)
-    login_page.is_login_successful()
+    provisioned_roles = getattr(context, "provisioned_roles", set())
+    if user_role in provisioned_roles:
+        # Already logged in concurrently before the first step (see @parallel_role tags)
+        provisioned_roles.discard(user_role)
+    else:
+        login_page = LoginPage(driver)
+        login_page.navigate_to_login()
+        login_page.login_as_role(user_role)
+        login_page.is_login_successful()
+    LoginHelper.mark_logged_in(context, user_role)
 
     context.driver = driver
     printf(f"Logged in as {user_role}")
@@ -296,7 +312,7 @@ def step_impl(context, months):
 def step_impl(context):
     """Submit the activity creation form."""
     context.activities_page.submit_create_activity()
-    sleep(2)
+    pause(2)
     printf("Submitted activity form")
 
 
@@ -325,7 +341,8 @@ def step_impl(context, role, email_variable, password, user_role):
     login_page = LoginPage(driver)
     login_page.navigate_to_login()
     login_page.login(email, password)
-    sleep(2)
+    LoginHelper.mark_logged_in(context, f"{user_role}_parallel", _login_with(email, password))
+    pause(2)
     
     printf(f"Logged in as {role} user ({user_role}): {email}")
 
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Merge the per-worker JSON-lines logs written by utils.logger into one timeline.
+
+Each BehaveX process writes logs/workers/<start time>-<pid>.jsonl in its own order; the files are merged
+by timestamp without loading them into memory.
+
+Usage:
+    python -m utils.log_merge [files...] [--dir logs/workers] [--output logs/merged.log] [--json]
+                              [--scenario ID] [--level INFO]
+"""
+
+import argparse
+import glob
+import heapq
+import json
+import os
+import sys
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+
+def read_records(path):
+    """Records of one worker file in the order written; lines that are not valid JSON are skipped."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and "ts" in record:
+                yield record
+
+
+def merge(paths):
+    """All records of `paths` in timestamp order (each file is already ordered)."""
+    return heapq.merge(*(read_records(path) for path in paths), key=lambda record: record["ts"])
+
+
+def format_record(record):
+    step = f" [{record['step_id']}]" if record.get("step_id") else \
+        f" [{record['scenario_id']}]" if record.get("scenario_id") else ""
+    return f"{record.get('time', '')} {record.get('pid', ''):>7} {record.get('level', ''):<7}{step} " \
+           f"{record.get('message', '')}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.log_merge", description=__doc__.split("\n\n")[0])
+    parser.add_argument("files", nargs="*", help="worker log files (default: every *.jsonl in --dir)")
+    parser.add_argument("--dir", default="logs/workers", help="directory of the worker logs")
+    parser.add_argument("--output", help="write to this file instead of stdout")
+    parser.add_argument("--json", action="store_true", help="write JSON lines instead of text")
+    parser.add_argument("--scenario", help="only records of this scenario id")
+    parser.add_argument("--level", choices=LEVELS, help="only records of this level and above")
+    args = parser.parse_args(argv)
+
+    paths = args.files or sorted(glob.glob(os.path.join(args.dir, "*.jsonl")))
+    if not paths:
+        print(f"No worker logs found in {args.dir}", file=sys.stderr)
+        return 1
+
+    min_level = LEVELS.index(args.level) if args.level else 0
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    count = 0
+    try:
+        for record in merge(paths):
+            if args.scenario and record.get("scenario_id") != args.scenario:
+                continue
+            level = record.get("level")
+            if min_level and (level not in LEVELS or LEVELS.index(level) < min_level):
+                continue
+            out.write((json.dumps(record, ensure_ascii=False) if args.json else format_record(record)) + "\n")
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if args.output:
+        print(f"Merged {count} records from {len(paths)} worker logs into {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
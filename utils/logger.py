@@ -1,7 +1,15 @@
+import atexit
+import json
+import queue
 import sys
 import os
+import threading
+import uuid
+from datetime import datetime
+
 from loguru import logger
-from utils.ui.config_reader import get_log_to_file, get_log_file_path
+from utils.ui.config_reader import get_log_to_file, get_log_file_path, get_log_to_console, get_log_level, \
+    get_json_log_config
 
 # Configure loguru to match the emoji format
 logger.remove()  # Remove default handler
@@ -9,25 +17,208 @@ logger.remove()  # Remove default handler
 # Set custom icon for INFO level
 logger.level("INFO", icon="ℹ️")
 
+LOG_LEVEL = get_log_level()
+_LEVEL_NAMES = {"DEBUG": "DEBUG", "INFO": "INFO", "WARN": "WARNING", "WARNING": "WARNING", "ERROR": "ERROR"}
+_LEVEL_NOS = {name: logger.level(name).no for name in set(_LEVEL_NAMES.values())}
+
+
+class _BackgroundSink:
+    """
+    Loguru sink that hands formatted messages to a writer thread, so the calling thread never waits on
+    stderr or disk. (loguru's own enqueue=True pickles every record into a multiprocessing queue, which costs
+    the caller more than the write it saves.) The stream is opened and the thread started on the first
+    message of each process: importing the logger starts no thread (the BehaveX parent forks its workers
+    single-threaded) and a process that logs nothing creates no file.
+    """
+
+    _sinks = []
+
+    def __init__(self, open_stream):
+        self._open_stream = open_stream
+        self._pid = None
+        self._start_lock = threading.Lock()
+        _BackgroundSink._sinks.append(self)
+
+    def _ensure_started(self):
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid != os.getpid():
+                try:
+                    self._stream = self._open_stream()
+                except OSError as e:
+                    self._stream = None
+                    sys.stderr.write(f"Log sink disabled in process {os.getpid()}: {e}\n")
+                else:
+                    self._queue = queue.SimpleQueue()
+                    threading.Thread(target=self._run, name="log-writer", daemon=True).start()
+                self._pid = os.getpid()
+
+    def write(self, message):
+        self._ensure_started()
+        if self._stream is not None:
+            self._queue.put(message)
+
+    def _run(self):
+        while True:
+            message = self._queue.get()
+            if isinstance(message, threading.Event):
+                self._stream.flush()
+                message.set()
+                continue
+            try:
+                self._stream.write(message)
+                if self._queue.empty():
+                    self._stream.flush()
+            except (OSError, ValueError):
+                pass
+
+    def drain(self, timeout=5):
+        """Block until everything queued so far is written."""
+        if self._pid != os.getpid() or self._stream is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    @staticmethod
+    def drain_all():
+        for sink in list(_BackgroundSink._sinks):
+            sink.drain()
+
+    @staticmethod
+    def _reset_after_fork():
+        # The parent's writer thread does not exist in the child; it starts its own on its first message
+        for sink in _BackgroundSink._sinks:
+            sink._start_lock = threading.Lock()
+
+
+def _open_file(path):
+    # Line buffered: every message reaches the file in one append, and nothing is left in a buffer that a
+    # forked child could write out a second time
+    return lambda: open(path, "a", buffering=1, encoding="utf-8")
+
+
+atexit.register(_BackgroundSink.drain_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_BackgroundSink._reset_after_fork)
+
+# Every sink is a _BackgroundSink: the calling thread only formats the message and puts it on a queue
+
 # Add console handler with emoji format
-logger.add(
-    sys.stderr,
-    format="{time} - ℹ️ - INFO - {message}",
-    level="INFO",
-    colorize=True
-)
-
-# Add file handler if configured (keeping the config integration)
+if get_log_to_console():
+    logger.add(
+        _BackgroundSink(lambda: sys.stderr),
+        format="{time} - {level.icon} - {level} - {message}",
+        level=LOG_LEVEL,
+        colorize=True
+    )
+
+# Add file handler if configured (keeping the config integration). Lines of the BehaveX workers sharing the
+# file don't interleave since each message is a single append.
 try:
     if get_log_to_file():
 
         log_file_path = get_log_file_path()
         os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
-        logger.add(log_file_path, format="{time} - INFO - {message}", level="INFO")
+        logger.add(_BackgroundSink(_open_file(log_file_path)), format="{time} - {level} - {message}",
+                   level=LOG_LEVEL)
 except ImportError:
     pass
 
-def printf(*args, sep=" "):
-    """Logging function using loguru that accepts multiple arguments like print."""
+
+def _json_line(record):
+    """One JSON object per message: time, level, process and the scenario/step it was logged in."""
+    extra = record["extra"]
+    record["extra"]["_json"] = json.dumps({
+        "ts": record["time"].timestamp(),
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "pid": record["process"].id,
+        "thread": record["thread"].name,
+        "scenario_id": extra.get("scenario_id"),
+        "step_id": extra.get("step_id"),
+        "scenario": extra.get("scenario"),
+        "step": extra.get("step"),
+        "source": f"{record['name']}:{record['function']}:{record['line']}",
+        "message": record["message"],
+    }, ensure_ascii=False, default=str)
+    return "{extra[_json]}\n"
+
+
+# Per-worker JSON-lines file: each BehaveX process writes its own file, utils.log_merge combines them
+JSON_LOG_PATH = None
+_json_config = get_json_log_config()
+if _json_config["enabled"]:
+    def _open_json_log():
+        # Called on the first message of each process, so every process gets its own file
+        global JSON_LOG_PATH
+        os.makedirs(_json_config["dir"], exist_ok=True)
+        JSON_LOG_PATH = os.path.join(_json_config["dir"],
+                                     f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.jsonl")
+        return _open_file(JSON_LOG_PATH)()
+
+    logger.add(_BackgroundSink(_open_json_log), format=_json_line, level=LOG_LEVEL)
+
+
+def is_enabled_for(level):
+    """True if messages of `level` (debug, info, warn) are written; guard expensive log-only work with it."""
+    return _LEVEL_NOS[_LEVEL_NAMES[level.upper()]] >= _LEVEL_NOS[LOG_LEVEL]
+
+
+def printf(*args, sep=" ", level="INFO"):
+    """Logging function using loguru that accepts multiple arguments like print.
+    Arguments of messages below the configured level are not converted to strings."""
+    if not is_enabled_for(level):
+        return
     msg = sep.join(str(a) for a in args)
-    logger.info(msg)
\ No newline at end of file
+    logger.opt(depth=1).log(_LEVEL_NAMES[level.upper()], msg)
+
+
+# Lazy variants: the message is formatted with str.format(*args, **kwargs) only if the level is enabled,
+# e.g. debug("[Row {}] Text: {}", index, row_text). Pass callables with lazy=True to defer computing them too.
+
+def debug(message, *args, lazy=False, **kwargs):
+    logger.opt(depth=1, lazy=lazy).debug(message, *args, **kwargs)
+
+
+def info(message, *args, lazy=False, **kwargs):
+    logger.opt(depth=1, lazy=lazy).info(message, *args, **kwargs)
+
+
+def warn(message, *args, lazy=False, **kwargs):
+    logger.opt(depth=1, lazy=lazy).warning(message, *args, **kwargs)
+
+
+class LogContext:
+    """
+    Correlation ids added to every JSON log line: a scenario id unique across workers and runs, and
+    '<scenario id>.<n>' for the n-th step of the scenario. Set from the behave hooks in features/environment.py.
+    """
+
+    _scenario = {}
+    _step_index = 0
+
+    @staticmethod
+    def start_scenario(scenario):
+        LogContext._scenario = {"scenario_id": uuid.uuid4().hex[:12], "scenario": scenario.name}
+        LogContext._step_index = 0
+        logger.configure(extra=dict(LogContext._scenario, step_id=None, step=None))
+
+    @staticmethod
+    def start_step(step):
+        LogContext._step_index += 1
+        scenario_id = LogContext._scenario.get("scenario_id")
+        logger.configure(extra=dict(LogContext._scenario,
+                                    step_id=f"{scenario_id}.{LogContext._step_index}" if scenario_id else None,
+                                    step=f"{step.keyword} {step.name}"))
+
+    @staticmethod
+    def end_scenario():
+        LogContext._scenario = {}
+        logger.configure(extra={})
+
+    @staticmethod
+    def flush():
+        """Wait until the background sinks have written everything logged so far (end of a worker)."""
+        _BackgroundSink.drain_all()
@@ -1,22 +1,158 @@
+import hashlib
+import io
 import os
-import base64
 import allure
+import allure_commons
 import shutil
 import subprocess
 import platform
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+from uuid import uuid4
+from allure_commons.reporter import AllureReporter
 from allure_commons.types import AttachmentType
 
+try:
+    from PIL import Image
+except ImportError:
+    # Optional: without Pillow failure screenshots are attached as the raw PNG
+    Image = None
+
 from utils.logger import printf
 from utils.utils import get_current_time
-from utils.ui.config_reader import is_allure_enabled
+from utils.ui.config_reader import is_allure_enabled, get_failure_screenshot_config, \
+    get_cumulative_retention_config
+from utils.ui.file_lock import FileLock
+
+# format -> (mime type, file extension) of the Allure attachment
+_SCREENSHOT_TYPES = {
+    "jpeg": ("image/jpeg", "jpg"),
+    "webp": ("image/webp", "webp"),
+    "png": ("image/png", "png"),
+}
+
+# Content index of the cumulative results directory (see AllureHelper.accumulate_results)
+ACCUMULATE_INDEX_FILE = ".accumulate-index.json"
+PROFILE_REPORT_DIR = "Reports/profiles"
+
+# Below this width a screenshot stops being useful; compression gives up shrinking it further
+_MIN_SCREENSHOT_WIDTH = 480
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _collect_attachment_sources(item, sources):
+    """Add the attachment file names referenced anywhere in an Allure result/container (steps, fixtures)."""
+    if isinstance(item, dict):
+        for attachment in item.get("attachments") or []:
+            if attachment.get("source"):
+                sources.add(attachment["source"])
+        for key in ("steps", "befores", "afters"):
+            for child in item.get(key) or []:
+                _collect_attachment_sources(child, sources)
+    return sources
+
+
+def _is_write_once_result(name):
+    """
+    Allure writes result, container and attachment files once under a unique name, so they are safe to
+    hard-link; executor.json, environment.properties and categories.json are rewritten in place each run.
+    """
+    return name.endswith(("-result.json", "-container.json")) or "-attachment" in name
+
+
+def _link_or_copy(src, dst, link=True):
+    """
+    Place `src` at `dst` through a temporary name, so a file that shares its inode with another name is
+    never rewritten in place. Returns True if hard-linked, False if it was copied.
+    """
+    tmp_path = f"{dst}.{os.getpid()}.tmp"
+    linked = False
+    if link:
+        try:
+            os.link(src, tmp_path)
+            linked = True
+        except OSError:
+            pass
+    if not linked:
+        shutil.copy2(src, tmp_path)
+    os.replace(tmp_path, dst)
+    return linked
+
+
+def compress_screenshot(png, image_format, config, max_width=None):
+    """
+    Downscale a PNG screenshot to max_width and re-encode it as JPEG/WebP, lowering the quality and then
+    the size until it fits in config["max_bytes"]. For the png format the screenshot is kept as it is if it
+    fits, otherwise only downscaled. Without Pillow the PNG is returned unchanged.
+    """
+    if Image is None or (image_format == "png" and len(png) <= config["max_bytes"]):
+        return png
+    if image_format == "png":
+        return _downscale_png(png, config, max_width)
+    image = Image.open(io.BytesIO(png)).convert("RGB")
+    if max_width and image.width > max_width:
+        image = image.resize((max_width, round(image.height * max_width / image.width)), Image.LANCZOS)
+    quality = config["quality"]
+    while True:
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format.upper(), quality=quality)
+        data = buffer.getvalue()
+        if len(data) <= config["max_bytes"]:
+            return data
+        if quality > 40:
+            quality = max(40, quality - 15)
+        elif image.width * 3 // 4 >= _MIN_SCREENSHOT_WIDTH:
+            image = image.resize((image.width * 3 // 4, image.height * 3 // 4), Image.LANCZOS)
+        else:
+            printf(f"[WARN] Screenshot is {len(data) // 1024} KiB at the lowest quality/size, above the cap")
+            return data
+
+
+def _downscale_png(png, config, max_width=None):
+    """Shrink an oversized PNG screenshot until it fits in config["max_bytes"] or reaches the minimum width."""
+    image = Image.open(io.BytesIO(png))
+    width = min(image.width, max_width) if max_width else image.width
+    while True:
+        resized = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS) \
+            if width != image.width else image
+        buffer = io.BytesIO()
+        resized.save(buffer, format="PNG", optimize=True)
+        data = buffer.getvalue()
+        if len(data) <= config["max_bytes"]:
+            return data
+        if width * 3 // 4 < _MIN_SCREENSHOT_WIDTH:
+            printf(f"[WARN] PNG screenshot is {len(data) // 1024} KiB at the minimum width, above the cap")
+            return data
+        width = width * 3 // 4
 
 
 class AllureHelper:
     ALLURE_RESULTS_DIR = "Reports/features"
     CUMULATIVE_RESULTS_DIR = "Reports/cumulative-results"
 
+    # Background encoding/writing of failure screenshots
+    _attachment_lock = threading.Lock()
+    _attachment_executor = None
+    _pending_attachments = []
+
     @staticmethod
     def assign_feature_suite(context, feature):
         """Assign parent suite from folder name (for reference - tags must be in Gherkin for Allure Behave)."""
@@ -87,40 +223,115 @@ class AllureHelper:
 
     @staticmethod
     def attach_failure(driver, step):
-        """Attach screenshot + URL if a step fails."""
+        """
+        Attach a compressed screenshot, the failing element (when known) and the page URL if a step fails.
+        Only the capture runs in the hook; downscaling, encoding and writing happen on a background thread.
+        """
         if step.status != 'failed':
             return
 
-        current_url, screenshot_png = None, None
+        config = get_failure_screenshot_config()
+        locator = AllureHelper.forget_failed_element(driver)
+        current_url, screenshot_png, element_png = None, None, None
         try:
             current_url = driver.current_url
             screenshot_png = driver.get_screenshot_as_png()
         except Exception as e:
             printf(f"Failed to retrieve current URL during failure attachment: {e}")
+        if screenshot_png and locator and config["element_screenshots"]:
+            element_png = AllureHelper._element_screenshot(driver, locator)
 
         try:
-            if screenshot_png and current_url:
-                base64_image = base64.b64encode(screenshot_png).decode('utf-8')
-                html_content = f"""
-                    <div>
-                        <p><strong>Current URL:</strong>
-                        <a href="{current_url}" target="_blank">{current_url}</a></p>
-                        <img src="data:image/png;base64,{base64_image}"
-                        alt="Screenshot" style="max-width: 100%; height: auto;">
-                    </div>
-                """
-                allure.attach(html_content, name=f"failed_step_{get_current_time()}",
-                              attachment_type=AttachmentType.HTML)
-            elif screenshot_png:
-                allure.attach(screenshot_png, name=f"failed_step_{get_current_time()}",
-                              attachment_type=AttachmentType.PNG)
-            elif current_url:
+            stamp = get_current_time()
+            if current_url:
+                allure.dynamic.link(current_url, name=f"Failure URL: {current_url}")
+            if screenshot_png:
+                AllureHelper._attach_screenshot(screenshot_png, f"failed_step_{stamp}", config, config["max_width"])
+            if element_png:
+                AllureHelper._attach_screenshot(element_png, f"failed_element_{stamp}", config)
+            if current_url and not screenshot_png:
                 allure.attach(f"Current URL: {current_url}",
-                              name=f"failed_step_{get_current_time()}_url.txt",
+                              name=f"failed_step_{stamp}_url.txt",
                               attachment_type=AttachmentType.TEXT)
         except Exception as e:
             printf(f"Allure attachment failed (likely in CI environment): {e}")
 
+    @staticmethod
+    def forget_failed_element(driver):
+        """Return and clear the locator the last failing BasePage action gave up on."""
+        locator = getattr(driver, "_hbox_failed_locator", None)
+        if locator is not None:
+            driver._hbox_failed_locator = None
+        return locator
+
+    @staticmethod
+    def _element_screenshot(driver, locator):
+        try:
+            elements = driver.find_elements(*locator)
+            if elements and elements[0].is_displayed():
+                return elements[0].screenshot_as_png
+        except Exception as e:
+            printf(f"Could not capture element screenshot for {locator}: {e}")
+        return None
+
+    @staticmethod
+    def _attach_screenshot(png, name, config, max_width=None):
+        """
+        Register the attachment on the current Allure step right away (the step is only known on this
+        thread) and hand encoding and writing of the file to the attachment thread.
+        """
+        image_format = config["format"] if Image is not None else "png"
+        if Image is None and len(png) > config["max_bytes"]:
+            # Failure evidence is never dropped: without Pillow it can only be attached as it is
+            printf(f"[WARN] Attaching {name} uncompressed: {len(png) // 1024} KiB PNG exceeds the "
+                   f"{config['max_bytes'] // 1024} KiB cap (install Pillow to compress screenshots)")
+        mime_type, extension = _SCREENSHOT_TYPES[image_format]
+
+        reporter = AllureHelper._allure_reporter()
+        if reporter is None:
+            # No Allure listener registered in this process: fall back to a synchronous attachment
+            data = compress_screenshot(png, image_format, config, max_width)
+            allure.attach(data, name=name, attachment_type=mime_type, extension=extension)
+            return
+        file_name = reporter._attach(uuid4(), name=name, attachment_type=mime_type, extension=extension)
+
+        def write():
+            try:
+                data = compress_screenshot(png, image_format, config, max_width)
+            except Exception as e:
+                printf(f"Screenshot compression failed for {name}, attaching the original: {e}")
+                data = png
+            allure_commons.plugin_manager.hook.report_attached_data(body=data, file_name=file_name)
+
+        with AllureHelper._attachment_lock:
+            if AllureHelper._attachment_executor is None:
+                AllureHelper._attachment_executor = ThreadPoolExecutor(max_workers=2,
+                                                                       thread_name_prefix="allure-attach")
+            AllureHelper._pending_attachments.append(AllureHelper._attachment_executor.submit(write))
+
+    @staticmethod
+    def _allure_reporter():
+        """The AllureReporter of the allure-behave listener, or None when Allure is not active."""
+        for plugin in allure_commons.plugin_manager.get_plugins():
+            reporter = getattr(plugin, "logger", None)
+            if isinstance(reporter, AllureReporter):
+                return reporter
+        return None
+
+    @staticmethod
+    def flush_attachments(timeout=60):
+        """Wait for background screenshot writes; call before the results directory is read or copied."""
+        with AllureHelper._attachment_lock:
+            pending, AllureHelper._pending_attachments = AllureHelper._pending_attachments, []
+        if not pending:
+            return
+        done, not_done = wait(pending, timeout=timeout)
+        for future in done:
+            if future.exception():
+                printf(f"Failed to write screenshot attachment: {future.exception()}")
+        if not_done:
+            printf(f"[WARN] {len(not_done)} screenshot attachment(s) still being written after {timeout}s")
+
     @staticmethod
     def merge_history(allure_results_dir, allure_report_dir):
         """Preserve allure history between runs."""
@@ -211,28 +422,134 @@ class AllureHelper:
 
     @staticmethod
     def accumulate_results():
-        """Accumulate current run results (JSON + attachments) into cumulative directory."""
+        """
+        Accumulate current run results (JSON + attachments) into cumulative directory.
+
+        Incremental: a content index (.accumulate-index.json inside the cumulative directory, so it travels
+        with the Jenkins artifacts) records size, mtime and SHA-256 of every accumulated file. Files whose
+        name, size and mtime are already indexed are skipped without being read; new files are hard-linked
+        (copied when linking is not possible) and identical content under a new name is linked to the file
+        that already holds it. Work is proportional to the files of the current run, not the history.
+        What was added is written to Reports/profiles/accumulate-results-<pid>.json.
+        """
         try:
             current_results_dir = AllureHelper.ALLURE_RESULTS_DIR
             cumulative_dir = AllureHelper.CUMULATIVE_RESULTS_DIR
 
             os.makedirs(cumulative_dir, exist_ok=True)
-
-            copied_count = 0
-            if os.path.exists(current_results_dir):
-                for file in os.listdir(current_results_dir):
-                    src = os.path.join(current_results_dir, file)
-                    dst = os.path.join(cumulative_dir, file)
-                    if os.path.isfile(src):
-                        shutil.copy2(src, dst)
-                        copied_count += 1
-
-            printf(f"Accumulated {copied_count} result & attachment files into cumulative directory")
+            if not os.path.exists(current_results_dir):
+                printf("No current results to accumulate")
+                return True
+
+            # BehaveX workers all accumulate the shared results directory at the end of their run
+            with FileLock(f"{cumulative_dir.rstrip('/')}.lock"):
+                summary = AllureHelper._accumulate_incrementally(current_results_dir, cumulative_dir)
+
+            printf(f"Accumulated {len(summary['added'])} new result & attachment files "
+                   f"({summary['added_bytes'] / 1024:.0f} KiB, {summary['linked']} hard-linked, "
+                   f"{summary['deduplicated']} deduplicated by content), {summary['updated']} updated, "
+                   f"{summary['unchanged']} unchanged in {summary['seconds']:.2f}s")
+            AllureHelper._write_accumulate_report(summary)
             return True
         except Exception as e:
             printf(f"Error accumulating results: {e}")
             return False
 
+    @staticmethod
+    def _accumulate_incrementally(source_dir, cumulative_dir):
+        started = time.monotonic()
+        index_path = os.path.join(cumulative_dir, ACCUMULATE_INDEX_FILE)
+        index = AllureHelper._load_accumulate_index(index_path)
+        files, by_hash = index["files"], index["hashes"]
+        summary = {"added": [], "added_bytes": 0, "linked": 0, "deduplicated": 0, "updated": 0, "unchanged": 0}
+
+        source_names = set()
+        for entry in os.scandir(source_dir):
+            if not entry.is_file() or entry.name.endswith(".tmp"):
+                continue
+            source_names.add(entry.name)
+            stat = entry.stat()
+            dst = os.path.join(cumulative_dir, entry.name)
+            known = files.get(entry.name)
+            # Already accumulated, or accumulated and later dropped by compact_cumulative_results
+            if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns \
+                    and (known.get("removed") or os.path.exists(dst)):
+                summary["unchanged"] += 1
+                continue
+
+            digest = _file_sha256(entry.path)
+            exists = os.path.exists(dst)
+            immutable = _is_write_once_result(entry.name)
+            if exists:
+                dst_digest = known["sha256"] if known else _file_sha256(dst)
+                if dst_digest == digest:
+                    files[entry.name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+                    summary["unchanged"] += 1
+                    continue
+
+            # Same content already accumulated under another name (e.g. a re-attached screenshot)
+            origin = by_hash.get(digest)
+            origin_path = os.path.join(cumulative_dir, origin) if origin else None
+            if immutable and origin_path and origin != entry.name and os.path.exists(origin_path):
+                _link_or_copy(origin_path, dst)
+                summary["deduplicated"] += 1
+            else:
+                if _link_or_copy(entry.path, dst, link=immutable):
+                    summary["linked"] += 1
+                summary["added_bytes"] += stat.st_size
+                if immutable:
+                    by_hash[digest] = entry.name
+
+            # Keyed by the source stat: answers "was this run file accumulated already" without reading it
+            files[entry.name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+            if exists:
+                summary["updated"] += 1
+            else:
+                summary["added"].append(entry.name)
+
+        summary["expired_tombstones"] = AllureHelper._expire_tombstones(files, source_names)
+        if summary["added"] or summary["updated"] or summary["expired_tombstones"]:
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, index_path)
+        summary["seconds"] = time.monotonic() - started
+        return summary
+
+    @staticmethod
+    def _load_accumulate_index(index_path):
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            if isinstance(index.get("files"), dict) and isinstance(index.get("hashes"), dict):
+                return index
+        except (OSError, ValueError):
+            pass
+        return {"version": 1, "files": {}, "hashes": {}}
+
+    @staticmethod
+    def _write_accumulate_report(summary):
+        report = {
+            "pid": os.getpid(),
+            "finished_at": datetime.now().isoformat(),
+            "seconds": round(summary["seconds"], 3),
+            "added_files": len(summary["added"]),
+            "added_bytes": summary["added_bytes"],
+            "hard_linked": summary["linked"],
+            "deduplicated": summary["deduplicated"],
+            "updated": summary["updated"],
+            "unchanged": summary["unchanged"],
+            "expired_tombstones": summary["expired_tombstones"],
+            "added": summary["added"],
+        }
+        try:
+            os.makedirs(PROFILE_REPORT_DIR, exist_ok=True)
+            path = os.path.join(PROFILE_REPORT_DIR, f"accumulate-results-{os.getpid()}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        except Exception as e:
+            printf(f"Failed to write accumulate report: {e}")
+
     @staticmethod
     def clear_cumulative_results():
         """Clear the cumulative result's directory."""
@@ -248,6 +565,137 @@ class AllureHelper:
             printf(f"Error clearing cumulative results: {e}")
             return False
 
+    @staticmethod
+    def compact_cumulative_results(keep_last=None, max_age_days=None, dry_run=False):
+        """
+        Apply the retention policy to the cumulative directory.
+
+        Result files are grouped per test by historyId; the newest `keep_last` of each group are kept
+        (0 keeps all) and, with `max_age_days`, results that finished before that window are dropped as
+        well. Containers left without results and attachments no longer referenced are removed, and the
+        accumulate index is updated. Defaults come from get_cumulative_retention_config().
+
+        Returns:
+            dict: counts of kept/removed results, containers and attachments, removed_bytes (what the
+                  archived artifacts shrink by) and reclaimed_bytes (disk space freed; hard-linked
+                  files only free space once their last link is gone), or None on error.
+        """
+        config = get_cumulative_retention_config()
+        keep_last = config["keep_last"] if keep_last is None else keep_last
+        max_age_days = config["max_age_days"] if max_age_days is None else max_age_days
+        cumulative_dir = AllureHelper.CUMULATIVE_RESULTS_DIR
+        if not os.path.isdir(cumulative_dir):
+            printf("Cumulative results directory does not exist")
+            return None
+
+        try:
+            with FileLock(f"{cumulative_dir.rstrip('/')}.lock"):
+                summary = AllureHelper._compact(cumulative_dir, keep_last, max_age_days, dry_run)
+        except Exception as e:
+            printf(f"Error compacting cumulative results: {e}")
+            return None
+
+        printf(f"{'Would remove' if dry_run else 'Removed'} {summary['removed_results']} of "
+               f"{summary['results']} results (keep_last={keep_last}, max_age_days={max_age_days}), "
+               f"{summary['removed_containers']} containers and {summary['removed_attachments']} attachments: "
+               f"{summary['removed_bytes'] / 1024 / 1024:.1f} MiB removed, "
+               f"{summary['reclaimed_bytes'] / 1024 / 1024:.1f} MiB disk space reclaimed")
+        return summary
+
+    @staticmethod
+    def _compact(cumulative_dir, keep_last, max_age_days, dry_run):
+        results, containers, attachments = {}, {}, set()
+        for name in os.listdir(cumulative_dir):
+            path = os.path.join(cumulative_dir, name)
+            if name.endswith("-result.json"):
+                results[name] = _read_json(path)
+            elif name.endswith("-container.json"):
+                containers[name] = _read_json(path)
+            elif "-attachment" in name and not name.endswith(".tmp"):
+                attachments.add(name)
+
+        # Newest first within each test; unreadable results are kept untouched
+        groups = {}
+        for name, result in results.items():
+            if result is not None:
+                key = result.get("historyId") or result.get("fullName") or result.get("name") or name
+                groups.setdefault(key, []).append(name)
+        cutoff_ms = (time.time() - max_age_days * 86400) * 1000 if max_age_days else None
+        removed_results = set()
+        for names in groups.values():
+            names.sort(key=lambda n: results[n].get("stop") or results[n].get("start") or 0, reverse=True)
+            for rank, name in enumerate(names):
+                finished = results[name].get("stop") or results[name].get("start") or 0
+                if (keep_last and rank >= keep_last) or (cutoff_ms is not None and finished < cutoff_ms):
+                    removed_results.add(name)
+
+        kept_uuids = {results[n].get("uuid") for n in results if n not in removed_results and results[n]}
+        removed_containers = {name for name, container in containers.items() if container is not None
+                              and not kept_uuids.intersection(container.get("children", []))}
+
+        referenced = set()
+        for name, item in list(results.items()) + list(containers.items()):
+            if item is not None and name not in removed_results and name not in removed_containers:
+                _collect_attachment_sources(item, referenced)
+        removed_attachments = attachments - referenced
+
+        removed = sorted(removed_results | removed_containers | removed_attachments)
+        removed_bytes, reclaimed_bytes = 0, 0
+        for name in removed:
+            path = os.path.join(cumulative_dir, name)
+            try:
+                stat = os.stat(path)
+                removed_bytes += stat.st_size
+                if stat.st_nlink <= 1:
+                    reclaimed_bytes += stat.st_size
+                if not dry_run:
+                    os.remove(path)
+            except OSError as e:
+                printf(f"Could not remove {name}: {e}")
+
+        if not dry_run and removed:
+            AllureHelper._prune_accumulate_index(cumulative_dir, set(removed))
+        return {
+            "results": len(results),
+            "tests": len(groups),
+            "removed_results": len(removed_results),
+            "removed_containers": len(removed_containers),
+            "removed_attachments": len(removed_attachments),
+            "removed_bytes": removed_bytes,
+            "reclaimed_bytes": reclaimed_bytes,
+            "dry_run": dry_run,
+        }
+
+    @staticmethod
+    def _expire_tombstones(files, source_names):
+        """
+        Drop tombstones of files the results directory no longer holds: they can't be accumulated again, and
+        keeping them would grow the index with every result ever accumulated. Returns how many were dropped.
+        """
+        expired = [name for name, known in files.items() if known.get("removed") and name not in source_names]
+        for name in expired:
+            del files[name]
+        return len(expired)
+
+    @staticmethod
+    def _prune_accumulate_index(cumulative_dir, removed):
+        index_path = os.path.join(cumulative_dir, ACCUMULATE_INDEX_FILE)
+        index = AllureHelper._load_accumulate_index(index_path)
+        # Entries of removed files stay as tombstones so accumulate_results does not add them back from a
+        # results directory that still holds them; only while it does (Reports/features is fresh every build)
+        for name in removed & set(index["files"]):
+            index["files"][name]["removed"] = True
+        try:
+            source_names = set(os.listdir(AllureHelper.ALLURE_RESULTS_DIR))
+        except OSError:
+            source_names = set()
+        AllureHelper._expire_tombstones(index["files"], source_names)
+        index["hashes"] = {digest: name for digest, name in index["hashes"].items() if name not in removed}
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, index_path)
+
     @staticmethod
     def generate_cumulative_report():
         """Generate Allure report from cumulative results with history."""
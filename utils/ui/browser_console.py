@@ -0,0 +1,123 @@
+import time
+from collections import deque
+from datetime import datetime
+
+import allure
+from allure_commons.types import AttachmentType
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger import printf
+from utils.ui.config_reader import get_browser_console_config
+
+# Chrome log levels, lowest first
+LEVELS = ("ALL", "DEBUG", "INFO", "WARNING", "SEVERE")
+
+# Longest message kept per entry; stack traces and serialized objects can be very long
+MAX_MESSAGE_LENGTH = 500
+
+
+def _level_rank(entry):
+    level = entry.get("level")
+    return LEVELS.index(level) if level in LEVELS else LEVELS.index("INFO")
+
+
+def enable_browser_logs(options):
+    """Have ChromeDriver record console messages, JS exceptions and failed requests (ChromeOptions instance)."""
+    prefs = dict(options.capabilities.get("goog:loggingPrefs", {}))
+    prefs["browser"] = "ALL"
+    options.set_capability("goog:loggingPrefs", prefs)
+    return options
+
+
+class BrowserConsole:
+    """
+    Browser console evidence for failed scenarios (BROWSER_CONSOLE_CAPTURE / [BrowserConsole] enabled).
+
+    ChromeDriver subscribes to the DevTools Runtime/Log events of every Chrome session created with
+    enable_browser_logs() and buffers console-api messages, uncaught exceptions (source "javascript") and
+    failed resource loads (source "network") on its side, so passing steps cost no extra commands.
+    When a scenario fails the buffer of every driver in use is drained once into a bounded per-driver ring
+    buffer, and the entries logged since the scenario started are attached to Allure as one text file.
+    """
+
+    _scenario_started_ms = 0
+
+    @staticmethod
+    def is_enabled():
+        return get_browser_console_config()["enabled"]
+
+    @staticmethod
+    def start_scenario():
+        # ChromeDriver log timestamps are epoch milliseconds
+        BrowserConsole._scenario_started_ms = int(time.time() * 1000)
+
+    @staticmethod
+    def drain(driver):
+        """Move the entries ChromeDriver has buffered for `driver` into its ring buffer and return the buffer."""
+        config = get_browser_console_config()
+        buffer = getattr(driver, "_hbox_console", None)
+        if buffer is None:
+            buffer = deque(maxlen=config["buffer_size"])
+            driver._hbox_console = buffer
+        if getattr(driver, "_hbox_console_unsupported", False):
+            return buffer
+        try:
+            entries = driver.get_log("browser")
+        except WebDriverException as e:
+            # Browser log not enabled for this session (non-Chrome browser, capability missing or session gone)
+            driver._hbox_console_unsupported = True
+            printf(f"BrowserConsole: browser log unavailable for this driver: {str(e).splitlines()[0]}")
+            return buffer
+        min_level = LEVELS.index(config["min_level"])
+        buffer.extend(entry for entry in entries if _level_rank(entry) >= min_level)
+        return buffer
+
+    @staticmethod
+    def _drivers(context):
+        """(label, driver) for the feature driver and every role driver, each driver once."""
+        drivers, seen = [], set()
+        role = getattr(context, "current_driver_role", None)
+        candidates = [(getattr(role, "value", role) or "default", getattr(context, "driver", None))]
+        candidates += list(getattr(context, "user_drivers", {}).items())
+        for label, driver in candidates:
+            if driver is not None and id(driver) not in seen:
+                seen.add(id(driver))
+                drivers.append((label, driver))
+        return drivers
+
+    @staticmethod
+    def format_entries(entries):
+        lines = []
+        for entry in entries:
+            stamp = datetime.fromtimestamp(entry.get("timestamp", 0) / 1000).strftime("%H:%M:%S.%f")[:-3]
+            message = " ".join(str(entry.get("message", "")).split())
+            if len(message) > MAX_MESSAGE_LENGTH:
+                message = message[:MAX_MESSAGE_LENGTH] + "..."
+            lines.append(f"{stamp} {entry.get('level', ''):<7} {entry.get('source', ''):<11} {message}")
+        return lines
+
+    @staticmethod
+    def attach_on_failure(context, scenario):
+        """Attach the console/JS/network entries of this scenario for every driver, only if it failed."""
+        if scenario.status not in ("failed", "error"):
+            return None
+        sections, total = [], 0
+        for label, driver in BrowserConsole._drivers(context):
+            entries = [e for e in BrowserConsole.drain(driver)
+                       if e.get("timestamp", 0) >= BrowserConsole._scenario_started_ms]
+            if not entries:
+                continue
+            total += len(entries)
+            errors = sum(1 for e in entries if e.get("level") == "SEVERE")
+            sections.append(f"== {label}: {len(entries)} entries, {errors} severe ==")
+            sections.extend(BrowserConsole.format_entries(entries))
+            sections.append("")
+        if not sections:
+            return None
+        try:
+            allure.attach("\n".join(sections), name="browser_console", attachment_type=AttachmentType.TEXT)
+        except Exception as e:
+            printf(f"BrowserConsole: failed to attach console log: {e}")
+            return None
+        printf(f"BrowserConsole: attached {total} console/JS/network entries for failed scenario '{scenario.name}'")
+        return total
@@ -0,0 +1,10 @@
+def execute_cdp(driver, cmd, params=None):
+    """
+    Run a Chrome DevTools Protocol command on a local or remote (Selenoid) Chrome session.
+
+    Local Chrome drivers expose execute_cdp_cmd; for webdriver.Remote the same goog/cdp/execute endpoint is
+    reached through the executeCdpCommand command registered by ChromiumRemoteConnection.
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        return driver.execute_cdp_cmd(cmd, params or {})
+    return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params or {}})["value"]
@@ -0,0 +1,208 @@
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from utils.logger import printf
+from utils.ui.command_profiler import summarize
+from utils.ui.config_reader import get_chrome_profile_config
+from utils.ui.file_lock import FileLock
+
+# Files Chrome uses to mark a profile as in use; never copied from the template
+_SINGLETON_FILES = ("SingletonLock", "SingletonCookie", "SingletonSocket", "lockfile")
+
+
+def dir_size(path):
+    """Total size in bytes of the files under `path`."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class ChromeProfile:
+    """A user-data-dir owned by this process; the lock beside it marks it as in use for orphan sweeps."""
+
+    def __init__(self, path, lock):
+        self.path = path
+        self.lock = lock
+        self.created_at = time.monotonic()
+
+
+class ChromeProfileManager:
+    """
+    Lifecycle of local Chrome user-data-dirs for DriverManager.
+
+    Profiles live under one root directory (default: <tmp>/hbox-chrome-profiles). Each is cloned from a
+    pre-warmed template profile (built once per machine by starting Chrome with an empty profile), is held
+    with a file lock while its browser runs and is deleted when the driver quits. Profiles whose lock is not
+    held by any process belong to crashed or killed runs and are swept when a DriverManager starts.
+    Disk usage, clone and browser start-up times are written to Reports/profiles/chrome-profiles-<pid>.json.
+    """
+
+    REPORT_DIR = "Reports/profiles"
+    PROFILE_PREFIX = "profile-"
+    TEMPLATE_DIR = "template"
+
+    def __init__(self):
+        config = get_chrome_profile_config()
+        self.root_dir = config["root_dir"]
+        self.use_template = config["use_template"]
+        self.template_max_age = config["template_max_age_hours"] * 3600
+        self._lock = threading.Lock()
+        self._metrics = {"clone_seconds": [], "startup_seconds": [], "profile_bytes": []}
+        self._swept = {"profiles": 0, "bytes": 0}
+
+    @property
+    def template_path(self):
+        return os.path.join(self.root_dir, self.TEMPLATE_DIR)
+
+    # -------------------- Profiles --------------------
+
+    def create(self, build_template=None):
+        """
+        Create a profile for a new Chrome instance, cloned from the template when one is available.
+
+        Args:
+            build_template: callable(user_data_dir) that starts and quits Chrome once with that directory;
+                            used to build the template the first time.
+        """
+        os.makedirs(self.root_dir, exist_ok=True)
+        name = f"{self.PROFILE_PREFIX}{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        path = os.path.join(self.root_dir, name)
+        lock = FileLock(f"{path}.lock")
+        lock.acquire()
+
+        started = time.monotonic()
+        template = self.ensure_template(build_template) if self.use_template and build_template else None
+        if template:
+            try:
+                shutil.copytree(template, path, ignore=shutil.ignore_patterns(*_SINGLETON_FILES))
+                with self._lock:
+                    self._metrics["clone_seconds"].append(time.monotonic() - started)
+            except OSError as e:
+                printf(f"ChromeProfileManager: failed to clone template profile, starting empty: {e}")
+                shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+        return ChromeProfile(path, lock)
+
+    def record_startup(self, seconds):
+        with self._lock:
+            self._metrics["startup_seconds"].append(seconds)
+
+    def release(self, profile):
+        """Delete a profile after its browser has quit."""
+        if profile is None:
+            return
+        size = dir_size(profile.path)
+        with self._lock:
+            self._metrics["profile_bytes"].append(size)
+        shutil.rmtree(profile.path, ignore_errors=True)
+        profile.lock.release()
+        try:
+            os.remove(f"{profile.path}.lock")
+        except OSError:
+            pass
+
+    def ensure_template(self, build_template):
+        """Return the template profile path, (re)building it under a lock if missing or too old."""
+        template = self.template_path
+        marker = os.path.join(template, ".hbox-template")
+        if self._is_fresh(marker):
+            return template
+
+        with FileLock(os.path.join(self.root_dir, "template.lock")):
+            if self._is_fresh(marker):
+                return template
+            staging = os.path.join(self.root_dir, f"template-staging-{os.getpid()}")
+            shutil.rmtree(staging, ignore_errors=True)
+            started = time.monotonic()
+            try:
+                build_template(staging)
+            except Exception as e:
+                printf(f"ChromeProfileManager: could not build template profile: {e}")
+                shutil.rmtree(staging, ignore_errors=True)
+                return None
+            for name in _SINGLETON_FILES:
+                try:
+                    os.remove(os.path.join(staging, name))
+                except OSError:
+                    pass
+            with open(os.path.join(staging, ".hbox-template"), "w", encoding="utf-8") as f:
+                f.write(datetime.now().isoformat())
+            shutil.rmtree(template, ignore_errors=True)
+            os.replace(staging, template)
+            printf(f"ChromeProfileManager: built template profile in {time.monotonic() - started:.1f}s "
+                   f"({dir_size(template) / 1024 / 1024:.1f} MiB)")
+            return template
+
+    def _is_fresh(self, marker):
+        try:
+            return time.time() - os.path.getmtime(marker) < self.template_max_age
+        except OSError:
+            return False
+
+    def sweep_orphans(self):
+        """Delete profiles left behind by runs that died before quitting their browsers."""
+        if not os.path.isdir(self.root_dir):
+            return 0
+        swept = 0
+        for name in os.listdir(self.root_dir):
+            path = os.path.join(self.root_dir, name)
+            if not name.startswith(self.PROFILE_PREFIX) or not os.path.isdir(path):
+                continue
+            lock = FileLock(f"{path}.lock")
+            if not lock.acquire(blocking=False):
+                continue  # still in use by a live process
+            try:
+                size = dir_size(path)
+                shutil.rmtree(path, ignore_errors=True)
+                swept += 1
+                with self._lock:
+                    self._swept["profiles"] += 1
+                    self._swept["bytes"] += size
+            finally:
+                lock.release()
+                try:
+                    os.remove(f"{path}.lock")
+                except OSError:
+                    pass
+        if swept:
+            printf(f"ChromeProfileManager: swept {swept} orphaned profile(s), "
+                   f"{self._swept['bytes'] / 1024 / 1024:.1f} MiB reclaimed")
+        return swept
+
+    # -------------------- Metrics --------------------
+
+    def write_run_report(self):
+        """Write Reports/profiles/chrome-profiles-<pid>.json with clone/start-up times and disk usage."""
+        with self._lock:
+            metrics = {k: list(v) for k, v in self._metrics.items()}
+            swept = dict(self._swept)
+        if not metrics["startup_seconds"] and not swept["profiles"]:
+            return None
+        report = {
+            "pid": os.getpid(),
+            "finished_at": datetime.now().isoformat(),
+            "template": self.use_template,
+            "clone_seconds": summarize(metrics["clone_seconds"]),
+            "startup_seconds": summarize(metrics["startup_seconds"]),
+            "profile_bytes": summarize(metrics["profile_bytes"]),
+            "swept_orphans": swept,
+        }
+        try:
+            os.makedirs(self.REPORT_DIR, exist_ok=True)
+            path = os.path.join(self.REPORT_DIR, f"chrome-profiles-{os.getpid()}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            return path
+        except Exception as e:
+            printf(f"ChromeProfileManager: failed to write report: {e}")
+            return None
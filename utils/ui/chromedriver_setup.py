@@ -1,108 +1,209 @@
+import json
 import os
 import platform
 import re
 import shutil
 import subprocess
+import tempfile
+import time
 import requests
 import zipfile
 
 from utils.logger import printf
-from utils.ui.config_reader import get_browser_config
+from utils.ui.config_reader import get_browser_config, get_chromedriver_cache_config
+from utils.ui.file_lock import FileLock
 
+MANIFEST_NAME = "manifest.json"
+LOCK_NAME = ".lock"
 
-def download_chromedriver():
-    """Downloads a ChromeDriver version that matches the installed Chrome major version."""
-    drivers_dir = "drivers"
-    if not os.path.exists(drivers_dir):
-        os.makedirs(drivers_dir)
+
+def load_manifest(cache_dir):
+    path = os.path.join(cache_dir, MANIFEST_NAME)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"drivers": {}, "resolved": None}
+
+
+def save_manifest(cache_dir, manifest):
+    """Write the manifest atomically so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".manifest-")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(cache_dir, MANIFEST_NAME))
+
+
+def find_chrome_binary():
+    """Locate the Chrome executable without starting it. Returns an absolute path or None."""
+    for name in ("google-chrome", "google-chrome-stable", "chrome", "chromium", "chromium-browser"):
+        path = shutil.which(name)
+        if path:
+            return os.path.realpath(path)
+    candidates = [
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        os.path.join(os.environ.get("PROGRAMFILES", r"C:\Program Files"), r"Google\Chrome\Application\chrome.exe"),
+        os.path.join(os.environ.get("PROGRAMFILES(X86)", r"C:\Program Files (x86)"),
+                     r"Google\Chrome\Application\chrome.exe"),
+        os.path.join(os.environ.get("LOCALAPPDATA", ""), r"Google\Chrome\Application\chrome.exe"),
+    ]
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    return None
 
 
+def chrome_fingerprint():
+    """Cheap identity of the installed Chrome (path + mtime); changes when Chrome is updated."""
+    chrome_binary = find_chrome_binary()
+    if not chrome_binary:
+        return None
+    try:
+        return {"path": chrome_binary, "mtime": os.path.getmtime(chrome_binary)}
+    except OSError:
+        return None
+
+
+def download_chromedriver():
+    """
+    Returns a ChromeDriver matching the installed Chrome major version from the shared driver cache.
+
+    The cache (drivers/cache by default) holds one extracted driver per Chrome major/driver version and a
+    manifest recording which driver was resolved for which Chrome binary. Resolution happens under a file
+    lock: the first worker of a run probes Chrome and downloads if needed, the other workers find the
+    resolved entry in the manifest and reuse it without running any subprocess. In offline mode only cached
+    drivers are used.
+    """
     browser = get_browser_config()
 
     if browser.lower() != "chrome":
         printf("ChromeDriver download is only supported for Chrome browser.")
         return None
 
-    chromedriver_filename = "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
     chromedriver_dirname = get_chromedriver_dirname()
     if not chromedriver_dirname:
         printf(f"Unsupported OS for ChromeDriver download: {platform.system()}")
         return None
 
-    chromedriver_path = os.path.join(drivers_dir, chromedriver_dirname, chromedriver_filename)
+    cache_config = get_chromedriver_cache_config()
+    cache_dir = cache_config["cache_dir"]
+    offline = cache_config["offline"]
+    os.makedirs(cache_dir, exist_ok=True)
+
+    fingerprint = chrome_fingerprint()
+    resolved = load_manifest(cache_dir).get("resolved")
+    if _is_resolved_for(resolved, fingerprint):
+        printf(f"Reusing ChromeDriver {resolved['driver_version']} resolved for Chrome {resolved['chrome_version']}")
+        return resolved["driver_path"]
+
+    with FileLock(os.path.join(cache_dir, LOCK_NAME)):
+        # Another worker may have resolved the driver while we were waiting for the lock
+        manifest = load_manifest(cache_dir)
+        resolved = manifest.get("resolved")
+        if _is_resolved_for(resolved, fingerprint):
+            printf(f"Reusing ChromeDriver {resolved['driver_version']} resolved by another worker")
+            return resolved["driver_path"]
+
+        installed_chrome_version = get_installed_chrome_version()
+        installed_chrome_major = get_major_version(installed_chrome_version)
+        if installed_chrome_version:
+            printf(f"Installed Chrome version detected: {installed_chrome_version}")
+        else:
+            printf("Could not detect installed Chrome version. Falling back to stable ChromeDriver.")
+
+        entry = _cached_driver(manifest, installed_chrome_major)
+        if entry:
+            printf(f"Using cached ChromeDriver {entry['driver_version']} for Chrome major {entry['chrome_major']}")
+        elif offline:
+            printf("Offline mode: no cached ChromeDriver matches the installed Chrome. "
+                   "Run once with network access or disable CHROMEDRIVER_OFFLINE.")
+            return None
+        else:
+            entry = _download_to_cache(cache_dir, chromedriver_dirname, installed_chrome_major)
+            if not entry:
+                return None
+            manifest.setdefault("drivers", {})[entry["chrome_major"]] = entry
 
-    installed_chrome_version = get_installed_chrome_version()
-    installed_chrome_major = get_major_version(installed_chrome_version)
+        manifest["resolved"] = {
+            "chrome": fingerprint,
+            "chrome_version": installed_chrome_version,
+            "driver_version": entry["driver_version"],
+            "driver_path": entry["driver_path"],
+            "resolved_at": time.time(),
+        }
+        save_manifest(cache_dir, manifest)
+        return entry["driver_path"]
 
-    if installed_chrome_version:
-        printf(f"Installed Chrome version detected: {installed_chrome_version}")
-    else:
-        printf("Could not detect installed Chrome version. Falling back to stable ChromeDriver.")
 
-    if os.path.exists(chromedriver_path):
-        existing_driver_version = get_existing_chromedriver_version(chromedriver_path)
-        existing_driver_major = get_major_version(existing_driver_version)
+def _is_resolved_for(resolved, fingerprint):
+    return bool(resolved and fingerprint and resolved.get("chrome") == fingerprint
+                and os.path.isfile(resolved.get("driver_path", "")))
 
-        if installed_chrome_major and existing_driver_major == installed_chrome_major:
-            printf(
-                f"Existing ChromeDriver version {existing_driver_version} matches installed Chrome major "
-                f"{installed_chrome_major}. Reusing it."
-            )
-            return chromedriver_path
 
-        printf(
-            "Existing ChromeDriver does not match installed Chrome major version. "
-            "Downloading a compatible driver."
-        )
-        remove_existing_chromedriver(drivers_dir, chromedriver_dirname, chromedriver_path)
+def _cached_driver(manifest, chrome_major):
+    """Manifest entry whose driver binary still exists for `chrome_major` (None: the most recent entry)."""
+    drivers = manifest.get("drivers", {})
+    if chrome_major:
+        candidates = [drivers.get(chrome_major)]
+    else:
+        candidates = sorted(drivers.values(), key=lambda e: e.get("downloaded_at", 0), reverse=True)
+    for entry in candidates:
+        if entry and os.path.isfile(entry.get("driver_path", "")):
+            return entry
+    return None
+
 
-    chromedriver_version = get_chromedriver_version(installed_chrome_major)
+def _download_to_cache(cache_dir, chromedriver_dirname, chrome_major):
+    """Download and extract a driver into a private temp dir, then move it into the cache atomically."""
+    chromedriver_version = get_chromedriver_version(chrome_major)
     if not chromedriver_version:
         printf("Could not determine ChromeDriver version.")
         return None
 
-    printf("Downloading ChromeDriver...")
     chromedriver_url = get_chromedriver_url(chromedriver_version)
     if not chromedriver_url:
         printf("Could not determine ChromeDriver download URL.")
         return None
 
+    chromedriver_filename = "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
+    version_dir = os.path.join(cache_dir, chromedriver_version)
+    chromedriver_path = os.path.abspath(os.path.join(version_dir, chromedriver_dirname, chromedriver_filename))
+    entry = {
+        "chrome_major": chrome_major or get_major_version(chromedriver_version),
+        "driver_version": chromedriver_version,
+        "driver_path": chromedriver_path,
+        "downloaded_at": time.time(),
+    }
+    if os.path.isfile(chromedriver_path):
+        return entry
+
+    printf(f"Downloading ChromeDriver {chromedriver_version}...")
+    staging_dir = tempfile.mkdtemp(dir=cache_dir, prefix=".staging-")
     try:
-        response = requests.get(chromedriver_url, stream=True)
+        response = requests.get(chromedriver_url, stream=True, timeout=60)
         response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
 
-        zip_filepath = os.path.join(drivers_dir, "chromedriver.zip")
+        zip_filepath = os.path.join(staging_dir, "chromedriver.zip")
         with open(zip_filepath, "wb") as f:
             for chunk in response.iter_content(chunk_size=8192):
                 f.write(chunk)
 
-        # Extract the zip file
+        extract_dir = os.path.join(staging_dir, "extracted")
         with zipfile.ZipFile(zip_filepath, 'r') as zip_ref:
-            zip_ref.extractall(drivers_dir)
-
-        os.remove(zip_filepath)
+            zip_ref.extractall(extract_dir)
 
-        # Check if the extracted directory exists
-        extracted_dir = os.path.join(drivers_dir, chromedriver_dirname)
-        if not os.path.exists(extracted_dir):
-            printf(f"Error: Extracted directory '{extracted_dir}' not found.")
+        staged_driver = os.path.join(extract_dir, chromedriver_dirname, chromedriver_filename)
+        if not os.path.exists(staged_driver):
+            printf(f"Error: ChromeDriver executable '{staged_driver}' not found in archive.")
             return None
 
         if platform.system() != "Windows":
-            try:
-                os.chmod(chromedriver_path, 0o755)
-                printf(f"Set executable permission for {chromedriver_path}")
-            except Exception as e:
-                printf(f"Failed to set executable permission: {e}")
-                return None
+            os.chmod(staged_driver, 0o755)
 
-        # Ensure the chromedriver executable is in the extracted directory
-        if not os.path.exists(chromedriver_path):
-            printf(f"Error: ChromeDriver executable '{chromedriver_path}' not found.")
-            return None
-
-        printf("ChromeDriver downloaded and extracted successfully.")
-        return chromedriver_path
+        shutil.rmtree(version_dir, ignore_errors=True)
+        os.replace(extract_dir, version_dir)
+        printf(f"ChromeDriver {chromedriver_version} downloaded to {chromedriver_path}")
+        return entry
 
     except requests.exceptions.RequestException as e:
         printf(f"Error downloading ChromeDriver: {e}")
@@ -110,6 +211,11 @@ def download_chromedriver():
     except zipfile.BadZipFile as e:
         printf(f"Error extracting ChromeDriver: {e}")
         return None
+    except OSError as e:
+        printf(f"Error installing ChromeDriver into cache: {e}")
+        return None
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
 
 
 def get_chromedriver_version(chrome_major=None):
@@ -202,34 +308,6 @@ def get_major_version(version):
     return parts[0] if parts else None
 
 
-def get_existing_chromedriver_version(chromedriver_path):
-    """Reads the current downloaded ChromeDriver version by executing binary."""
-    if not os.path.exists(chromedriver_path):
-        return None
-
-    try:
-        result = subprocess.run([chromedriver_path, "--version"], capture_output=True, text=True, check=False)
-        output = (result.stdout or "") + " " + (result.stderr or "")
-        match = re.search(r"(\d+\.\d+\.\d+\.\d+)", output)
-        if match:
-            return match.group(1)
-    except Exception as e:
-        printf(f"Could not read existing ChromeDriver version: {e}")
-    return None
-
-
-def remove_existing_chromedriver(drivers_dir, chromedriver_dirname, chromedriver_path):
-    """Removes previously downloaded chromedriver files to avoid stale binary usage."""
-    try:
-        extracted_dir = os.path.join(drivers_dir, chromedriver_dirname)
-        if os.path.isdir(extracted_dir):
-            shutil.rmtree(extracted_dir, ignore_errors=True)
-        if os.path.isfile(chromedriver_path):
-            os.remove(chromedriver_path)
-    except Exception as e:
-        printf(f"Warning: failed to remove old ChromeDriver files cleanly: {e}")
-
-
 def get_chromedriver_dirname():
     os_name = platform.system()
     machine = platform.machine().lower()
@@ -0,0 +1,198 @@
+import json
+import math
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+import allure
+from allure_commons.types import AttachmentType
+
+from utils.logger import printf
+from utils.ui.config_reader import is_command_profiling_enabled
+
+PAGES_DIR = os.path.join("features", "pages")
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def summarize(durations):
+    return {
+        "count": len(durations),
+        "total": round(sum(durations), 4),
+        "p50": round(percentile(durations, 50), 4),
+        "p95": round(percentile(durations, 95), 4),
+        "max": round(max(durations), 4) if durations else 0.0,
+    }
+
+
+class _CommandStats:
+    """Latency samples grouped by command, call site and step."""
+
+    def __init__(self):
+        self.by_command = {}
+        self.by_call_site = {}
+        self.by_step = {}
+        self.step_wall_time = {}
+
+    def add(self, command, call_site, step, duration):
+        self.by_command.setdefault(command, []).append(duration)
+        self.by_call_site.setdefault(call_site, []).append(duration)
+        self.by_step.setdefault(step, []).append(duration)
+
+    def to_dict(self):
+        total = [d for durations in self.by_command.values() for d in durations]
+        steps = {}
+        for step, durations in self.by_step.items():
+            entry = summarize(durations)
+            wall_time = self.step_wall_time.get(step)
+            if wall_time is not None:
+                entry["wall_time"] = round(wall_time, 4)
+                # Time spent outside WebDriver commands: Python-side sleeps, waits between polls, test logic
+                entry["non_command_time"] = round(max(0.0, wall_time - entry["total"]), 4)
+            steps[step] = entry
+        return {
+            "total_commands": len(total),
+            "total_command_time": round(sum(total), 4),
+            "by_command": {k: summarize(v) for k, v in sorted(self.by_command.items())},
+            "by_call_site": {k: summarize(v) for k, v in
+                             sorted(self.by_call_site.items(), key=lambda kv: -sum(kv[1]))},
+            "by_step": steps,
+        }
+
+
+class CommandProfiler:
+    """
+    Optional WebDriver command latency instrumentation.
+
+    Wraps each driver's command executor so every remote command is timed and attributed to the active
+    Behave step and the calling page-object method. Produces a per-run JSON profile (one file per worker
+    process) and a per-scenario Allure attachment. Enabled with PROFILE_WEBDRIVER_COMMANDS=true or
+    [Profiling] webdriver_commands = true.
+    """
+
+    PROFILE_DIR = "Reports/profiles"
+
+    _lock = threading.Lock()
+    _run_stats = _CommandStats()
+    _scenario_stats = _CommandStats()
+    _current_step = "<outside steps>"
+    _step_started_at = None
+    _started_at = datetime.now().isoformat()
+
+    @staticmethod
+    def is_enabled():
+        return is_command_profiling_enabled()
+
+    @staticmethod
+    def instrument(driver):
+        """Wrap driver.command_executor.execute once; later calls are no-ops."""
+        executor = driver.command_executor
+        if getattr(executor, "_hbox_profiled", False):
+            return driver
+        original_execute = executor.execute
+
+        def timed_execute(command, params):
+            start = time.perf_counter()
+            try:
+                return original_execute(command, params)
+            finally:
+                CommandProfiler.record(command, time.perf_counter() - start, CommandProfiler._call_site())
+
+        executor.execute = timed_execute
+        executor._hbox_profiled = True
+        printf("CommandProfiler: WebDriver command timing enabled for driver")
+        return driver
+
+    @staticmethod
+    def _call_site():
+        """
+        Describe the page-object frames on the stack as 'OuterPage.method > BasePage.primitive'
+        (outermost page method that started the action, innermost one that issued the command).
+        """
+        frame = sys._getframe(2)
+        page_frames = []
+        while frame is not None:
+            if PAGES_DIR in frame.f_code.co_filename:
+                owner = frame.f_locals.get("self")
+                name = f"{type(owner).__name__}.{frame.f_code.co_name}" if owner is not None \
+                    else frame.f_code.co_name
+                page_frames.append(name)
+            frame = frame.f_back
+        if not page_frames:
+            return "<outside page objects>"
+        inner, outer = page_frames[0], page_frames[-1]
+        return outer if inner == outer else f"{outer} > {inner}"
+
+    @staticmethod
+    def record(command, duration, call_site):
+        with CommandProfiler._lock:
+            step = CommandProfiler._current_step
+            CommandProfiler._run_stats.add(command, call_site, step, duration)
+            CommandProfiler._scenario_stats.add(command, call_site, step, duration)
+
+    # -------------------- Behave Hook Integration --------------------
+
+    @staticmethod
+    def start_scenario():
+        with CommandProfiler._lock:
+            CommandProfiler._scenario_stats = _CommandStats()
+
+    @staticmethod
+    def start_step(step):
+        with CommandProfiler._lock:
+            CommandProfiler._current_step = f"{step.keyword} {step.name}"
+            CommandProfiler._step_started_at = time.perf_counter()
+
+    @staticmethod
+    def end_step():
+        with CommandProfiler._lock:
+            if CommandProfiler._step_started_at is not None:
+                wall_time = time.perf_counter() - CommandProfiler._step_started_at
+                step = CommandProfiler._current_step
+                for stats in (CommandProfiler._run_stats, CommandProfiler._scenario_stats):
+                    stats.step_wall_time[step] = stats.step_wall_time.get(step, 0.0) + wall_time
+            CommandProfiler._current_step = "<outside steps>"
+            CommandProfiler._step_started_at = None
+
+    @staticmethod
+    def attach_scenario_profile(scenario):
+        """Attach the scenario's command breakdown to the Allure report."""
+        with CommandProfiler._lock:
+            profile = CommandProfiler._scenario_stats.to_dict()
+        if not profile["total_commands"]:
+            return
+        try:
+            allure.attach(json.dumps(profile, indent=2), name=f"webdriver_commands_{scenario.name}",
+                          attachment_type=AttachmentType.JSON)
+        except Exception as e:
+            printf(f"CommandProfiler: failed to attach scenario profile: {e}")
+
+    @staticmethod
+    def write_run_profile():
+        """Write the run-wide profile to Reports/profiles/webdriver-commands-<pid>.json and return its path."""
+        with CommandProfiler._lock:
+            profile = CommandProfiler._run_stats.to_dict()
+        if not profile["total_commands"]:
+            return None
+        profile.update({"pid": os.getpid(), "started_at": CommandProfiler._started_at,
+                        "finished_at": datetime.now().isoformat()})
+        try:
+            os.makedirs(CommandProfiler.PROFILE_DIR, exist_ok=True)
+            path = os.path.join(CommandProfiler.PROFILE_DIR, f"webdriver-commands-{os.getpid()}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(profile, f, indent=2)
+            printf(f"CommandProfiler: {profile['total_commands']} commands, "
+                   f"{profile['total_command_time']:.2f}s total - profile written to {path}")
+            return path
+        except Exception as e:
+            printf(f"CommandProfiler: failed to write run profile: {e}")
+            return None
@@ -1,11 +1,144 @@
 from configparser import ConfigParser
 import os
+import tempfile
+import threading
+from datetime import datetime
+
+CONFIG_PATH = "configuration/config.ini"
+_TRUE_VALUES = ("true", "1", "yes")
+
+
+class Settings:
+    """
+    Process-wide view of configuration/config.ini, parsed once and shared by every caller.
+
+    The file is read on first use (Settings.get()) and cached; Settings.reload() re-reads it explicitly.
+    Environment variable overrides are not cached - the module-level getters below still check them on
+    every call, so env > config > default precedence is unchanged.
+
+    Each BehaveX worker process holds its own read-only copy: the instance is never mutated after
+    loading, so a copy inherited through fork is safe, and the lock is re-created in forked children.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, path=CONFIG_PATH):
+        self.path = path
+        self._parser = ConfigParser()
+        self._parser.read(path)
+
+    @classmethod
+    def get(cls):
+        """Return the shared Settings instance, loading config.ini on first use."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reload(cls, path=CONFIG_PATH):
+        """Re-read config.ini (e.g. after the file was injected or edited) and return the new instance."""
+        with cls._lock:
+            cls._instance = cls(path)
+        return cls._instance
+
+    @classmethod
+    def _reset_lock_after_fork(cls):
+        cls._lock = threading.Lock()
+
+    # -------------------- Raw / Typed Access --------------------
+
+    def get_value(self, section, key, fallback=None):
+        """Return a raw string value; raises NoSectionError/NoOptionError when missing and no fallback given."""
+        if fallback is None:
+            return self._parser.get(section, key)
+        return self._parser.get(section, key, fallback=fallback)
+
+    def get_bool(self, section, key, fallback=False):
+        value = self._parser.get(section, key, fallback=None)
+        if value is None or value.strip() == "":
+            return fallback
+        return value.strip().lower() in _TRUE_VALUES
+
+    def get_int(self, section, key, fallback=0):
+        try:
+            return int(self._parser.get(section, key))
+        except Exception:
+            return fallback
+
+    # -------------------- Selenoid --------------------
+
+    @property
+    def selenoid_url(self):
+        return self._parser.get("Selenoid", "selenoid_url", fallback="")
+
+    @property
+    def selenoid_enable_vnc(self):
+        return self.get_bool("Selenoid", "enable_vnc")
+
+    @property
+    def selenoid_enable_video(self):
+        return self.get_bool("Selenoid", "enable_video")
+
+    @property
+    def selenoid_enable_log(self):
+        return self.get_bool("Selenoid", "enable_log")
+
+    @property
+    def selenoid_session_timeout(self):
+        return self._parser.get("Selenoid", "session_timeout", fallback="") or "300s"
+
+    # -------------------- Credentials --------------------
+
+    def get_username(self, user_role):
+        """Username for a role, e.g. 'enroller_admin' -> [Credentials] enroller_admin_user_name."""
+        return self._parser.get("Credentials", f"{user_role}_user_name")
+
+    def get_password(self, environment):
+        """Common password for an environment, e.g. 'stg' -> [Credentials] common_stg_password."""
+        return self._parser.get("Credentials", f"common_{environment}_password")
+
+    # -------------------- Environments --------------------
+
+    def get_env_url(self, environment):
+        """Base URL for an environment, e.g. 'stg' -> [stg_env] url."""
+        return self._parser.get(f"{environment}_env", "url")
+
+    # -------------------- Logging --------------------
+
+    @property
+    def log_to_file(self):
+        return self.get_bool("Logging", "log_to_file", fallback=False)
+
+    @property
+    def log_file_path(self):
+        return self._parser.get("Logging", "log_file_path", fallback="") or "logs/automation.log"
+
+    @property
+    def log_to_console(self):
+        return self.get_bool("Logging", "log_to_console", fallback=True)
+
+    @property
+    def log_level(self):
+        return self._parser.get("Logging", "log_level", fallback="") or "INFO"
+
+    @property
+    def json_log(self):
+        return self.get_bool("Logging", "json_log", fallback=True)
+
+    @property
+    def json_log_dir(self):
+        return self._parser.get("Logging", "json_log_dir", fallback="") or "logs/workers"
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=Settings._reset_lock_after_fork)
 
 
 def read_configuration(category, key):
-    config = ConfigParser()
-    config.read("configuration/config.ini")
-    return config.get(category, key)
+    return Settings.get().get_value(category, key)
 
 
 def is_allure_enabled():
@@ -13,6 +146,74 @@ def is_allure_enabled():
     return os.getenv('DISABLE_ALLURE_REPORTS', 'false').lower() != 'true'
 
 
+def get_cumulative_retention_config():
+    """
+    Retention for Reports/cumulative-results (AllureHelper.compact_cumulative_results).
+    Priority: env var > config > default
+    Returns: dict with keep_last (results per test, 0 = all) and max_age_days (0 = no time window)
+    """
+    settings = Settings.get()
+    try:
+        keep_last = int(os.getenv('CUMULATIVE_KEEP_LAST') or
+                        settings.get_int("Reports", "cumulative_keep_last", fallback=20))
+        max_age_days = int(os.getenv('CUMULATIVE_MAX_AGE_DAYS') or
+                           settings.get_int("Reports", "cumulative_max_age_days", fallback=0))
+    except ValueError:
+        keep_last, max_age_days = 20, 0
+    return {"keep_last": max(0, keep_last), "max_age_days": max(0, max_age_days)}
+
+
+def get_parallel_plan_config():
+    """
+    Duration estimates used by utils.ui.parallel_planner to split a run across BehaveX processes.
+    Priority: env var > config > default
+    Returns: dict with history_runs (recent runs per scenario), default_seconds (scenarios without history)
+             and feature_overhead_seconds (hooks, browser start and login per feature file and process)
+    """
+    settings = Settings.get()
+    try:
+        default_seconds = float(os.getenv('PARALLEL_PLAN_DEFAULT_SECONDS') or
+                                settings.get_value("ParallelPlan", "default_scenario_seconds", fallback="60"))
+        overhead = float(os.getenv('PARALLEL_PLAN_FEATURE_OVERHEAD') or
+                         settings.get_value("ParallelPlan", "feature_overhead_seconds", fallback="20"))
+    except ValueError:
+        default_seconds, overhead = 60.0, 20.0
+    return {
+        "history_runs": max(1, settings.get_int("ParallelPlan", "history_runs", fallback=5)),
+        "default_seconds": default_seconds,
+        "feature_overhead_seconds": overhead,
+    }
+
+
+def get_failure_screenshot_config():
+    """
+    Failure screenshots attached by AllureHelper.attach_failure.
+    Priority: env var > config > default
+    Returns: dict with format (jpeg, webp or png), max_width (px), quality (1-95), max_bytes and element_screenshots
+    """
+    settings = Settings.get()
+    image_format = (os.getenv('SCREENSHOT_FORMAT') or
+                    settings.get_value("Screenshots", "format", fallback="jpeg")).lower()
+    if image_format not in ("jpeg", "webp", "png"):
+        image_format = "jpeg"
+    try:
+        max_kb = int(os.getenv('SCREENSHOT_MAX_KB') or settings.get_int("Screenshots", "max_kb", fallback=300))
+    except ValueError:
+        max_kb = 300
+    element = os.getenv('SCREENSHOT_ELEMENT', '').lower()
+    if element in ['true', 'false']:
+        element = element == 'true'
+    else:
+        element = settings.get_bool("Screenshots", "element_screenshots", fallback=True)
+    return {
+        "format": image_format,
+        "max_width": settings.get_int("Screenshots", "max_width", fallback=1280),
+        "quality": min(95, max(1, settings.get_int("Screenshots", "quality", fallback=70))),
+        "max_bytes": max_kb * 1024,
+        "element_screenshots": element,
+    }
+
+
 def get_ci_environment():
     """Get the CI environment type"""
     return os.getenv('CI_ENVIRONMENT', 'stg')
@@ -88,32 +289,328 @@ def is_running_in_pipeline():
 
 def get_selenoid_url():
     """Determine the correct Selenoid URL based on environment"""
-    return os.getenv('SELENOID_URL',
-                     read_configuration("Selenoid", "selenoid_url") or 'http://localhost:4444/wd/hub')
+    return os.getenv('SELENOID_URL', Settings.get().selenoid_url or 'http://localhost:4444/wd/hub')
+
+
+def get_chromedriver_cache_config():
+    """
+    Shared ChromeDriver cache used by utils.ui.chromedriver_setup.
+    Priority: env var > config > default
+    Returns: dict with cache_dir and offline (only use drivers already in the cache)
+    """
+    settings = Settings.get()
+    offline = os.getenv('CHROMEDRIVER_OFFLINE', '').lower()
+    if offline in ['true', 'false']:
+        offline = offline == 'true'
+    else:
+        offline = settings.get_bool("ChromeDriver", "offline", fallback=False)
+    return {
+        "cache_dir": os.getenv('CHROMEDRIVER_CACHE_DIR') or
+                     settings.get_value("ChromeDriver", "cache_dir", fallback=os.path.join("drivers", "cache")),
+        "offline": offline,
+    }
+
+
+def get_lean_profile_config():
+    """
+    Lean browser profile (utils.ui.lean_profile): block fonts/media/analytics via CDP, optionally images.
+    Priority: env var > config > default (disabled)
+    Returns: dict with enabled, block_images, blocked_url_patterns (list, empty for the built-in defaults) and
+    record_page_loads (PageLoadStats samples: on with the lean profile, or for a full-profile baseline run)
+    """
+    settings = Settings.get()
+    enabled = os.getenv('LEAN_BROWSER_PROFILE', '').lower()
+    if enabled in ['true', 'false']:
+        enabled = enabled == 'true'
+    else:
+        enabled = settings.get_bool("LeanProfile", "enabled", fallback=False)
+    record_page_loads = os.getenv('LEAN_PROFILE_RECORD_LOADS', '').lower()
+    if record_page_loads in ['true', 'false']:
+        record_page_loads = record_page_loads == 'true'
+    else:
+        record_page_loads = settings.get_bool("LeanProfile", "record_page_loads", fallback=False)
+    patterns = settings.get_value("LeanProfile", "blocked_url_patterns", fallback="")
+    return {
+        "enabled": enabled,
+        "record_page_loads": enabled or record_page_loads,
+        "block_images": settings.get_bool("LeanProfile", "block_images", fallback=False),
+        "blocked_url_patterns": [p.strip() for p in patterns.split(",") if p.strip()],
+    }
+
+
+def get_chrome_profile_config():
+    """
+    Local Chrome profile lifecycle (utils.ui.chrome_profiles).
+    Priority: env var > config > default
+    Returns: dict with root_dir, use_template and template_max_age_hours
+    """
+    settings = Settings.get()
+    use_template = os.getenv('CHROME_PROFILE_TEMPLATE', '').lower()
+    if use_template in ['true', 'false']:
+        use_template = use_template == 'true'
+    else:
+        use_template = settings.get_bool("ChromeProfiles", "use_template", fallback=True)
+    return {
+        "root_dir": os.getenv('CHROME_PROFILE_ROOT') or
+                    settings.get_value("ChromeProfiles", "root_dir", fallback="") or
+                    os.path.join(tempfile.gettempdir(), "hbox-chrome-profiles"),
+        "use_template": use_template,
+        "template_max_age_hours": settings.get_int("ChromeProfiles", "template_max_age_hours", fallback=168),
+    }
+
+
+def get_page_perf_config():
+    """
+    Page-load performance capture (utils.ui.page_perf).
+    Priority: env var > config > default (disabled)
+    Returns: dict with enabled, build_id, baseline_builds, history_size, regression_threshold_pct, min_regression_ms
+    """
+    settings = Settings.get()
+    enabled = os.getenv('PAGE_PERF_CAPTURE', '').lower()
+    if enabled in ['true', 'false']:
+        enabled = enabled == 'true'
+    else:
+        enabled = settings.get_bool("PagePerf", "enabled", fallback=False)
+    # Workers of one BehaveX run share the parent process, so its pid groups them into one local build
+    build_id = os.getenv('PAGE_PERF_BUILD_ID') or os.getenv('BUILD_NUMBER') or \
+        f"local-{os.getppid()}-{datetime.now():%Y%m%d}"
+    return {
+        "enabled": enabled,
+        "build_id": build_id,
+        "baseline_builds": settings.get_int("PagePerf", "baseline_builds", fallback=5),
+        "history_size": settings.get_int("PagePerf", "history_size", fallback=30),
+        "regression_threshold_pct": settings.get_int("PagePerf", "regression_threshold_pct", fallback=20),
+        "min_regression_ms": settings.get_int("PagePerf", "min_regression_ms", fallback=200),
+    }
 
 
 def get_log_to_file():
     """Check if logging to file is enabled"""
-    try:
-        return read_configuration("Logging", "log_to_file").lower() == 'true'
-    except Exception as e:
-        printf(f"Error reading log_to_file from config: {e}")
-        return False
+    return Settings.get().log_to_file
 
 
 def get_log_file_path():
     """Get the log file path"""
-    try:
-        return read_configuration("Logging", "log_file_path")
-    except Exception as e:
-        printf(f"Error reading log_file_path from config: {e}")
-        return "logs/automation.log"
+    return Settings.get().log_file_path
 
 
 def get_log_to_console():
     """Check if logging to console is enabled"""
+    return Settings.get().log_to_console
+
+
+def get_log_level():
+    """
+    Minimum level written by utils.logger (DEBUG, INFO or WARNING).
+    Priority: env var > config > default (INFO)
+    """
+    level = (os.getenv('LOG_LEVEL') or Settings.get().log_level).upper()
+    if level == "WARN":
+        level = "WARNING"
+    return level if level in ("DEBUG", "INFO", "WARNING") else "INFO"
+
+
+def get_json_log_config():
+    """
+    Per-worker JSON-lines log (one file per process, merged with utils.log_merge).
+    Priority: env var > config > default
+    Returns: dict with enabled and dir
+    """
+    settings = Settings.get()
+    enabled = os.getenv('LOG_JSON', '').lower()
+    return {
+        "enabled": enabled == 'true' if enabled in ['true', 'false'] else settings.json_log,
+        "dir": os.getenv('LOG_JSON_DIR') or settings.json_log_dir,
+    }
+
+
+def get_loader_wait_mode():
+    """
+    Strategy used by BasePage.wait_for_loader.
+    Priority: env var > config > default
+    Returns: 'observer' (in-page MutationObserver, single round trip) or 'polling' (find_element loop)
+    """
+    wait_mode = os.getenv('LOADER_WAIT_MODE', '').lower()
+    if wait_mode in ['observer', 'polling']:
+        return wait_mode
+
     try:
-        return read_configuration("Logging", "log_to_console").lower() == 'true'
-    except Exception as e:
-        printf(f"Error reading log_to_console from config: {e}")
-        return True
\ No newline at end of file
+        wait_mode = read_configuration("Waits", "loader_wait_mode").lower()
+        if wait_mode in ['observer', 'polling']:
+            return wait_mode
+    except Exception:
+        pass
+    return 'observer'
+
+
+def get_dom_quiet_window_ms():
+    """
+    Quiet window (ms) BasePage.wait_for_dom_stability requires with no in-flight requests and no DOM mutations.
+    Priority: env var > config > default
+    """
+    try:
+        return int(os.getenv('DOM_QUIET_WINDOW_MS') or read_configuration("Waits", "dom_quiet_window_ms"))
+    except Exception:
+        return 300
+
+
+def is_network_events_enabled():
+    """
+    Check if Chrome sessions should expose CDP Network events (performance log) for
+    BasePage.wait_for_api_response.
+    Priority: env var > config > default (disabled)
+    """
+    events = os.getenv('API_RESPONSE_EVENTS', '').lower()
+    if events in ['true', 'false']:
+        return events == 'true'
+    return Settings.get().get_bool("Waits", "api_response_events", fallback=False)
+
+
+def get_browser_console_config():
+    """
+    Browser console capture for failed scenarios (utils.ui.browser_console).
+    Priority: env var > config > default (enabled)
+    Returns: dict with enabled, buffer_size (entries kept per driver) and min_level (ALL, DEBUG, INFO, WARNING, SEVERE)
+    """
+    settings = Settings.get()
+    enabled = os.getenv('BROWSER_CONSOLE_CAPTURE', '').lower()
+    if enabled in ['true', 'false']:
+        enabled = enabled == 'true'
+    else:
+        enabled = settings.get_bool("BrowserConsole", "enabled", fallback=True)
+    min_level = (settings.get_value("BrowserConsole", "min_level", fallback="INFO") or "INFO").upper()
+    return {
+        "enabled": enabled,
+        "buffer_size": max(1, settings.get_int("BrowserConsole", "buffer_size", fallback=200)),
+        "min_level": min_level if min_level in ("ALL", "DEBUG", "INFO", "WARNING", "SEVERE") else "INFO",
+    }
+
+
+def is_session_reuse_enabled():
+    """
+    Check if authenticated sessions may be cached per role and restored instead of logging in through the UI.
+    Priority: env var > config > default (enabled)
+    """
+    reuse = os.getenv('REUSE_LOGIN_SESSION', '').lower()
+    if reuse in ['true', 'false']:
+        return reuse == 'true'
+    return Settings.get().get_bool("Session", "reuse_login_session", fallback=True)
+
+
+def get_session_max_age():
+    """Maximum age (seconds) of a cached login session before a fresh UI login is forced."""
+    try:
+        return int(os.getenv('SESSION_MAX_AGE_SECONDS') or Settings.get().get_value("Session", "max_age_seconds"))
+    except Exception:
+        return 1800
+
+
+def get_login_broker_config():
+    """
+    Cross-process login broker shared by the BehaveX workers of one run (utils.ui.login_broker).
+    Priority: env var > config > default (enabled; only used when session reuse is enabled)
+    Returns: dict with enabled, run_dir (broker directory of this run) and wait_timeout (seconds)
+    """
+    settings = Settings.get()
+    enabled = os.getenv('LOGIN_BROKER', '').lower()
+    if enabled in ['true', 'false']:
+        enabled = enabled == 'true'
+    else:
+        enabled = settings.get_bool("Session", "login_broker", fallback=True)
+    root_dir = os.getenv('LOGIN_BROKER_DIR') or settings.get_value("Session", "login_broker_dir") or \
+        os.path.join(tempfile.gettempdir(), "hbox-login-broker")
+    # BehaveX workers are children of the same behavex process, so its pid identifies a local run
+    run_id = os.getenv('LOGIN_BROKER_RUN_ID') or os.getenv('BUILD_TAG') or os.getenv('BUILD_NUMBER') or \
+        f"local-{os.getppid()}"
+    return {
+        "enabled": enabled and is_session_reuse_enabled(),
+        "root_dir": root_dir,
+        "run_dir": os.path.join(root_dir, run_id),
+        "wait_timeout": settings.get_int("Session", "login_broker_timeout_seconds", fallback=180),
+    }
+
+
+def is_session_recovery_enabled():
+    """
+    Check if drivers whose browser session died should be recreated, re-authenticated and the failed step retried.
+    Priority: env var > config > default (enabled)
+    """
+    recovery = os.getenv('SESSION_RECOVERY', '').lower()
+    if recovery in ['true', 'false']:
+        return recovery == 'true'
+    return Settings.get().get_bool("Session", "recover_lost_sessions", fallback=True)
+
+
+def is_driver_pool_enabled():
+    """
+    Check if DriverManager should keep warm browser sessions and reuse them across features.
+    Priority: env var > config > default (disabled)
+    """
+    pool_enabled = os.getenv('DRIVER_POOL_ENABLED', '').lower()
+    if pool_enabled in ['true', 'false']:
+        return pool_enabled == 'true'
+    return Settings.get().get_bool("DriverPool", "enabled", fallback=False)
+
+
+def get_driver_pool_config():
+    """
+    Pool sizing for DriverManager.
+    Returns: dict with size (warm sessions per browser), max_reuse and idle_timeout (seconds)
+    """
+    settings = Settings.get()
+    try:
+        size = int(os.getenv('DRIVER_POOL_SIZE') or settings.get_int("DriverPool", "size", fallback=2))
+    except ValueError:
+        size = 2
+    return {
+        "size": size,
+        "max_reuse": settings.get_int("DriverPool", "max_reuse", fallback=10),
+        # Keep below Selenoid session_timeout so pooled remote sessions are not killed while idle
+        "idle_timeout": settings.get_int("DriverPool", "idle_timeout_seconds", fallback=240),
+    }
+
+
+def get_selenoid_scheduler_config():
+    """
+    Slot queueing for remote sessions (see utils.ui.selenoid_scheduler).
+    Returns: dict with slot_timeout (seconds to wait for a free slot), status_cache_ttl and max_backoff (seconds)
+    """
+    settings = Settings.get()
+    try:
+        slot_timeout = int(os.getenv('SELENOID_SLOT_TIMEOUT') or
+                           settings.get_int("Selenoid", "slot_timeout_seconds", fallback=300))
+    except ValueError:
+        slot_timeout = 300
+    return {
+        "slot_timeout": slot_timeout,
+        "status_cache_ttl": float(settings.get_value("Selenoid", "status_cache_ttl_seconds", fallback="1.0")),
+        "max_backoff": float(settings.get_value("Selenoid", "max_backoff_seconds", fallback="5.0")),
+    }
+
+
+def is_command_profiling_enabled():
+    """
+    Check if WebDriver command latency should be recorded per step and page-object method.
+    Priority: env var > config > default (disabled)
+    """
+    profiling = os.getenv('PROFILE_WEBDRIVER_COMMANDS', '').lower()
+    if profiling in ['true', 'false']:
+        return profiling == 'true'
+    return Settings.get().get_bool("Profiling", "webdriver_commands", fallback=False)
+
+
+def get_sleep_budget():
+    """
+    Per-scenario budget for fixed delays issued through utils.ui.sleep_tracker.pause.
+    Priority: env var > config > default (no budget)
+    Returns: (budget_seconds or None, action) where action is 'warn' or 'fail'
+    """
+    settings = Settings.get()
+    try:
+        budget = float(os.getenv('SLEEP_BUDGET_SECONDS') or
+                       settings.get_value("Profiling", "sleep_budget_seconds", fallback="0"))
+    except ValueError:
+        budget = 0.0
+    action = (os.getenv('SLEEP_BUDGET_ACTION') or
+              settings.get_value("Profiling", "sleep_budget_action", fallback="warn")).lower()
+    return (budget or None), ('fail' if action == 'fail' else 'warn')
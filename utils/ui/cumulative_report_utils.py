@@ -1,29 +1,70 @@
 #!/usr/bin/env python3
 """
 Utility script for managing cumulative Allure reports locally.
-Provides commands to clear cumulative results and generate reports.
+Provides commands to clear, compact and inspect cumulative results and generate reports.
 """
 
+import argparse
 import sys
 import os
 from utils.logger import printf
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.ui.allure_helper import AllureHelper
+from utils.ui.result_analytics import ResultAnalytics
+from utils.ui.run_summary import RunSummary
 
 def main():
     if len(sys.argv) < 2:
         printf("Usage: python cumulative_report_utils.py <command>")
         printf("Commands:")
+        printf("  analytics - Flakiness/duration analytics of cumulative results [--top N] [--min-runs N]")
         printf("  clear    - Clear cumulative results")
+        printf("  compact  - Apply the retention policy [--keep N] [--days D] [--dry-run]")
         printf("  generate - Generate cumulative report")
         printf("  status   - Show cumulative results status")
+        printf("  summary  - Quick HTML/Markdown/JSON run summary without the Allure CLI "
+               "[--dir D] [--top N] [--format F] [--all]")
         return
 
     command = sys.argv[1].lower()
 
-    if command == "clear":
+    if command == "analytics":
+        parser = argparse.ArgumentParser(prog="cumulative_report_utils.py analytics")
+        parser.add_argument("--dir", default=ResultAnalytics.CUMULATIVE_DIR, help="cumulative results directory")
+        parser.add_argument("--output", default=ResultAnalytics.OUTPUT_FILE, help="JSON report path")
+        parser.add_argument("--top", type=int, default=10, help="scenarios per ranking")
+        parser.add_argument("--min-runs", type=int, default=1, help="ignore scenarios with fewer runs")
+        args = parser.parse_args(sys.argv[2:])
+        if not os.path.isdir(args.dir):
+            printf(f"Cumulative results directory {args.dir} does not exist")
+            sys.exit(1)
+        report = ResultAnalytics.run(args.dir, args.output, args.top, max(1, args.min_runs))
+        if report is None:
+            sys.exit(1)
+        printf("Most flaky (flips / runs, pass rate):")
+        for s in report["most_flaky"]:
+            printf(f"  {s['flips']:>3} / {s['runs']:<4} {s['pass_rate']:>5}%  {s['name']}")
+        printf("Slowest (p95, mean, trend):")
+        for s in report["slowest"]:
+            trend = f"{s['trend_pct']:+.1f}%" if s["trend_pct"] is not None else "-"
+            printf(f"  {s['p95_ms'] / 1000:>7.1f}s {s['mean_ms'] / 1000:>7.1f}s {trend:>8}  {s['name']}")
+        printf("By feature folder (pass rate, flaky scenarios, p95):")
+        for folder, g in report["folders"].items():
+            p95 = f"{g['p95_ms'] / 1000:.1f}s" if g["p95_ms"] is not None else "-"
+            printf(f"  {g['pass_rate']:>5}% {g['flaky_scenarios']:>3}/{g['scenarios']:<3} {p95:>8}  {folder}")
+    elif command == "clear":
         AllureHelper.clear_cumulative_results()
+    elif command == "compact":
+        parser = argparse.ArgumentParser(prog="cumulative_report_utils.py compact")
+        parser.add_argument("--keep", type=int, default=None,
+                            help="results to keep per test (default: CUMULATIVE_KEEP_LAST / config.ini)")
+        parser.add_argument("--days", type=int, default=None,
+                            help="drop results older than this many days (default: CUMULATIVE_MAX_AGE_DAYS)")
+        parser.add_argument("--dry-run", action="store_true", help="only report what would be removed")
+        args = parser.parse_args(sys.argv[2:])
+        if AllureHelper.compact_cumulative_results(args.keep, args.days, args.dry_run) is None:
+            sys.exit(1)
     elif command == "generate":
         AllureHelper.generate_cumulative_report()
     elif command == "status":
@@ -37,6 +78,24 @@ def main():
                     printf(f"  {f}")
         else:
             printf("Cumulative results directory does not exist")
+    elif command == "summary":
+        parser = argparse.ArgumentParser(prog="cumulative_report_utils.py summary")
+        parser.add_argument("--dir", default="Reports/features", help="Allure results directory")
+        parser.add_argument("--top", type=int, default=10, help="number of slowest scenarios to list")
+        parser.add_argument("--format", action="append", choices=RunSummary.FORMATS,
+                            help="output format, repeatable (default: all)")
+        parser.add_argument("--all", action="store_true",
+                            help="count every result file instead of the latest result per test")
+        args = parser.parse_args(sys.argv[2:])
+        if not os.path.isdir(args.dir):
+            printf(f"Results directory {args.dir} does not exist")
+            sys.exit(1)
+        summary = RunSummary.build(args.dir, latest_only=not args.all, top=args.top)
+        totals = summary["totals"]
+        printf(f"{totals['total']} tests: {totals['passed']} passed, {totals['failed']} failed, "
+               f"{totals['broken']} broken, {totals['skipped']} skipped")
+        for path in RunSummary.write(summary, formats=args.format or RunSummary.FORMATS):
+            printf(f"  {path}")
     else:
         printf(f"Unknown command: {command}")
 
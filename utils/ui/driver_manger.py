@@ -1,9 +1,17 @@
 # python
+import threading
+import time
 from enum import Enum
 from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 from utils.ui.webdriver_helper import WebDriverHelper
+from utils.ui.driver_pool import DriverPool
+from utils.ui.chrome_profiles import ChromeProfileManager
+from utils.ui.command_profiler import CommandProfiler
+from utils.ui.lean_profile import LeanProfile
+from utils.ui.session_watchdog import SessionWatchdog
 from utils.logger import printf
-from utils.ui.config_reader import get_driver_mode, get_execution_mode
+from utils.ui.config_reader import get_driver_mode, get_execution_mode, is_driver_pool_enabled, \
+    get_driver_pool_config
 
 
 class DriverRole(Enum):
@@ -20,16 +28,33 @@ class DriverRole(Enum):
 class DriverManager:
     def __init__(self):
         self.drivers = {}
+        # Drivers for different roles may be created concurrently (LoginHelper.provision_parallel_roles)
+        self._lock = threading.RLock()
         self.execution_mode = get_execution_mode()
         self.driver_mode = get_driver_mode()
+        # Local Chrome profiles: cloned from a template, deleted on quit, orphans of dead runs swept here
+        self.profiles = ChromeProfileManager()
+        self.profiles.sweep_orphans()
+        self._chrome_profiles = {}  # id(driver) -> ChromeProfile
+        self.pool = DriverPool(**get_driver_pool_config(), on_discard=self._release_profile) \
+            if is_driver_pool_enabled() else None
 
     def create_driver(self, browser_name, session_name, context, role=DriverRole.DEFAULT, selenoid_url=None):
         """
         Create and add a driver for the specified browser and role.
         Uses smart detection based on execution_mode and driver_mode.
+        In pooled mode a warm session is reused when one is available.
         """
         printf(f"Execution Mode: {self.execution_mode}, Driver Mode: {self.driver_mode}")
 
+        pool_key = LeanProfile.pool_key(browser_name, context)
+        if self.pool:
+            self.pool.evict_idle()
+            driver = self.pool.acquire(pool_key)
+            if driver:
+                self.add_driver(role, driver)
+                return driver
+
         if self.driver_mode == 'remote':
             driver, temp_dir = WebDriverHelper.create_remote_driver(browser_name, session_name, context, selenoid_url)
             printf(f"Created remote driver for {browser_name} via Selenoid")
@@ -37,7 +62,7 @@ class DriverManager:
             # Only download ChromeDriver if we're in local execution mode and need local driver
             if self.execution_mode == 'local':
                 WebDriverHelper.setup_webdriver(context)
-                driver, temp_dir = WebDriverHelper.create_driver(browser_name, context)
+                driver, temp_dir = self._create_local_driver(browser_name, context)
                 printf(f"Created local driver for {browser_name}")
             else:
                 # CI/CD with local driver - try remote first, fallback to local
@@ -47,15 +72,37 @@ class DriverManager:
                     printf(f"Created remote driver for {browser_name} via Selenoid (CI/CD)")
                 except Exception as e:
                     printf(f"Remote driver failed, falling back to local: {e}")
-                    driver, temp_dir = WebDriverHelper.create_driver(browser_name, context)
+                    driver, temp_dir = self._create_local_driver(browser_name, context)
                     printf(f"Created local driver for {browser_name} (CI/CD fallback)")
 
+        if self.pool:
+            self.pool.track(driver, pool_key, temp_dir)
         self.add_driver(role, driver)
-        if temp_dir:
-            # Store temp_dir for cleanup, but since quit_driver handles it, maybe not needed
-            pass
         return driver
 
+    def _create_local_driver(self, browser_name, context):
+        """Create a local driver; Chrome gets a managed profile that is deleted when the driver quits."""
+        profile = None
+        if browser_name.lower() == "chrome":
+            profile = self.profiles.create(lambda path: WebDriverHelper.build_profile_template(context, path))
+        started = time.monotonic()
+        try:
+            driver, temp_dir = WebDriverHelper.create_driver(browser_name, context,
+                                                            profile.path if profile else None)
+        except Exception:
+            self.profiles.release(profile)
+            raise
+        if profile:
+            self.profiles.record_startup(time.monotonic() - started)
+            with self._lock:
+                self._chrome_profiles[id(driver)] = profile
+        return driver, temp_dir
+
+    def _release_profile(self, driver):
+        with self._lock:
+            profile = self._chrome_profiles.pop(id(driver), None)
+        self.profiles.release(profile)
+
     def create_remote_driver(self, browser_name, context, role=DriverRole.DEFAULT, selenoid_url=None):
         """
         Create and add a remote driver for Selenoid for the specified browser and role.
@@ -76,10 +123,15 @@ class DriverManager:
             role = role.value
         if not isinstance(driver, RemoteWebDriver):
             raise TypeError("The provided 'driver' is not a valid WebDriver instance.")
-        if role in self.drivers:
-            printf(f"Warning: Driver for role '{role}' already exists. Overwriting.")
-            self.quit_driver(role)
-        self.drivers[role] = driver
+        if CommandProfiler.is_enabled():
+            CommandProfiler.instrument(driver)
+        if SessionWatchdog.is_enabled():
+            SessionWatchdog.instrument(driver)
+        with self._lock:
+            if role in self.drivers:
+                printf(f"Warning: Driver for role '{role}' already exists. Overwriting.")
+                self.quit_driver(role)
+            self.drivers[role] = driver
         printf(f"Driver added for role: '{role}'.")
 
     def get_driver(self, role):
@@ -90,27 +142,72 @@ class DriverManager:
     def quit_driver(self, role):
         if isinstance(role, DriverRole):
             role = role.value
-        driver = self.drivers.get(role)
+        with self._lock:
+            driver = self.drivers.pop(role, None)
         if driver is not None:
             try:
-                if driver.session_id:
-                    driver.quit()
+                if self.pool and self.pool.release(driver):
+                    printf(f"Driver for role '{role}' has been released to the pool.")
+                elif driver.session_id:
+                    try:
+                        driver.quit()
+                    finally:
+                        # A crashed session may fail to quit; its profile must still be freed
+                        self._release_profile(driver)
                     printf(f"Driver for role '{role}' has been quit.")
                 else:
+                    self._release_profile(driver)
                     printf(f"Driver for role '{role}' was already quit.")
             except Exception as e:
                 printf(f"Error quitting driver for role '{role}': {e}")
-            self.drivers.pop(role, None)
         else:
             printf(f"No driver found for role '{role}' to quit.")
 
+    def recover_driver(self, role, browser_name, context, restore_auth=None, step_name=None):
+        """
+        Replace the driver of `role` after SessionWatchdog found its browser session dead.
+
+        The dead driver is quit, a new one is created for the same role, authentication is restored with
+        restore_auth(driver) (for roles that were logged in) and the new driver is sent back to the last
+        route the old one had loaded. The recovery is recorded as a SessionWatchdog metric.
+
+        Returns:
+            WebDriver: the new driver, or None if it could not be created.
+        """
+        if isinstance(role, DriverRole):
+            role = role.value
+        old_driver = self.get_driver(role)
+        reason = SessionWatchdog.lost_reason(old_driver)
+        route = SessionWatchdog.last_url(old_driver)
+        printf(f"Recovering driver for role '{role}' (session lost: {reason})")
+
+        started = time.monotonic()
+        self.quit_driver(role)
+        driver, authenticated = None, None
+        try:
+            driver = self.create_driver(browser_name, f"{role}_recovery", context, role=role)
+            if restore_auth:
+                authenticated = bool(restore_auth(driver))
+            if route:
+                driver.get(route)
+        except Exception as e:
+            printf(f"Error recovering driver for role '{role}': {e}")
+
+        recovered = driver is not None and not SessionWatchdog.is_lost(driver)
+        SessionWatchdog.record_recovery(role, reason, time.monotonic() - started, recovered, authenticated, route,
+                                        step_name)
+        return driver
+
     def quit_all_drivers(self):
         roles_to_quit = list(self.drivers.keys())
         if not roles_to_quit:
             printf("No active drivers to quit.")
-            return
+        else:
+            printf(f"Quitting all {len(roles_to_quit)} active drivers...")
+            for role in roles_to_quit:
+                self.quit_driver(role)
+            printf("All drivers have been quit.")
 
-        printf(f"Quitting all {len(roles_to_quit)} active drivers...")
-        for role in roles_to_quit:
-            self.quit_driver(role)
-        printf("All drivers have been quit.")
\ No newline at end of file
+        if self.pool:
+            self.pool.close()
+        self.profiles.write_run_report()
\ No newline at end of file
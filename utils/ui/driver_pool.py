@@ -0,0 +1,183 @@
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException, NoAlertPresentException
+
+from features.commons.scripts import SessionScripts
+from utils.logger import printf
+
+
+class PooledDriver:
+    """Bookkeeping for a driver owned by the pool."""
+
+    def __init__(self, driver, browser_name, temp_dir=None):
+        self.driver = driver
+        self.browser_name = browser_name
+        self.temp_dir = temp_dir
+        self.uses = 0
+        self.created_at = time.time()
+        self.released_at = None
+
+
+class DriverPool:
+    """
+    Keeps up to `size` warm WebDriver sessions per browser type so features can skip browser start-up.
+
+    Drivers are handed out by acquire() (health-checked, evicted when idle too long or reused too often)
+    and returned by release(), which resets cookies, storage, extra tabs and alerts before pooling.
+    `on_discard(driver)` is called after a pooled driver has been quit, e.g. to delete its profile.
+    """
+
+    def __init__(self, size=2, max_reuse=10, idle_timeout=240, on_discard=None):
+        self.size = size
+        self.max_reuse = max_reuse
+        self.idle_timeout = idle_timeout
+        self.on_discard = on_discard
+        self._idle = {}      # browser_name -> [PooledDriver]
+        self._tracked = {}   # id(driver) -> PooledDriver
+        self._lock = threading.Lock()
+
+    def track(self, driver, browser_name, temp_dir=None):
+        """Register a freshly created driver so it can be returned to the pool later."""
+        entry = PooledDriver(driver, browser_name.lower(), temp_dir)
+        entry.uses = 1
+        with self._lock:
+            self._tracked[id(driver)] = entry
+        return entry
+
+    def acquire(self, browser_name):
+        """Return a healthy warm driver for `browser_name`, or None if the pool has none."""
+        browser_name = browser_name.lower()
+        while True:
+            with self._lock:
+                idle = self._idle.get(browser_name) or []
+                if not idle:
+                    return None
+                entry = idle.pop()
+
+            if entry.released_at and time.time() - entry.released_at > self.idle_timeout:
+                printf(f"DriverPool: evicting {browser_name} session idle for "
+                       f"{time.time() - entry.released_at:.0f}s")
+                self._discard(entry)
+                continue
+            if not self._is_healthy(entry.driver):
+                printf(f"DriverPool: evicting unhealthy {browser_name} session")
+                self._discard(entry)
+                continue
+
+            entry.uses += 1
+            entry.released_at = None
+            with self._lock:
+                self._tracked[id(entry.driver)] = entry
+            printf(f"DriverPool: reusing warm {browser_name} session (use {entry.uses}/{self.max_reuse})")
+            return entry.driver
+
+    def release(self, driver):
+        """
+        Reset `driver` and keep it warm for the next acquire().
+
+        Returns:
+            bool: True if the pool took the driver, False if the caller should quit it.
+        """
+        with self._lock:
+            entry = self._tracked.pop(id(driver), None)
+        if entry is None:
+            return False
+
+        if entry.uses >= self.max_reuse:
+            printf(f"DriverPool: {entry.browser_name} session reached max reuse ({self.max_reuse}), retiring")
+            self._discard(entry)
+            return True
+        if not self._reset(driver):
+            self._discard(entry)
+            return True
+
+        with self._lock:
+            idle = self._idle.setdefault(entry.browser_name, [])
+            if len(idle) >= self.size:
+                pooled = False
+            else:
+                entry.released_at = time.time()
+                idle.append(entry)
+                pooled = True
+        if not pooled:
+            printf(f"DriverPool: {entry.browser_name} pool full ({self.size}), retiring session")
+            self._discard(entry)
+            return True
+
+        printf(f"DriverPool: {entry.browser_name} session returned to pool")
+        return True
+
+    def evict_idle(self):
+        """Quit pooled drivers that have been idle longer than idle_timeout."""
+        now = time.time()
+        expired = []
+        with self._lock:
+            for browser_name, idle in self._idle.items():
+                keep = [e for e in idle if now - (e.released_at or now) <= self.idle_timeout]
+                expired.extend(e for e in idle if e not in keep)
+                self._idle[browser_name] = keep
+        for entry in expired:
+            self._discard(entry)
+        return len(expired)
+
+    def close(self):
+        """Quit every pooled driver."""
+        with self._lock:
+            entries = [e for idle in self._idle.values() for e in idle]
+            self._idle.clear()
+        for entry in entries:
+            self._discard(entry)
+        if entries:
+            printf(f"DriverPool: closed {len(entries)} pooled session(s)")
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            if not driver.session_id:
+                return False
+            driver.execute_script("return 1;")
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _reset(driver):
+        """Close extra tabs, dismiss alerts and wipe cookies/storage. Returns False if the session is unusable."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            try:
+                driver.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                pass
+
+            # Storage is per-origin, so clear it while the app origin is still loaded
+            try:
+                driver.execute_script(SessionScripts.CLEAR_STORAGE)
+            except WebDriverException:
+                pass
+            driver.delete_all_cookies()
+            if hasattr(driver, "execute_cdp_cmd"):
+                try:
+                    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                except WebDriverException:
+                    pass
+            driver.get("about:blank")
+            return True
+        except WebDriverException as e:
+            printf(f"DriverPool: failed to reset session, discarding it: {e}")
+            return False
+
+    def _discard(self, entry):
+        try:
+            if entry.driver.session_id:
+                entry.driver.quit()
+        except Exception as e:
+            printf(f"DriverPool: error quitting pooled {entry.browser_name} session: {e}")
+        if self.on_discard:
+            self.on_discard(entry.driver)
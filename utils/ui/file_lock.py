@@ -0,0 +1,68 @@
+import os
+import time
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a file, shared by every worker process on the machine (fcntl/msvcrt).
+
+    Usage:
+        with FileLock(path):
+            ...
+    or, to test whether another process still holds it:
+        lock = FileLock(path)
+        if lock.acquire(blocking=False):
+            ...
+            lock.release()
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fh = None
+
+    def acquire(self, blocking=True, timeout=None):
+        """
+        Take the lock. Returns False if another process holds it and `blocking` is False, or it is
+        still held after `timeout` seconds.
+        """
+        self._fh = open(self.path, "a+")
+        self._fh.seek(0)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            try:
+                if os.name == "nt":
+                    msvcrt.locking(self._fh.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except OSError:
+                if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                    self._fh.close()
+                    self._fh = None
+                    return False
+                time.sleep(0.1)
+
+    def release(self):
+        if self._fh is None:
+            return
+        try:
+            if os.name == "nt":
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
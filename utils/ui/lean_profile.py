@@ -0,0 +1,179 @@
+import glob
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger import printf
+from utils.ui.cdp import execute_cdp
+from utils.ui.command_profiler import summarize
+from utils.ui.config_reader import get_lean_profile_config
+
+
+class LeanProfile:
+    """
+    "Lean" Chrome profile for faster page loads: resources our assertions never look at (web fonts, media,
+    analytics and third-party widgets) are dropped with CDP Network.setBlockedURLs, and images can
+    additionally be blocked through Chrome content-setting prefs.
+
+    Enabled with LEAN_BROWSER_PROFILE=true or [LeanProfile] enabled = true. Features that need the full page
+    (visual checks) opt out with the @full_resources tag.
+    """
+
+    OPT_OUT_TAG = "full_resources"
+
+    DEFAULT_BLOCKED_URL_PATTERNS = [
+        # Web fonts
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+        # Media
+        "*.mp4", "*.webm", "*.mp3", "*.ogg",
+        # Analytics, tag managers and third-party widgets
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*hotjar.com*",
+        "*segment.io*", "*segment.com*", "*mixpanel.com*", "*intercom.io*", "*intercomcdn.com*",
+        "*fullstory.com*", "*clarity.ms*", "*sentry.io*", "*facebook.net*",
+    ]
+
+    # Chrome content settings: 2 = block
+    IMAGE_BLOCKING_PREFS = {
+        "profile.managed_default_content_settings.images": 2,
+    }
+
+    @staticmethod
+    def is_active(context=None):
+        """True if the lean profile is enabled and the current feature has not opted out."""
+        if not get_lean_profile_config()["enabled"]:
+            return False
+        feature = getattr(context, "feature", None) if context is not None else None
+        return not (feature is not None and LeanProfile.OPT_OUT_TAG in getattr(feature, "tags", []))
+
+    @staticmethod
+    def pool_key(browser_name, context=None):
+        """Pool lean and full sessions separately; their prefs are fixed at browser start."""
+        return f"{browser_name}:lean" if LeanProfile.is_active(context) else browser_name
+
+    @staticmethod
+    def extend_prefs(prefs):
+        """Add the content-setting prefs of the lean profile to a Chrome prefs dict."""
+        if get_lean_profile_config()["block_images"]:
+            prefs.update(LeanProfile.IMAGE_BLOCKING_PREFS)
+        return prefs
+
+    @staticmethod
+    def apply(driver):
+        """Block the configured URL patterns for this session via CDP. Returns True if blocking is active."""
+        patterns = get_lean_profile_config()["blocked_url_patterns"] or LeanProfile.DEFAULT_BLOCKED_URL_PATTERNS
+        try:
+            execute_cdp(driver, "Network.enable", {})
+            execute_cdp(driver, "Network.setBlockedURLs", {"urls": patterns})
+            driver._hbox_lean_profile = True
+            printf(f"Lean profile active: blocking {len(patterns)} URL patterns")
+            return True
+        except WebDriverException as e:
+            printf(f"Lean profile: CDP not available for this driver, loading all resources: {e}")
+            return False
+
+
+class PageLoadStats:
+    """
+    Navigation Timing samples for full page loads, split by lean/full profile so the effect of the lean
+    profile can be compared across runs (python -m utils.ui.lean_profile [Reports/profiles]). Recorded only
+    while the lean profile is enabled or for a baseline run (LEAN_PROFILE_RECORD_LOADS=true).
+    """
+
+    REPORT_DIR = "Reports/profiles"
+
+    NAVIGATION_TIMING_SCRIPT = """
+        const nav = performance.getEntriesByType('navigation')[0];
+        if (!nav || !nav.loadEventEnd) return null;
+        const resources = performance.getEntriesByType('resource');
+        return {
+            dom_content_loaded: nav.domContentLoadedEventEnd,
+            load: nav.loadEventEnd,
+            resources: resources.length,
+            transfer_bytes: resources.reduce((total, r) => total + (r.transferSize || 0), 0)
+        };
+    """
+
+    _lock = threading.Lock()
+    _samples = {}  # mode -> {metric -> [values]}
+
+    @staticmethod
+    def is_enabled():
+        return get_lean_profile_config()["record_page_loads"]
+
+    @staticmethod
+    def record(driver, label=""):
+        """Record the Navigation Timing of the document currently loaded in `driver` (no-op when disabled)."""
+        if not PageLoadStats.is_enabled():
+            return None
+        try:
+            timing = driver.execute_script(PageLoadStats.NAVIGATION_TIMING_SCRIPT)
+        except WebDriverException as e:
+            printf(f"PageLoadStats: could not read navigation timing for {label}: {e}")
+            return None
+        if not timing:
+            return None
+        mode = "lean" if getattr(driver, "_hbox_lean_profile", False) else "full"
+        with PageLoadStats._lock:
+            metrics = PageLoadStats._samples.setdefault(mode, {})
+            for name, value in timing.items():
+                metrics.setdefault(name, []).append(value)
+        printf(f"Page load ({mode}) {label}: load {timing['load'] / 1000:.2f}s, {timing['resources']} resources, "
+               f"{timing['transfer_bytes'] / 1024:.0f} KiB")
+        return timing
+
+    @staticmethod
+    def write_run_report():
+        """Write Reports/profiles/page-loads-<pid>.json with per-mode samples and summaries."""
+        with PageLoadStats._lock:
+            samples = {mode: {k: list(v) for k, v in metrics.items()}
+                       for mode, metrics in PageLoadStats._samples.items()}
+        if not samples:
+            return None
+        report = {
+            "pid": os.getpid(),
+            "finished_at": datetime.now().isoformat(),
+            "samples": samples,
+            "summary": {mode: {k: summarize(v) for k, v in metrics.items()} for mode, metrics in samples.items()},
+        }
+        try:
+            os.makedirs(PageLoadStats.REPORT_DIR, exist_ok=True)
+            path = os.path.join(PageLoadStats.REPORT_DIR, f"page-loads-{os.getpid()}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            return path
+        except Exception as e:
+            printf(f"PageLoadStats: failed to write run report: {e}")
+            return None
+
+    @staticmethod
+    def compare(report_dir=REPORT_DIR):
+        """Merge every page-loads-*.json under `report_dir` and summarise lean vs full load times."""
+        merged = {}
+        for path in glob.glob(os.path.join(report_dir, "page-loads-*.json")):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    samples = json.load(f).get("samples", {})
+            except (OSError, ValueError):
+                continue
+            for mode, metrics in samples.items():
+                for name, values in metrics.items():
+                    merged.setdefault(mode, {}).setdefault(name, []).extend(values)
+        return {mode: {k: summarize(v) for k, v in metrics.items()} for mode, metrics in merged.items()}
+
+
+if __name__ == '__main__':
+    comparison = PageLoadStats.compare(sys.argv[1] if len(sys.argv) > 1 else PageLoadStats.REPORT_DIR)
+    if not comparison:
+        printf("No page-load samples found.")
+    for mode in ("full", "lean"):
+        if mode in comparison:
+            load, size = comparison[mode]["load"], comparison[mode]["transfer_bytes"]
+            printf(f"{mode:>4}: {load['count']} loads, p50 {load['p50'] / 1000:.2f}s, p95 {load['p95'] / 1000:.2f}s, "
+                   f"p50 transfer {size['p50'] / 1024:.0f} KiB")
+    if "full" in comparison and "lean" in comparison:
+        gain = comparison["full"]["load"]["p50"] - comparison["lean"]["load"]["p50"]
+        printf(f"Lean profile p50 load gain: {gain / 1000:.2f}s")
@@ -0,0 +1,207 @@
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+
+from features.commons.routes import Routes
+from utils.logger import printf
+from utils.ui.config_reader import get_login_broker_config, get_session_max_age
+from utils.ui.file_lock import FileLock
+from utils.ui.session_vault import SessionVault
+
+# Broker directories of earlier runs are removed once they have not been touched for this long
+STALE_RUN_SECONDS = 24 * 3600
+
+
+class LoginBroker:
+    """
+    File-based login broker shared by the BehaveX worker processes of one run.
+
+    The session state captured by SessionVault after a UI login is published to
+    <login_broker_dir>/<run id>/<role>-<env>.json. Other workers restore it instead of logging in themselves.
+    A per-role file lock makes sure only one worker drives the login form: the others wait and then use
+    its session. When a shared session is rejected (expired on the server), the first worker to notice
+    refreshes it under the lock and bumps its generation. Workers that were waiting then pick up the new
+    session rather than logging in again.
+
+    The files hold session cookies and tokens, so the directory is created 0700 and the files 0600.
+    Per-role counts of UI logins, shared restores and lock waits are written to
+    Reports/profiles/login-broker-<pid>.json.
+    """
+
+    REPORT_DIR = "Reports/profiles"
+
+    _lock = threading.Lock()
+    _stats = {}  # role -> {"ui_logins", "shared_restores", "refreshes", "wait_seconds"}
+    _swept = False
+
+    @staticmethod
+    def is_enabled():
+        return get_login_broker_config()["enabled"]
+
+    @staticmethod
+    def _paths(user_role):
+        run_dir = get_login_broker_config()["run_dir"]
+        name = f"{user_role}-{Routes.get_env()}"
+        return os.path.join(run_dir, f"{name}.json"), os.path.join(run_dir, f"{name}.lock")
+
+    @staticmethod
+    def _ensure_run_dir():
+        config = get_login_broker_config()
+        os.makedirs(config["run_dir"], mode=0o700, exist_ok=True)
+        if not LoginBroker._swept:
+            LoginBroker._swept = True
+            LoginBroker.sweep_stale_runs(config["root_dir"], keep=config["run_dir"])
+
+    @staticmethod
+    def sweep_stale_runs(root_dir, keep=None):
+        """Delete broker directories of runs that have not been used for STALE_RUN_SECONDS."""
+        try:
+            names = os.listdir(root_dir)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(root_dir, name)
+            try:
+                if path != keep and os.path.isdir(path) and \
+                        time.time() - os.path.getmtime(path) > STALE_RUN_SECONDS:
+                    shutil.rmtree(path, ignore_errors=True)
+            except OSError:
+                pass
+
+    # -------------------- Shared state --------------------
+
+    @staticmethod
+    def read_state(user_role):
+        """The published state for `user_role`, or None. Expired states are returned as None."""
+        path, _ = LoginBroker._paths(user_role)
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - state.get("captured_at", 0) > get_session_max_age():
+            return None
+        return state
+
+    @staticmethod
+    def _generation(user_role):
+        path, _ = LoginBroker._paths(user_role)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f).get("generation", 0)
+        except (OSError, ValueError):
+            return 0
+
+    @staticmethod
+    def publish(user_role, state, generation):
+        """Atomically write `state` for `user_role` (caller holds the role lock)."""
+        path, _ = LoginBroker._paths(user_role)
+        payload = dict(state, generation=generation, published_by=os.getpid(),
+                       published_at=datetime.now().isoformat())
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _restore(driver, user_role, state):
+        SessionVault.put_state(user_role, state)
+        if SessionVault.restore(driver, user_role):
+            LoginBroker._count(user_role, "shared_restores")
+            printf(f"LoginBroker: restored shared session for {user_role} (generation {state.get('generation')})")
+            return True
+        return False
+
+    # -------------------- Login --------------------
+
+    @staticmethod
+    def login(driver, user_role, ui_login):
+        """
+        Authenticate `driver` as `user_role` with the session shared by the run, logging in through the UI
+        with ui_login() only if no worker has done so yet or the shared session was rejected.
+        ui_login() must return True on success and leave the session captured in SessionVault.
+
+        Returns:
+            bool: True if the driver is authenticated.
+        """
+        try:
+            LoginBroker._ensure_run_dir()
+        except OSError as e:
+            printf(f"LoginBroker: broker directory unavailable, logging in directly: {e}")
+            return ui_login()
+
+        # Fast path: someone already published a session; restoring it needs no lock
+        state = LoginBroker.read_state(user_role)
+        if state and LoginBroker._restore(driver, user_role, state):
+            return True
+        tried_generation = state.get("generation", 0) if state else None
+
+        _, lock_path = LoginBroker._paths(user_role)
+        lock = FileLock(lock_path)
+        started = time.monotonic()
+        if not lock.acquire(timeout=get_login_broker_config()["wait_timeout"]):
+            printf(f"LoginBroker: timed out waiting for the {user_role} login lock, logging in directly")
+            return ui_login()
+        try:
+            LoginBroker._count(user_role, "wait_seconds", time.monotonic() - started)
+            # Another worker may have logged in or refreshed while we waited for the lock
+            state = LoginBroker.read_state(user_role)
+            if state and state.get("generation", 0) != tried_generation and \
+                    LoginBroker._restore(driver, user_role, state):
+                return True
+
+            if tried_generation is not None:
+                printf(f"LoginBroker: shared session for {user_role} was rejected, refreshing it")
+                LoginBroker._count(user_role, "refreshes")
+            if not ui_login():
+                return False
+            LoginBroker._count(user_role, "ui_logins")
+            captured = SessionVault.get_state(user_role)
+            if captured is None:
+                return True
+            generation = LoginBroker._generation(user_role) + 1
+            try:
+                LoginBroker.publish(user_role, captured, generation)
+                printf(f"LoginBroker: published session for {user_role} (generation {generation})")
+            except OSError as e:
+                printf(f"LoginBroker: failed to publish session for {user_role}: {e}")
+            return True
+        finally:
+            lock.release()
+
+    # -------------------- Metrics --------------------
+
+    @staticmethod
+    def _count(user_role, key, amount=1):
+        with LoginBroker._lock:
+            stats = LoginBroker._stats.setdefault(user_role, {"ui_logins": 0, "shared_restores": 0,
+                                                              "refreshes": 0, "wait_seconds": 0.0})
+            stats[key] += amount
+
+    @staticmethod
+    def write_run_report():
+        """Write Reports/profiles/login-broker-<pid>.json with per-role login counts of this worker."""
+        with LoginBroker._lock:
+            stats = {role: dict(values, wait_seconds=round(values["wait_seconds"], 3))
+                     for role, values in LoginBroker._stats.items()}
+        if not stats:
+            return None
+        report = {
+            "pid": os.getpid(),
+            "run_dir": get_login_broker_config()["run_dir"],
+            "finished_at": datetime.now().isoformat(),
+            "roles": stats,
+        }
+        try:
+            os.makedirs(LoginBroker.REPORT_DIR, exist_ok=True)
+            path = os.path.join(LoginBroker.REPORT_DIR, f"login-broker-{os.getpid()}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            return path
+        except Exception as e:
+            printf(f"LoginBroker: failed to write run report: {e}")
+            return None
@@ -1,17 +1,30 @@
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from features.commons.routes import Routes
+from features.pages.base_page import BasePage
 from features.pages.login_page.login_page import LoginPage
 from utils.ui.config_reader import get_browser_config
 from utils.ui.driver_manger import DriverRole, DriverManager
+from utils.ui.login_broker import LoginBroker
+from utils.ui.popup_handler import PopupHandler
+from utils.ui.session_vault import SessionVault
+from utils.ui.session_watchdog import SessionWatchdog
 from utils.logger import printf
 
 
 def perform_role_based_login(driver: WebDriver, user_role: str, session_name: str = "default",
-                              auto_login: bool = True) -> bool:
-    """Perform role-based login by wrapping the LoginPage.login_as_role method for backward compatibility."""
+                              auto_login: bool = True, isolated: bool = False) -> bool:
+    """
+    Perform role-based login by wrapping the LoginPage.login_as_role method for backward compatibility.
+
+    An isolated login (@isolated_login features, e.g. logout scenarios) always drives the login form on a
+    clean browser state and its session is neither cached in SessionVault nor published to the LoginBroker,
+    so logging it out does not invalidate the session other features and workers share.
+    """
 
     if not auto_login:
         printf(f"[{session_name}] Auto-login disabled.")
@@ -21,27 +34,44 @@ def perform_role_based_login(driver: WebDriver, user_role: str, session_name: st
         # Create LoginPage instance and use the original login_as_role method
         login_page = LoginPage(driver)
 
-        # Check if already logged in by checking current URL
-        dashboard_url = Routes.get_full_url(Routes.DASHBOARD)
-        if driver.current_url == dashboard_url:
-            printf(f"[{session_name}] Already logged in.")
-            return True
-
-        # Navigate to login page if not already there
-        if driver.current_url != login_page.url:
-            printf(f"[{session_name}] Navigating to login page...")
-            login_page.navigate_to_login()
-
-        # Use the original login_as_role method from LoginPage with retry and case handling
-        printf(f"[{session_name}] Attempting login as {user_role}...")
-        login_success = login_page.login_as_role(user_role)
-
-        if login_success:
-            printf(f"[{session_name}] Login successful as {user_role}.")
-            return True
+        if isolated:
+            # A reused driver may still hold the shared session
+            SessionVault.reset_browser_state(driver)
         else:
-            printf(f"[{session_name}] Login failed as {user_role}.")
-            return False
+            # Check if already logged in by checking current URL
+            dashboard_url = Routes.get_full_url(Routes.DASHBOARD)
+            if driver.current_url == dashboard_url:
+                printf(f"[{session_name}] Already logged in.")
+                return True
+
+            # Restore a cached session for this role instead of driving the login form
+            if SessionVault.restore(driver, user_role):
+                printf(f"[{session_name}] Restored cached session for {user_role}.")
+                return True
+
+        def ui_login():
+            # Navigate to login page if not already there
+            if driver.current_url != login_page.url:
+                printf(f"[{session_name}] Navigating to login page...")
+                login_page.navigate_to_login()
+
+            # Use the original login_as_role method from LoginPage with retry and case handling
+            printf(f"[{session_name}] Attempting login as {user_role}...")
+            login_success = login_page.login_as_role(user_role)
+
+            if login_success:
+                printf(f"[{session_name}] Login successful as {user_role}.")
+                if not isolated:
+                    SessionVault.capture(driver, user_role)
+                return True
+            else:
+                printf(f"[{session_name}] Login failed as {user_role}.")
+                return False
+
+        # Share one UI login per role across the BehaveX workers of this run
+        if LoginBroker.is_enabled() and not isolated:
+            return LoginBroker.login(driver, user_role, ui_login)
+        return ui_login()
 
     except Exception as e:
         printf(f"[{session_name}] Login failed with exception: {e}")
@@ -49,7 +79,8 @@ def perform_role_based_login(driver: WebDriver, user_role: str, session_name: st
 
 
 def perform_role_based_login_with_driver(driver_manager, user_role: str, browser_name: str, context,
-                                        session_name: str = "default", auto_login: bool = True, parallel_login = False) -> tuple:
+                                        session_name: str = "default", auto_login: bool = True, parallel_login = False,
+                                        isolated: bool = False) -> tuple:
     """Perform role-based login with automatic driver creation/management for the specified role."""
 
     # Map user role to DriverRole enum
@@ -89,7 +120,7 @@ def perform_role_based_login_with_driver(driver_manager, user_role: str, browser
             driver = driver_manager.create_driver(browser_name, session_name, context, role=driver_role)
 
     # Perform login using the driver
-    login_success = perform_role_based_login(driver, user_role, session_name, auto_login)
+    login_success = perform_role_based_login(driver, user_role, session_name, auto_login, isolated)
 
     return driver, login_success, driver_role
 
@@ -109,6 +140,100 @@ class LoginHelper:
 
         return None
 
+    @staticmethod
+    def extract_parallel_roles_from_tags(tags):
+        """
+        Extract roles to provision up front for a @login_parallel feature.
+
+        @parallel_role:<role>   - create a driver and log in with the role's configured credentials
+        @parallel_driver:<name> - only create a driver, for a role the first steps use without logging in
+
+        Drivers for users that only log in later in the feature (e.g. users created by an earlier step) should
+        not be tagged: get_driver_for_role creates them on first use, so they don't hold a Selenoid slot idle.
+
+        Returns:
+            tuple: (login_roles, driver_only_roles)
+        """
+        login_roles, driver_roles = [], []
+        for tag in tags:
+            if tag.startswith("parallel_role:"):
+                login_roles.append(tag.split(":", 1)[1])
+            elif tag.startswith("parallel_driver:"):
+                driver_roles.append(tag.split(":", 1)[1])
+        return login_roles, driver_roles
+
+    @staticmethod
+    def provision_parallel_roles(context, login_roles, driver_roles=(), max_workers=None):
+        """
+        Create drivers for several roles concurrently, log in the login_roles, and register every driver in
+        context.user_drivers. Failures are isolated per role: a failed driver start or login is logged and
+        reported in the result without affecting the other roles.
+
+        Args:
+            context: Behave context object.
+            login_roles: Roles to create a driver for and log in (credentials from config.ini).
+            driver_roles: Roles to create a driver for without logging in.
+            max_workers: Thread pool size (defaults to one thread per role).
+
+        Returns:
+            dict: role -> True if the driver is ready (and logged in, for login roles), else False
+        """
+        driver_manager: DriverManager = context.driver_manager
+        browser_name = get_browser_config()
+        if not hasattr(context, "user_drivers"):
+            context.user_drivers = {}
+        if not hasattr(context, "provisioned_roles"):
+            context.provisioned_roles = set()
+
+        jobs = {role: True for role in login_roles if role not in context.user_drivers}
+        jobs.update({role: False for role in driver_roles if role not in context.user_drivers and role not in jobs})
+        if not jobs:
+            return {}
+
+        def _provision(role, login):
+            session_name = f"{role}_session"
+            driver = driver_manager.create_driver(browser_name, session_name, context, role=role)
+            logged_in = perform_role_based_login(driver, role, session_name) if login else True
+            return driver, logged_in
+
+        printf(f"Provisioning {len(jobs)} role driver(s) concurrently: {list(jobs)}")
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers or len(jobs)) as executor:
+            futures = {executor.submit(_provision, role, login): role for role, login in jobs.items()}
+            for future in as_completed(futures):
+                role = futures[future]
+                try:
+                    driver, logged_in = future.result()
+                except Exception as e:
+                    printf(f"[{role}_session] Provisioning failed: {e}")
+                    results[role] = False
+                    continue
+
+                # context is only mutated here, on the calling thread
+                context.user_drivers[role] = driver
+                if jobs[role] and logged_in:
+                    context.provisioned_roles.add(role)
+                    LoginHelper.mark_logged_in(context, role)
+                results[role] = logged_in
+                printf(f"[{role}_session] Provisioned driver (logged_in={logged_in if jobs[role] else 'n/a'})")
+
+        failed = [role for role, ok in results.items() if not ok]
+        if failed:
+            printf(f"Provisioning finished with failures for: {failed}")
+        return results
+
+    @staticmethod
+    def mark_logged_in(context, user_role, login=None):
+        """
+        Remember that `user_role` was logged in during this feature, so recover_lost_sessions logs its
+        replacement driver in again. `login(driver)` re-authenticates users that are not configured roles (e.g.
+        users created by the feature) and must return True on success; configured roles log in with their
+        config.ini credentials.
+        """
+        if not hasattr(context, "logged_in_roles"):
+            context.logged_in_roles = {}
+        context.logged_in_roles[user_role] = login
+
     @staticmethod
     def get_driver_for_role(context, user_role):
         """
@@ -170,6 +295,69 @@ class LoginHelper:
         if getattr(context, "current_driver", None) is driver:
             context.current_driver = None
 
+    @staticmethod
+    def recover_lost_sessions(context, step=None):
+        """
+        Recreate every driver whose browser session died and point the context at the replacements.
+        Roles that were logged in for this feature (login tag, or mark_logged_in for @login_parallel
+        features) log in again.
+
+        Returns:
+            bool: True if at least one driver was recovered, so the failed step may be retried.
+        """
+        driver_manager: DriverManager = getattr(context, "driver_manager", None)
+        if driver_manager is None:
+            return False
+        lost = {role: driver for role, driver in list(driver_manager.drivers.items())
+                if SessionWatchdog.is_lost(driver)}
+        if not lost:
+            return False
+
+        current_role = getattr(context, "current_driver_role", None)
+        current_role = current_role.value if isinstance(current_role, DriverRole) else current_role
+        logged_in_roles = dict(getattr(context, "logged_in_roles", {}))
+        if current_role and current_role != DriverRole.DEFAULT.value:
+            logged_in_roles.setdefault(current_role, None)
+
+        browser_name = get_browser_config()
+        recovered = False
+        for role, old_driver in lost.items():
+            restore_auth = None
+            if role in logged_in_roles:
+                restore_auth = logged_in_roles[role] or \
+                    partial(perform_role_based_login, user_role=role, session_name=f"{role}_recovery",
+                            isolated=getattr(context, "isolated_login", False))
+            driver = driver_manager.recover_driver(role, browser_name, context, restore_auth,
+                                                   step_name=step.name if step else None)
+            if driver is None:
+                continue
+
+            LoginHelper._replace_context_driver(context, old_driver, driver)
+            recovered = True
+
+        if recovered:
+            PopupHandler.enable_appointment_reminder_handler(context)
+        return recovered
+
+    @staticmethod
+    def _replace_context_driver(context, old_driver, new_driver):
+        """
+        Point every context reference to old_driver at new_driver, including the page objects steps cache on
+        the context (e.g. context.patient_groups_page). Behave keeps one attribute layer per feature/scenario,
+        so references are replaced in the layer that defines them; a plain assignment during a step would only
+        shadow the feature-level driver until the scenario ends.
+        """
+        for layer in getattr(context, "_stack", [context.__dict__]):
+            for attr, value in list(layer.items()):
+                if value is old_driver and attr in ("driver", "current_driver", "active_step_driver"):
+                    layer[attr] = new_driver
+                elif isinstance(value, BasePage) and value.driver is old_driver:
+                    value.rebind_driver(new_driver)
+        user_drivers = getattr(context, "user_drivers", {})
+        for user_role, user_driver in user_drivers.items():
+            if user_driver is old_driver:
+                user_drivers[user_role] = new_driver
+
     @staticmethod
     def handle_automatic_login(context, feature):
         """Handle automatic login for features with login tags using role-based driver management."""
@@ -190,6 +378,8 @@ class LoginHelper:
 
         if user_role != "parallel":
             printf(f"Feature '{feature.name}' has a login tag for role: {user_role}")
+            # Features that log out must not share (and end) the role's session
+            context.isolated_login = "isolated_login" in feature.tags
             try:
                 # Get browser configuration
                 browser_name = get_browser_config()
@@ -202,7 +392,8 @@ class LoginHelper:
                     context=context,
                     session_name=f"feature_{feature.name}",
                     auto_login=True,
-                    parallel_login=False
+                    parallel_login=False,
+                    isolated=context.isolated_login
                 )
 
                 # Update context with the role-based driver
@@ -221,6 +412,12 @@ class LoginHelper:
             if not hasattr(context, 'user_drivers'):
                 context.user_drivers = {}
                 printf("Initialized context.user_drivers for parallel login feature")
+            # Set in before_feature so that roles the steps log in are remembered for the whole feature
+            context.logged_in_roles = {}
+
+            login_roles, driver_roles = LoginHelper.extract_parallel_roles_from_tags(feature.tags)
+            if login_roles or driver_roles:
+                LoginHelper.provision_parallel_roles(context, login_roles, driver_roles)
         else:
             printf(f"Feature '{feature.name}' does not have a login tag, creating default driver.")
             try:
@@ -0,0 +1,136 @@
+import json
+import re
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger import printf
+from utils.ui.config_reader import is_network_events_enabled
+
+# Resource types of data calls issued by the app (CDP Network.ResourceType)
+DATA_CALL_TYPES = ("XHR", "Fetch")
+
+# Chrome logging prefs that make CDP Network.* events readable through driver.get_log("performance")
+PERF_LOGGING_PREFS = {"enableNetwork": True, "enablePage": False}
+
+
+def enable_network_events(options):
+    """Add the Chrome options needed for ApiResponseWaiter to a ChromeOptions instance."""
+    # Merged, as the browser log (BrowserConsole) is enabled through the same capability
+    prefs = dict(options.capabilities.get("goog:loggingPrefs", {}))
+    prefs["performance"] = "ALL"
+    options.set_capability("goog:loggingPrefs", prefs)
+    options.add_experimental_option("perfLoggingPrefs", PERF_LOGGING_PREFS)
+    return options
+
+
+def read_network_events(driver):
+    """Drain the performance log and return its CDP Network.* events as (method, params) tuples."""
+    events = []
+    for entry in driver.get_log("performance"):
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        if message.get("method", "").startswith("Network."):
+            events.append((message["method"], message.get("params", {})))
+    return events
+
+
+class ApiResponseWaiter:
+    """
+    Waits for the XHR/fetch calls triggered by a UI action, using the CDP Network.requestWillBeSent,
+    responseReceived, loadingFinished and loadingFailed events from Chrome's performance log.
+
+    Usage:
+        waiter = ApiResponseWaiter(driver, r"/api/patients")
+        if waiter.arm():
+            click_search()
+            response = waiter.wait(timeout=30)
+    """
+
+    POLL_INTERVAL = 0.1
+    # Actions that trigger no matching call (e.g. a search with unchanged filters) give up after this
+    GRACE_PERIOD = 1.0
+
+    def __init__(self, driver, url_pattern=None):
+        self.driver = driver
+        self.url_pattern = re.compile(url_pattern) if url_pattern else None
+        self._requests = {}   # requestId -> dict(url, method, started)
+        self._responses = {}  # requestId -> dict(status)
+        self._completed = []
+
+    def arm(self):
+        """Discard earlier events so only calls issued after this point are matched. False if unsupported."""
+        if getattr(self.driver, "_hbox_network_events", True) is False or not is_network_events_enabled():
+            return False
+        try:
+            read_network_events(self.driver)
+            return True
+        except WebDriverException as e:
+            # Performance log not enabled for this session (non-Chrome browser or capability missing)
+            self.driver._hbox_network_events = False
+            printf(f"Network events unavailable for this driver: {e}")
+            return False
+
+    def wait(self, timeout=15, grace=GRACE_PERIOD):
+        """
+        Block until at least one matching call has completed and none is still in flight.
+        Returns early when no matching call has started within `grace` seconds.
+
+        Returns:
+            dict: url, method, status, ok, duration_ms of the last completed call, or None on timeout or
+            when no matching call was issued.
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        while time.monotonic() < deadline:
+            try:
+                events = read_network_events(self.driver)
+            except WebDriverException as e:
+                printf(f"Failed to read network events: {e}")
+                return None
+            for method, params in events:
+                self._handle(method, params)
+            if self._completed and not self._requests:
+                return self._completed[-1]
+            if not self._completed and not self._requests and time.monotonic() - started >= grace:
+                printf(f"No matching API call within {grace}s of the action")
+                return None
+            time.sleep(self.POLL_INTERVAL)
+
+        pending = ", ".join(r["url"] for r in self._requests.values()) or "no matching request seen"
+        printf(f"Timed out after {timeout}s waiting for API response ({pending})")
+        return None
+
+    def _handle(self, method, params):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            request = params.get("request", {})
+            url = request.get("url", "")
+            if params.get("type") in DATA_CALL_TYPES and (not self.url_pattern or self.url_pattern.search(url)):
+                self._requests[request_id] = {
+                    "url": url,
+                    "method": request.get("method"),
+                    "started": params.get("timestamp"),
+                }
+        elif request_id not in self._requests:
+            return
+        elif method == "Network.responseReceived":
+            response = params.get("response", {})
+            self._responses[request_id] = {"status": response.get("status")}
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            request = self._requests.pop(request_id)
+            status = self._responses.pop(request_id, {}).get("status")
+            started, finished = request["started"], params.get("timestamp")
+            result = {
+                "url": request["url"],
+                "method": request["method"],
+                "status": status,
+                "ok": method == "Network.loadingFinished" and status is not None and status < 400,
+                # CDP timestamps are monotonic seconds
+                "duration_ms": round((finished - started) * 1000) if started and finished else None,
+            }
+            if method == "Network.loadingFailed":
+                result["error"] = params.get("errorText")
+            self._completed.append(result)
@@ -0,0 +1,205 @@
+import json
+import os
+import re
+import statistics
+import threading
+from datetime import datetime
+
+from selenium.common.exceptions import WebDriverException
+
+from features.commons.scripts import PerfScripts
+from utils.logger import printf
+from utils.ui.command_profiler import summarize
+from utils.ui.config_reader import get_page_perf_config
+from utils.ui.file_lock import FileLock
+
+# Path segments that identify a record rather than a page (numeric ids, UUIDs, long hex ids)
+_ID_SEGMENT = re.compile(r"^(\d+|(?=.*\d)[0-9a-fA-F-]{8,})$")
+
+
+def normalize_route(path):
+    """'/admin/users/edit/123' -> '/admin/users/edit/:id' so samples of the same page are grouped."""
+    segments = [":id" if _ID_SEGMENT.match(s) else s for s in (path or "/").split("/")]
+    return "/".join(segments) or "/"
+
+
+class PagePerf:
+    """
+    Opt-in page-load performance collector (PAGE_PERF_CAPTURE=true or [PagePerf] enabled = true).
+
+    Page objects call start() before a navigation (navigate_to, login page, hamburger menu clicks) and
+    capture() once it has settled. Full document loads are measured with Navigation Timing and LCP;
+    in-app route changes with the time until the last network/DOM activity. Samples are grouped by
+    normalised route and written to Reports/profiles/page-perf-<pid>.json; at the end of the run they are
+    merged into a rolling per-build history (Reports/page-perf-history.json, which the Jenkinsfile archives
+    and restores from the last successful build) and routes slower than the previous builds by more than the
+    configured threshold are flagged.
+    """
+
+    REPORT_DIR = "Reports/profiles"
+    HISTORY_FILE = "Reports/page-perf-history.json"
+
+    _lock = threading.Lock()
+    _samples = {}  # route -> [metrics dict]
+
+    @staticmethod
+    def is_enabled():
+        return get_page_perf_config()["enabled"]
+
+    @staticmethod
+    def start(driver):
+        """Mark the start of a navigation on `driver` (no-op when disabled)."""
+        if not PagePerf.is_enabled():
+            return
+        try:
+            driver._hbox_nav_start = driver.execute_script(PerfScripts.MARK_NAVIGATION_START)
+        except WebDriverException as e:
+            printf(f"PagePerf: could not mark navigation start: {e}")
+            driver._hbox_nav_start = None
+
+    @staticmethod
+    def capture(page, label="", settled=False):
+        """
+        Record the metrics of the navigation started with start(). Waits for the page to settle first, unless
+        the caller already did (`settled`, e.g. navigate_to).
+        """
+        if not PagePerf.is_enabled():
+            return None
+        driver = page.driver
+        mark = getattr(driver, "_hbox_nav_start", None)
+        driver._hbox_nav_start = None
+        if not mark:
+            return None
+        if not settled:
+            page.wait_for_dom_stability(timeout=10)
+        try:
+            metrics = page._execute_async_script_with_timeout(PerfScripts.COLLECT_NAVIGATION_METRICS, 1,
+                                                              mark["origin"], mark["now"])
+        except WebDriverException as e:
+            printf(f"PagePerf: could not collect navigation metrics for {label}: {e}")
+            return None
+        if not metrics or metrics.get("duration") is None:
+            return None
+
+        route = normalize_route(metrics["route"])
+        metrics.update({"route": route, "label": label})
+        with PagePerf._lock:
+            PagePerf._samples.setdefault(route, []).append(metrics)
+        printf(f"PagePerf: {route} ({metrics['kind']}) {metrics['duration']}ms, {metrics['resources']} resources"
+               + (f", LCP {metrics['lcp']}ms" if metrics.get("lcp") is not None else ""))
+        return metrics
+
+    # -------------------- Reports --------------------
+
+    @staticmethod
+    def summarize_routes(samples):
+        """Per-route summary of navigation duration, LCP and transfer size."""
+        summary = {}
+        for route, entries in samples.items():
+            lcp = [e["lcp"] for e in entries if e.get("lcp") is not None]
+            summary[route] = {
+                "duration_ms": summarize([e["duration"] for e in entries]),
+                "lcp_ms": summarize(lcp) if lcp else None,
+                "transfer_bytes": summarize([e["transfer_bytes"] for e in entries]),
+                "kinds": sorted({e["kind"] for e in entries}),
+            }
+        return summary
+
+    @staticmethod
+    def write_run_report():
+        """Write the per-run route report, merge it into the build history and flag regressions."""
+        with PagePerf._lock:
+            samples = {route: list(entries) for route, entries in PagePerf._samples.items()}
+        if not samples:
+            return None
+
+        config = get_page_perf_config()
+        summary = PagePerf.summarize_routes(samples)
+        try:
+            build_p50, regressions = PagePerf.update_history(config["build_id"], samples, config)
+        except (OSError, ValueError, KeyError) as e:
+            printf(f"PagePerf: failed to update history {PagePerf.HISTORY_FILE}: {e}")
+            build_p50, regressions = None, []
+        report = {
+            "pid": os.getpid(),
+            "build": config["build_id"],
+            "finished_at": datetime.now().isoformat(),
+            "routes": summary,
+            "build_p50_ms": build_p50,
+            "regressions": regressions,
+            "samples": samples,
+        }
+        try:
+            os.makedirs(PagePerf.REPORT_DIR, exist_ok=True)
+            path = os.path.join(PagePerf.REPORT_DIR, f"page-perf-{os.getpid()}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        except Exception as e:
+            printf(f"PagePerf: failed to write run report: {e}")
+            return None
+
+        for regression in regressions:
+            printf(f"[WARN] PagePerf regression: {regression['route']} p50 {regression['current_ms']}ms vs "
+                   f"{regression['baseline_ms']}ms over the previous {regression['builds']} builds "
+                   f"(+{regression['increase_pct']}%)")
+        return path
+
+    @staticmethod
+    def update_history(build_id, samples, config):
+        """
+        Merge `samples` into the entry for `build_id` in the history file (shared by all workers of the
+        build) and compare it with the previous builds.
+
+        Returns:
+            tuple: (per-route summary of the whole build so far, list of regressions)
+        """
+        os.makedirs(os.path.dirname(PagePerf.HISTORY_FILE), exist_ok=True)
+        with FileLock(f"{PagePerf.HISTORY_FILE}.lock"):
+            try:
+                with open(PagePerf.HISTORY_FILE, encoding="utf-8") as f:
+                    history = json.load(f)
+            except (OSError, ValueError):
+                history = {"builds": []}
+
+            builds = history["builds"]
+            current = next((b for b in builds if b["build"] == build_id), None)
+            if current is None:
+                current = {"build": build_id, "durations": {}}
+                builds.append(current)
+            for route, entries in samples.items():
+                current["durations"].setdefault(route, []).extend(e["duration"] for e in entries)
+            current["updated_at"] = datetime.now().isoformat()
+            current["p50_ms"] = {route: round(statistics.median(values))
+                                 for route, values in current["durations"].items()}
+
+            previous = [b for b in builds if b is not current][-config["baseline_builds"]:]
+            regressions = PagePerf.find_regressions(current, previous, config)
+            current["regressions"] = regressions
+            history["builds"] = builds[-config["history_size"]:]
+
+            tmp_path = f"{PagePerf.HISTORY_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(history, f, indent=2)
+            os.replace(tmp_path, PagePerf.HISTORY_FILE)
+        return current["p50_ms"], regressions
+
+    @staticmethod
+    def find_regressions(current, previous, config):
+        """Routes whose p50 exceeds the median p50 of the previous builds by more than the threshold."""
+        regressions = []
+        for route, current_ms in current["p50_ms"].items():
+            baseline = [b["p50_ms"][route] for b in previous if route in b.get("p50_ms", {})]
+            if not baseline:
+                continue
+            baseline_ms = statistics.median(baseline)
+            increase = current_ms - baseline_ms
+            if baseline_ms > 0 and increase >= config["min_regression_ms"] \
+                    and increase / baseline_ms * 100 >= config["regression_threshold_pct"]:
+                regressions.append({
+                    "route": route,
+                    "current_ms": current_ms,
+                    "baseline_ms": round(baseline_ms),
+                    "increase_pct": round(increase / baseline_ms * 100, 1),
+                    "builds": len(baseline),
+                })
+        return regressions
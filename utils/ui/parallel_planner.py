@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Duration-aware split of a BehaveX run into one explicit work list per process.
+
+BehaveX hands features/scenarios to its process pool in discovery order, so long features that sort late
+(tc16 e2e, the CRUD features) start last and leave the other processes idle at the end of the run.
+The planner estimates every scenario from its recent durations in Reports/cumulative-results and assigns
+them longest-first to the process that would finish them earliest (LPT). Each process then runs its own
+list with `behavex --parallel-processes 1`, and the predicted and actual makespan are reported.
+
+Usage:
+    python -m utils.ui.parallel_planner plan   [--processes 5] [--scheme scenario] [--tags EXPR] [paths...]
+    python -m utils.ui.parallel_planner run    [same options] [paths...] -- <behavex options>
+    python -m utils.ui.parallel_planner report
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from configparser import ConfigParser
+from datetime import datetime
+
+from behave.parser import parse_file
+from behave.tag_expression import make_tag_expression
+
+from utils.logger import printf
+from utils.ui.config_reader import get_parallel_plan_config
+from utils.ui.result_analytics import ResultAnalytics
+
+PLAN_DIR = "Reports/parallel-plan"
+PLAN_FILE = os.path.join(PLAN_DIR, "plan.json")
+RUN_FILE = os.path.join(PLAN_DIR, "run.json")
+
+# Process counts the predicted makespan is also computed for, to help tune PARALLEL_PROCESSES
+MAX_PROCESSES_COMPARED = 8
+
+
+def _tags_to_skip():
+    """[test_run] tags_to_skip of the BehaveX config; BehaveX skips these scenarios without running them."""
+    parser = ConfigParser()
+    parser.read([".behavex"] if os.path.exists(".behavex") else ["conf_behavex.cfg"])
+    value = parser.get("test_run", "tags_to_skip", fallback="skip, not_implemented, xfail")
+    return {tag.strip().lstrip("@") for tag in value.split(",") if tag.strip()}
+
+
+def _history_key(feature_name, scenario_name):
+    """The Allure fullName of a scenario; examples of an outline share the outline's name."""
+    return f"{feature_name}: {scenario_name.rsplit(' -- ')[0]}"
+
+
+def _feature_files(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in names if name.endswith(".feature"))
+        else:
+            files.append(path)
+    return sorted(set(files))
+
+
+class ParallelPlanner:
+
+    @staticmethod
+    def discover(paths, tags=None):
+        """Scenarios under `paths` selected by the tag expression(s), as {location, feature, key} dicts."""
+        expression = make_tag_expression(tags) if tags else None
+        skip = _tags_to_skip()
+        scenarios = []
+        for filename in _feature_files(paths):
+            try:
+                feature = parse_file(filename)
+            except Exception as e:
+                printf(f"ParallelPlanner: cannot parse {filename}: {e}")
+                continue
+            if feature is None:
+                continue
+            for scenario in feature.walk_scenarios():
+                scenario_tags = set(scenario.effective_tags)
+                if scenario_tags & skip or (expression and not expression.check(scenario_tags)):
+                    continue
+                scenarios.append({
+                    "location": f"{filename}:{scenario.line}",
+                    "feature": filename,
+                    "key": _history_key(feature.name, scenario.name),
+                })
+        return scenarios
+
+    @staticmethod
+    def load_history(history_dir, history_runs):
+        """Median duration in seconds of the last `history_runs` executed results per scenario (fullName)."""
+        if not os.path.isdir(history_dir):
+            printf(f"ParallelPlanner: no history in {history_dir}, every scenario gets the default estimate")
+            return {}
+        records, _ = ResultAnalytics.load_records(history_dir)
+        samples = {}
+        for record in records:
+            if record["status"] != "skipped" and record["duration_ms"] is not None:
+                samples.setdefault(record["name"], []).append((record["start"], record["duration_ms"]))
+        return {name: statistics.median(d for _, d in sorted(runs)[-history_runs:]) / 1000
+                for name, runs in samples.items()}
+
+    @staticmethod
+    def build_units(scenarios, scheme, history, default_seconds):
+        """Group scenarios into the units handed to a process: one per feature file or one per scenario."""
+        units = {}
+        for scenario in scenarios:
+            location = scenario["feature"] if scheme == "feature" else scenario["location"]
+            unit = units.setdefault(location, {"location": location, "feature": scenario["feature"],
+                                               "seconds": 0.0, "scenarios": 0, "without_history": 0})
+            estimate = history.get(scenario["key"])
+            unit["seconds"] += estimate if estimate is not None else default_seconds
+            unit["scenarios"] += 1
+            unit["without_history"] += estimate is None
+        return list(units.values())
+
+    @staticmethod
+    def assign(units, processes, feature_overhead):
+        """
+        Longest processing time first: each unit, largest first, goes to the process that would finish it
+        earliest. A process pays feature_overhead once for every feature file it runs scenarios of.
+        """
+        workers = [{"index": index, "predicted_seconds": 0.0, "features": set(), "scenarios": 0, "units": []}
+                   for index in range(processes)]
+        for unit in sorted(units, key=lambda u: (-u["seconds"], u["location"])):
+            def finish(worker):
+                overhead = 0 if unit["feature"] in worker["features"] else feature_overhead
+                return worker["predicted_seconds"] + unit["seconds"] + overhead
+
+            worker = min(workers, key=lambda w: (finish(w), w["index"]))
+            worker["predicted_seconds"] = finish(worker)
+            worker["features"].add(unit["feature"])
+            worker["scenarios"] += unit["scenarios"]
+            worker["units"].append(unit["location"])
+        return workers
+
+    @staticmethod
+    def plan(paths, processes, scheme="scenario", tags=None, history_dir=ResultAnalytics.CUMULATIVE_DIR):
+        """Build the plan and write Reports/parallel-plan/plan.json plus worker-<n>.txt work lists."""
+        config = get_parallel_plan_config()
+        scenarios = ParallelPlanner.discover(paths, tags)
+        history = ParallelPlanner.load_history(history_dir, config["history_runs"])
+        units = ParallelPlanner.build_units(scenarios, scheme, history, config["default_seconds"])
+        workers = ParallelPlanner.assign(units, processes, config["feature_overhead_seconds"])
+
+        makespan_by_processes = {
+            count: round(max(w["predicted_seconds"] for w in
+                             ParallelPlanner.assign(units, count, config["feature_overhead_seconds"])))
+            for count in range(1, max(processes, MAX_PROCESSES_COMPARED) + 1)
+        } if units else {}
+        plan = {
+            "created_at": datetime.now().isoformat(),
+            "scheme": scheme,
+            "processes": processes,
+            "paths": paths,
+            "tags": tags,
+            "history_dir": history_dir,
+            "scenarios": len(scenarios),
+            "scenarios_without_history": sum(u["without_history"] for u in units),
+            "predicted_makespan_seconds": round(max((w["predicted_seconds"] for w in workers), default=0)),
+            "makespan_by_processes": makespan_by_processes,
+            "workers": [{
+                "index": w["index"],
+                "predicted_seconds": round(w["predicted_seconds"]),
+                "features": len(w["features"]),
+                "scenarios": w["scenarios"],
+                "units": w["units"],
+            } for w in workers],
+        }
+
+        os.makedirs(PLAN_DIR, exist_ok=True)
+        # Work lists and run results of an earlier plan must not be mistaken for this one
+        for name in os.listdir(PLAN_DIR):
+            if name == os.path.basename(RUN_FILE) or (name.startswith("worker-") and name.endswith(".txt")):
+                os.remove(os.path.join(PLAN_DIR, name))
+        with open(PLAN_FILE, "w", encoding="utf-8") as f:
+            json.dump(plan, f, indent=2)
+        for worker in plan["workers"]:
+            with open(os.path.join(PLAN_DIR, f"worker-{worker['index']}.txt"), "w", encoding="utf-8") as f:
+                f.write("\n".join(worker["units"]) + "\n")
+
+        printf(f"ParallelPlanner: {len(scenarios)} scenarios ({plan['scenarios_without_history']} without "
+               f"history) in {len(units)} {scheme} units over {processes} processes, predicted makespan "
+               f"{_format_seconds(plan['predicted_makespan_seconds'])}")
+        for worker in plan["workers"]:
+            printf(f"  process {worker['index']}: {worker['scenarios']} scenarios in {worker['features']} features, "
+                   f"~{_format_seconds(worker['predicted_seconds'])}")
+        return plan
+
+    @staticmethod
+    def run(plan, behavex_args):
+        """
+        Run every non-empty work list in its own `behavex --parallel-processes 1` process, wait for all of
+        them and write Reports/parallel-plan/run.json. Returns the first non-zero exit code (0 if all passed).
+        """
+        env = dict(os.environ)
+        # Worker processes have different parents; keep them on one shared login broker directory
+        env.setdefault("LOGIN_BROKER_RUN_ID", f"plan-{os.getpid()}")
+        started_at = datetime.now().isoformat()
+        running = []
+        for worker in plan["workers"]:
+            if not worker["units"]:
+                continue
+            index = worker["index"]
+            command = [sys.executable, "-m", "behavex", *behavex_args, "--parallel-processes", "1",
+                       "-o", os.path.join(PLAN_DIR, f"worker-{index}"), *worker["units"]]
+            log_path = os.path.join(PLAN_DIR, f"worker-{index}.log")
+            log = open(log_path, "w", encoding="utf-8")
+            process = subprocess.Popen(command, env=env, stdout=log, stderr=subprocess.STDOUT)
+            running.append({"worker": worker, "process": process, "log": log, "log_path": log_path,
+                            "started": time.monotonic()})
+            printf(f"ParallelPlanner: started process {index} (pid {process.pid}), log: {log_path}")
+
+        results = []
+        while running:
+            for entry in list(running):
+                exit_code = entry["process"].poll()
+                if exit_code is None:
+                    continue
+                entry["log"].close()
+                running.remove(entry)
+                worker = entry["worker"]
+                actual = time.monotonic() - entry["started"]
+                results.append({
+                    "index": worker["index"],
+                    "predicted_seconds": worker["predicted_seconds"],
+                    "actual_seconds": round(actual),
+                    "exit_code": exit_code,
+                    "log": entry["log_path"],
+                })
+                printf(f"ParallelPlanner: process {worker['index']} finished in {_format_seconds(actual)} "
+                       f"(predicted {_format_seconds(worker['predicted_seconds'])}), exit code {exit_code}")
+            if running:
+                time.sleep(1)
+
+        results.sort(key=lambda r: r["index"])
+        run = {
+            "started_at": started_at,
+            "finished_at": datetime.now().isoformat(),
+            "processes": plan["processes"],
+            "predicted_makespan_seconds": plan["predicted_makespan_seconds"],
+            "actual_makespan_seconds": max((r["actual_seconds"] for r in results), default=0),
+            "workers": results,
+        }
+        try:
+            with open(RUN_FILE, "w", encoding="utf-8") as f:
+                json.dump(run, f, indent=2)
+        except OSError as e:
+            printf(f"ParallelPlanner: failed to write {RUN_FILE}: {e}")
+        ParallelPlanner.report(plan, run)
+        return next((r["exit_code"] for r in results if r["exit_code"] != 0), 0)
+
+    @staticmethod
+    def report(plan, run=None):
+        """Print predicted against actual makespan per process and the predicted makespan per process count."""
+        predicted = plan["predicted_makespan_seconds"]
+        printf(f"Parallel plan ({plan['scheme']}, {plan['processes']} processes, {plan['scenarios']} scenarios): "
+               f"predicted makespan {_format_seconds(predicted)}")
+        if run:
+            actual = run["actual_makespan_seconds"]
+            ratio = f" ({actual / predicted:.2f}x predicted)" if predicted else ""
+            printf(f"  actual makespan {_format_seconds(actual)}{ratio}")
+            for worker in run["workers"]:
+                printf(f"  process {worker['index']}: predicted {_format_seconds(worker['predicted_seconds'])}, "
+                       f"actual {_format_seconds(worker['actual_seconds'])}, exit code {worker['exit_code']}")
+        printf("  predicted makespan by process count: " + ", ".join(
+            f"{count}: {_format_seconds(seconds)}" for count, seconds in plan["makespan_by_processes"].items()))
+
+
+def _format_seconds(seconds):
+    seconds = round(seconds or 0)
+    return f"{seconds}s" if seconds < 60 else f"{seconds // 60}m{seconds % 60:02d}s"
+
+
+def _load(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    behavex_args = []
+    if "--" in argv:
+        argv, behavex_args = argv[:argv.index("--")], argv[argv.index("--") + 1:]
+
+    parser = argparse.ArgumentParser(prog="python -m utils.ui.parallel_planner",
+                                     description="Duration-aware work lists for BehaveX processes")
+    parser.add_argument("command", choices=["plan", "run", "report"])
+    parser.add_argument("paths", nargs="*", default=["features/all_features"], help="feature files or folders")
+    parser.add_argument("--processes", type=int, default=5, help="number of BehaveX processes")
+    parser.add_argument("--scheme", choices=["feature", "scenario"], default="scenario",
+                        help="unit of work handed to a process")
+    parser.add_argument("--tags", action="append", help="tag expression, as passed to behavex (repeatable)")
+    parser.add_argument("--history", default=ResultAnalytics.CUMULATIVE_DIR,
+                        help="Allure results used for duration estimates")
+    # Options may come before or after the paths ("run --processes 5 --tags X features/all_features")
+    args = parser.parse_intermixed_args(argv)
+
+    if args.command == "report":
+        plan = _load(PLAN_FILE)
+        if plan is None:
+            printf(f"No plan found at {PLAN_FILE}")
+            return 1
+        ParallelPlanner.report(plan, _load(RUN_FILE))
+        return 0
+
+    plan = ParallelPlanner.plan(args.paths, max(1, args.processes), args.scheme, args.tags, args.history)
+    if args.command == "run":
+        return ParallelPlanner.run(plan, behavex_args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+import json
+import os
+import re
+import time
+from datetime import datetime
+
+from utils.logger import printf
+from utils.ui.command_profiler import percentile
+
+# Feature folders under features/all_features are numbered: 04_Patient_Groups, 12_Add_Patient, ...
+_FEATURE_FOLDER = re.compile(r"^\d+_")
+
+# Runs compared against the earlier ones for the duration trend
+TREND_WINDOW = 5
+
+
+def _feature_folder(result):
+    """Feature folder of a result from its titlePath, falling back to the parentSuite label."""
+    title_path = result.get("titlePath") or []
+    folder = next((part for part in reversed(title_path) if _FEATURE_FOLDER.match(part)), None)
+    if folder:
+        return folder
+    labels = result.get("labels") or []
+    return next((l.get("value") for l in labels if l.get("name") == "parentSuite"), None) or "Other"
+
+
+def _record(result):
+    """The fields analytics needs from one Allure result, as stored in the index."""
+    labels = result.get("labels") or []
+    tags = sorted({l.get("value") for l in labels if l.get("name") == "tag" and l.get("value")})
+    start, stop = result.get("start"), result.get("stop")
+    return {
+        "key": result.get("historyId") or result.get("fullName") or result.get("name"),
+        "name": result.get("fullName") or result.get("name") or "",
+        "folder": _feature_folder(result),
+        "tags": tags,
+        "status": result.get("status") or "unknown",
+        "start": start or 0,
+        "duration_ms": stop - start if start and stop else None,
+    }
+
+
+def _duration_stats(durations):
+    if not durations:
+        return {"mean_ms": None, "p95_ms": None}
+    return {"mean_ms": round(sum(durations) / len(durations)), "p95_ms": percentile(durations, 95)}
+
+
+def _trend_pct(durations):
+    """Mean of the last TREND_WINDOW runs against the mean of the runs before them, in percent."""
+    window = min(TREND_WINDOW, len(durations) // 2)
+    if window == 0:
+        return None
+    recent, earlier = durations[-window:], durations[:-window]
+    baseline = sum(earlier) / len(earlier)
+    return round((sum(recent) / len(recent) - baseline) / baseline * 100, 1) if baseline else None
+
+
+class ResultAnalytics:
+    """
+    Flakiness and duration analytics over Reports/cumulative-results.
+
+    The fields used from each *-result.json are cached in .analytics-index.json inside the cumulative
+    directory (next to the accumulate index, so it is archived with it); only results whose size or mtime
+    changed since the last analysis are parsed again and results removed by compaction are dropped.
+    Per scenario (historyId): pass rate, flips between passed and failed/broken over consecutive runs,
+    mean/p95 duration and the duration trend of the last runs; aggregated per feature folder and per tag.
+    Written to Reports/result-analytics.json.
+
+    Usage:
+        python -m utils.ui.cumulative_report_utils analytics [--top 10] [--min-runs 3]
+    """
+
+    CUMULATIVE_DIR = "Reports/cumulative-results"
+    INDEX_FILE = ".analytics-index.json"
+    OUTPUT_FILE = "Reports/result-analytics.json"
+
+    @staticmethod
+    def load_records(cumulative_dir=CUMULATIVE_DIR):
+        """
+        Index the results of `cumulative_dir` incrementally.
+
+        Returns:
+            tuple: (list of result records, {"parsed": n, "cached": n, "dropped": n})
+        """
+        index_path = os.path.join(cumulative_dir, ResultAnalytics.INDEX_FILE)
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)["files"]
+        except (OSError, ValueError, KeyError, TypeError):
+            index = {}
+
+        files, stats = {}, {"parsed": 0, "cached": 0, "dropped": 0}
+        with os.scandir(cumulative_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith("-result.json"):
+                    continue
+                stat = entry.stat()
+                known = index.get(entry.name)
+                if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+                    files[entry.name] = known
+                    stats["cached"] += 1
+                    continue
+                try:
+                    with open(entry.path, encoding="utf-8") as f:
+                        record = _record(json.load(f))
+                except (OSError, ValueError) as e:
+                    printf(f"ResultAnalytics: skipping unreadable result {entry.name}: {e}")
+                    continue
+                files[entry.name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "record": record}
+                stats["parsed"] += 1
+        stats["dropped"] = len(set(index) - set(files))
+
+        if stats["parsed"] or stats["dropped"]:
+            try:
+                tmp_path = f"{index_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"version": 1, "files": files}, f)
+                os.replace(tmp_path, index_path)
+            except OSError as e:
+                printf(f"ResultAnalytics: failed to write index {index_path}: {e}")
+        return [entry["record"] for entry in files.values()], stats
+
+    @staticmethod
+    def analyze(records, min_runs=1):
+        """Per-scenario metrics and their aggregation per feature folder and tag."""
+        by_key = {}
+        for record in records:
+            if record["key"]:
+                by_key.setdefault(record["key"], []).append(record)
+
+        scenarios = {}
+        for key, runs in by_key.items():
+            runs.sort(key=lambda r: r["start"])
+            outcomes = [r["status"] == "passed" for r in runs if r["status"] in ("passed", "failed", "broken")]
+            if len(outcomes) < min_runs:
+                continue
+            durations = [r["duration_ms"] for r in runs if r["duration_ms"] is not None]
+            latest = runs[-1]
+            flips = sum(1 for previous, current in zip(outcomes, outcomes[1:]) if previous != current)
+            scenarios[key] = {
+                "name": latest["name"],
+                "folder": latest["folder"],
+                "tags": latest["tags"],
+                "runs": len(outcomes),
+                "passed": sum(outcomes),
+                "pass_rate": round(sum(outcomes) / len(outcomes) * 100, 1) if outcomes else None,
+                "flips": flips,
+                "flip_rate": round(flips / (len(outcomes) - 1), 3) if len(outcomes) > 1 else 0.0,
+                "last_status": latest["status"],
+                **_duration_stats(durations),
+                "trend_pct": _trend_pct(durations),
+                "_durations": durations,
+            }
+
+        groups = {"folders": {}, "tags": {}}
+        for scenario in scenarios.values():
+            ResultAnalytics._add_to_group(groups["folders"], scenario["folder"], scenario)
+            for tag in scenario["tags"]:
+                ResultAnalytics._add_to_group(groups["tags"], tag, scenario)
+        for group in list(groups["folders"].values()) + list(groups["tags"].values()):
+            durations = group.pop("_durations")
+            group["pass_rate"] = round(group["passed"] / group["runs"] * 100, 1) if group["runs"] else None
+            group.update(_duration_stats(durations))
+        for scenario in scenarios.values():
+            del scenario["_durations"]
+        return scenarios, groups
+
+    @staticmethod
+    def _add_to_group(groups, name, scenario):
+        group = groups.setdefault(name, {"scenarios": 0, "flaky_scenarios": 0, "runs": 0, "passed": 0,
+                                         "flips": 0, "_durations": []})
+        group["scenarios"] += 1
+        group["flaky_scenarios"] += 1 if scenario["flips"] else 0
+        group["runs"] += scenario["runs"]
+        group["passed"] += scenario["passed"]
+        group["flips"] += scenario["flips"]
+        group["_durations"].extend(scenario["_durations"])
+
+    @staticmethod
+    def run(cumulative_dir=CUMULATIVE_DIR, output_file=OUTPUT_FILE, top=10, min_runs=1):
+        """Index, analyse and write the JSON report; returns the report dict (None on failure)."""
+        started = time.monotonic()
+        try:
+            records, index_stats = ResultAnalytics.load_records(cumulative_dir)
+        except OSError as e:
+            printf(f"ResultAnalytics: cannot read {cumulative_dir}: {e}")
+            return None
+        scenarios, groups = ResultAnalytics.analyze(records, min_runs)
+
+        def ranked(key, condition=lambda s: True):
+            chosen = [dict(s, key=k) for k, s in scenarios.items() if condition(s)]
+            return sorted(chosen, key=key)[:top]
+
+        report = {
+            "generated_at": datetime.now().isoformat(),
+            "cumulative_dir": cumulative_dir,
+            "results": len(records),
+            "scenarios_analyzed": len(scenarios),
+            "index": index_stats,
+            "most_flaky": ranked(lambda s: (-s["flips"], s["pass_rate"]), lambda s: s["flips"] > 0),
+            "lowest_pass_rate": ranked(lambda s: (s["pass_rate"], -s["runs"]), lambda s: s["pass_rate"] < 100),
+            "slowest": ranked(lambda s: -(s["p95_ms"] or 0)),
+            "slowing_down": ranked(lambda s: -s["trend_pct"],
+                                   lambda s: s["trend_pct"] is not None and s["trend_pct"] > 0),
+            "folders": dict(sorted(groups["folders"].items())),
+            "tags": dict(sorted(groups["tags"].items())),
+            "scenarios": scenarios,
+        }
+        report["seconds"] = round(time.monotonic() - started, 3)
+        try:
+            os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        except OSError as e:
+            printf(f"ResultAnalytics: failed to write {output_file}: {e}")
+            return None
+        printf(f"ResultAnalytics: {len(scenarios)} scenarios from {len(records)} results "
+               f"({index_stats['parsed']} parsed, {index_stats['cached']} from index) in {report['seconds']}s, "
+               f"report: {output_file}")
+        return report
@@ -0,0 +1,196 @@
+import heapq
+import html
+import json
+import os
+from datetime import datetime
+
+from utils.logger import printf
+
+STATUSES = ("passed", "failed", "broken", "skipped", "unknown")
+
+# Longest failure message kept per result (first line of the assertion / exception)
+MAX_MESSAGE_LENGTH = 300
+
+
+class RunSummary:
+    """
+    Quick summary of Allure results without the Allure CLI (no JVM, no HTML report rebuild).
+
+    Streams over the *-result.json files of a results directory once, keeping only the latest result per
+    test (historyId) by default, since Reports/features keeps the results of earlier local runs. Produces
+    pass/fail counts per parent suite, the slowest scenarios and the failure messages as JSON, Markdown
+    and a self-contained HTML page (Reports/run-summary.*).
+
+    Usage:
+        python -m utils.ui.cumulative_report_utils summary [--dir Reports/features] [--top 10] [--all]
+    """
+
+    OUTPUT_DIR = "Reports"
+    FORMATS = ("json", "md", "html")
+
+    @staticmethod
+    def build(results_dir="Reports/features", latest_only=True, top=10):
+        """Parse the results under `results_dir` and return the summary dict."""
+        latest = {}
+        unreadable = 0
+        with os.scandir(results_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith("-result.json"):
+                    continue
+                try:
+                    with open(entry.path, encoding="utf-8") as f:
+                        result = json.load(f)
+                except (OSError, ValueError):
+                    unreadable += 1
+                    continue
+                key = (result.get("historyId") or entry.name) if latest_only else entry.name
+                current = latest.get(key)
+                if current is None or (result.get("start") or 0) > (current.get("start") or 0):
+                    latest[key] = result
+
+        totals = dict.fromkeys(STATUSES, 0)
+        suites, failures, slowest = {}, [], []
+        first_start, last_stop = None, None
+        for result in latest.values():
+            status = result.get("status") if result.get("status") in STATUSES else "unknown"
+            labels = {label.get("name"): label.get("value") for label in result.get("labels") or []}
+            suite = labels.get("parentSuite") or labels.get("feature") or "Other"
+            start, stop = result.get("start"), result.get("stop")
+            duration = stop - start if start and stop else 0
+
+            totals[status] += 1
+            suite_counts = suites.setdefault(suite, dict.fromkeys(STATUSES, 0))
+            suite_counts[status] += 1
+            if start:
+                first_start = start if first_start is None else min(first_start, start)
+            if stop:
+                last_stop = stop if last_stop is None else max(last_stop, stop)
+
+            entry = {"name": result.get("name", ""), "suite": suite, "status": status, "duration_ms": duration}
+            if len(slowest) < top:
+                heapq.heappush(slowest, (duration, id(entry), entry))
+            elif duration > slowest[0][0]:
+                heapq.heapreplace(slowest, (duration, id(entry), entry))
+            if status in ("failed", "broken"):
+                message = ((result.get("statusDetails") or {}).get("message") or "").strip()
+                message = message.splitlines()[0] if message else ""
+                if len(message) > MAX_MESSAGE_LENGTH:
+                    message = message[:MAX_MESSAGE_LENGTH] + "..."
+                failures.append(dict(entry, message=message))
+
+        for counts in suites.values():
+            counts["total"] = sum(counts.values())
+        totals["total"] = sum(totals.values())
+        return {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "results_dir": results_dir,
+            "latest_only": latest_only,
+            "unreadable_files": unreadable,
+            "totals": totals,
+            "pass_rate": round(totals["passed"] / totals["total"] * 100, 1) if totals["total"] else None,
+            "wall_time_ms": last_stop - first_start if first_start and last_stop else 0,
+            "suites": dict(sorted(suites.items())),
+            "slowest": [entry for _, _, entry in sorted(slowest, key=lambda item: -item[0])],
+            "failures": sorted(failures, key=lambda f: (f["suite"], f["name"])),
+        }
+
+    # -------------------- Renderers --------------------
+
+    @staticmethod
+    def to_markdown(summary):
+        totals = summary["totals"]
+        lines = [
+            f"# Run summary ({summary['generated_at']})",
+            "",
+            f"**{totals['total']} tests** - {totals['passed']} passed, {totals['failed']} failed, "
+            f"{totals['broken']} broken, {totals['skipped']} skipped"
+            + (f" ({summary['pass_rate']}% pass rate)" if summary["pass_rate"] is not None else "")
+            + f", wall time {_format_ms(summary['wall_time_ms'])}",
+            "",
+            "## By parent suite",
+            "",
+            "| Suite | Total | Passed | Failed | Broken | Skipped |",
+            "|---|---:|---:|---:|---:|---:|",
+        ]
+        for suite, counts in summary["suites"].items():
+            lines.append(f"| {_md(suite)} | {counts['total']} | {counts['passed']} | {counts['failed']} "
+                         f"| {counts['broken']} | {counts['skipped']} |")
+        lines += ["", "## Slowest scenarios", "", "| Scenario | Suite | Status | Duration |", "|---|---|---|---:|"]
+        for entry in summary["slowest"]:
+            lines.append(f"| {_md(entry['name'])} | {_md(entry['suite'])} | {entry['status']} "
+                         f"| {_format_ms(entry['duration_ms'])} |")
+        if summary["failures"]:
+            lines += ["", "## Failures", "", "| Scenario | Suite | Status | Message |", "|---|---|---|---|"]
+            for failure in summary["failures"]:
+                lines.append(f"| {_md(failure['name'])} | {_md(failure['suite'])} | {failure['status']} "
+                             f"| {_md(failure['message'])} |")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def to_html(summary):
+        totals = summary["totals"]
+
+        def table(headers, rows):
+            head = "".join(f"<th>{html.escape(h)}</th>" for h in headers)
+            body = "".join("<tr>" + "".join(f"<td>{html.escape(str(c))}</td>" for c in row) + "</tr>"
+                           for row in rows)
+            return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+        suites = table(["Suite", "Total", "Passed", "Failed", "Broken", "Skipped"],
+                       [[suite, c["total"], c["passed"], c["failed"], c["broken"], c["skipped"]]
+                        for suite, c in summary["suites"].items()])
+        slowest = table(["Scenario", "Suite", "Status", "Duration"],
+                        [[e["name"], e["suite"], e["status"], _format_ms(e["duration_ms"])]
+                         for e in summary["slowest"]])
+        failures = table(["Scenario", "Suite", "Status", "Message"],
+                         [[f["name"], f["suite"], f["status"], f["message"]] for f in summary["failures"]])
+        pass_rate = f" ({summary['pass_rate']}% pass rate)" if summary["pass_rate"] is not None else ""
+        return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Run summary</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; margin-bottom: 2em; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: left; }}
+th {{ background: #f0f0f0; }}
+.passed {{ color: #2e7d32; }} .failed {{ color: #c62828; }}
+</style></head><body>
+<h1>Run summary</h1>
+<p>{html.escape(summary['generated_at'])} - {html.escape(summary['results_dir'])}</p>
+<p><b>{totals['total']} tests</b>: <span class="passed">{totals['passed']} passed</span>,
+<span class="failed">{totals['failed']} failed</span>, {totals['broken']} broken, {totals['skipped']} skipped{pass_rate},
+wall time {_format_ms(summary['wall_time_ms'])}</p>
+<h2>By parent suite</h2>{suites}
+<h2>Slowest scenarios</h2>{slowest}
+<h2>Failures</h2>{failures if summary['failures'] else '<p>None</p>'}
+</body></html>
+"""
+
+    @staticmethod
+    def write(summary, output_dir=OUTPUT_DIR, formats=FORMATS):
+        """Write Reports/run-summary.<format> for each format; returns the written paths."""
+        os.makedirs(output_dir, exist_ok=True)
+        renderers = {
+            "json": lambda s: json.dumps(s, indent=2),
+            "md": RunSummary.to_markdown,
+            "html": RunSummary.to_html,
+        }
+        paths = []
+        for fmt in formats:
+            path = os.path.join(output_dir, f"run-summary.{fmt}")
+            try:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(renderers[fmt](summary))
+                paths.append(path)
+            except OSError as e:
+                printf(f"RunSummary: failed to write {path}: {e}")
+        return paths
+
+
+def _format_ms(ms):
+    seconds = (ms or 0) / 1000
+    return f"{seconds:.1f}s" if seconds < 60 else f"{int(seconds // 60)}m {seconds % 60:.0f}s"
+
+
+def _md(text):
+    """Escape a value for a Markdown table cell."""
+    return str(text).replace("|", "\\|").replace("\n", " ")
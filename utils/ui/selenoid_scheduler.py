@@ -0,0 +1,231 @@
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import requests
+
+from utils.logger import printf
+from utils.ui.command_profiler import summarize
+from utils.ui.config_reader import get_selenoid_scheduler_config
+
+
+class SelenoidSlotTimeout(ConnectionError):
+    """Raised when no Selenoid slot became free within the configured slot timeout."""
+
+
+class SelenoidStatus:
+    """Parsed Selenoid /status payload."""
+
+    def __init__(self, payload):
+        self.total = int(payload.get("total", 0) or 0)
+        self.used = int(payload.get("used", 0) or 0)
+        self.queued = int(payload.get("queued", 0) or 0)
+        self.pending = int(payload.get("pending", 0) or 0)
+        # Older Selenoid/GGR builds only report total; treat them as having every slot free
+        self.reports_usage = "used" in payload
+
+    @property
+    def free(self):
+        if not self.reports_usage:
+            return self.total
+        # Sessions still being created by our own workers are represented by their queue tickets, not pending
+        return max(0, self.total - self.used - self.queued)
+
+
+class SelenoidScheduler:
+    """
+    Capacity-aware gate in front of Selenoid session creation.
+
+    Reads total/used/queued/pending from the hub's /status endpoint over a shared keep-alive connection and
+    caches the result for a short TTL. Callers that need a browser take a ticket in a per-hub queue directory
+    (shared by every BehaveX worker on the machine) and may only create a session once their ticket is
+    within the number of free slots, so workers are served in arrival order instead of racing into the
+    create_remote_driver retry loop. Time spent waiting for a slot is recorded as a queue-wait metric.
+    """
+
+    REPORT_DIR = "Reports/profiles"
+    # A ticket whose owner has not refreshed it for this long belongs to a dead worker
+    # (owners refresh while waiting; this also has to cover a slow webdriver.Remote start)
+    STALE_TICKET_SECONDS = 120
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, selenoid_url, slot_timeout=300, status_cache_ttl=1.0, max_backoff=5.0, queue_dir=None):
+        self.status_url = f"{selenoid_url.replace('/wd/hub', '').rstrip('/')}/status"
+        self.slot_timeout = slot_timeout
+        self.status_cache_ttl = status_cache_ttl
+        self.max_backoff = max_backoff
+        url_hash = hashlib.sha1(self.status_url.encode("utf-8")).hexdigest()[:10]
+        self.queue_dir = queue_dir or os.path.join(tempfile.gettempdir(), f"hbox-selenoid-queue-{url_hash}")
+        self._http = requests.Session()
+        self._status = None
+        self._status_at = 0.0
+        self._lock = threading.Lock()
+        self._queue_waits = []
+
+    @classmethod
+    def for_url(cls, selenoid_url):
+        """Return the process-wide scheduler for `selenoid_url`, creating it from config on first use."""
+        with cls._instances_lock:
+            scheduler = cls._instances.get(selenoid_url)
+            if scheduler is None:
+                scheduler = cls(selenoid_url, **get_selenoid_scheduler_config())
+                cls._instances[selenoid_url] = scheduler
+            return scheduler
+
+    # -------------------- Status --------------------
+
+    def get_status(self, max_age=None):
+        """
+        Return the hub status, reusing a cached value younger than `max_age` seconds (default: cache TTL).
+        Returns None if the hub cannot be reached.
+        """
+        max_age = self.status_cache_ttl if max_age is None else max_age
+        with self._lock:
+            if self._status is not None and time.monotonic() - self._status_at <= max_age:
+                return self._status
+        try:
+            response = self._http.get(self.status_url, timeout=5)
+            if response.status_code != 200:
+                printf(f"Selenoid status returned HTTP {response.status_code}")
+                return None
+            status = SelenoidStatus(response.json())
+        except (requests.RequestException, ValueError) as e:
+            printf(f"Error checking Selenoid status: {e}")
+            return None
+        with self._lock:
+            self._status = status
+            self._status_at = time.monotonic()
+        return status
+
+    def wait_until_ready(self, timeout=30):
+        """Wait until the hub reports at least one browser slot (free or not)."""
+        deadline = time.monotonic() + timeout
+        while True:
+            status = self.get_status()
+            if status is not None and status.total > 0:
+                return status
+            if time.monotonic() >= deadline:
+                raise ConnectionError("Selenoid did not become ready in time")
+            time.sleep(1)
+
+    # -------------------- Slot queue --------------------
+
+    @contextmanager
+    def slot(self, session_name=""):
+        """
+        Wait for a free Selenoid slot in FIFO order and hold the turn while the session is being created.
+
+        Usage:
+            with scheduler.slot(session_name):
+                driver = webdriver.Remote(...)
+        """
+        ticket = self._take_ticket()
+        started = time.monotonic()
+        try:
+            self._wait_for_turn(ticket, session_name)
+            waited = time.monotonic() - started
+            with self._lock:
+                self._queue_waits.append(waited)
+            if waited >= 1:
+                printf(f"Selenoid slot acquired for '{session_name}' after {waited:.1f}s in queue")
+            yield waited
+        finally:
+            self._drop_ticket(ticket)
+            # The session we just created (or failed to create) changes used/free, so never reuse the old status
+            with self._lock:
+                self._status = None
+
+    def _take_ticket(self):
+        os.makedirs(self.queue_dir, exist_ok=True)
+        name = f"{time.time_ns():020d}-{os.getpid()}-{threading.get_ident()}"
+        path = os.path.join(self.queue_dir, name)
+        with open(path, "w", encoding="utf-8"):
+            pass
+        return path
+
+    @staticmethod
+    def _drop_ticket(ticket):
+        try:
+            os.remove(ticket)
+        except OSError:
+            pass
+
+    def _queue_position(self, ticket):
+        """0-based position of `ticket` among live tickets; stale tickets from dead workers are removed."""
+        now = time.time()
+        position = 0
+        for name in sorted(os.listdir(self.queue_dir)):
+            path = os.path.join(self.queue_dir, name)
+            if path == ticket:
+                return position
+            try:
+                if now - os.path.getmtime(path) > self.STALE_TICKET_SECONDS:
+                    os.remove(path)
+                    continue
+            except OSError:
+                continue
+            position += 1
+        return position
+
+    def _wait_for_turn(self, ticket, session_name):
+        deadline = time.monotonic() + self.slot_timeout
+        backoff = 0.25
+        logged_position = None
+        while True:
+            # Refresh the ticket so other workers do not treat it as stale while we wait
+            os.utime(ticket, None)
+            position = self._queue_position(ticket)
+            status = self.get_status()
+            if status is not None and position < status.free:
+                # Confirm against a fresh status so a cached value cannot admit more workers than there are slots
+                status = self.get_status(max_age=0)
+                if status is not None and position < status.free:
+                    return
+
+            if time.monotonic() >= deadline:
+                raise SelenoidSlotTimeout(f"No free Selenoid slot for '{session_name}' within {self.slot_timeout}s")
+            if position != logged_position:
+                free = status.free if status else "?"
+                total = status.total if status else "?"
+                printf(f"Waiting for Selenoid slot for '{session_name}': position {position + 1} in queue, "
+                       f"{free}/{total} slots free")
+                logged_position = position
+            time.sleep(backoff + random.uniform(0, backoff / 2))
+            backoff = min(backoff * 2, self.max_backoff)
+
+    # -------------------- Metrics --------------------
+
+    def queue_wait_stats(self):
+        """Summary (count/total/p50/p95/max seconds) of the time spent waiting for a slot."""
+        with self._lock:
+            return summarize(list(self._queue_waits))
+
+    @classmethod
+    def write_run_report(cls):
+        """Write Reports/profiles/selenoid-queue-<pid>.json with queue-wait stats per hub."""
+        with cls._instances_lock:
+            stats = {s.status_url: s.queue_wait_stats() for s in cls._instances.values()}
+        stats = {url: summary for url, summary in stats.items() if summary["count"]}
+        if not stats:
+            return None
+        report = {"pid": os.getpid(), "finished_at": datetime.now().isoformat(), "queue_wait_seconds": stats}
+        try:
+            os.makedirs(cls.REPORT_DIR, exist_ok=True)
+            path = os.path.join(cls.REPORT_DIR, f"selenoid-queue-{os.getpid()}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            for url, summary in stats.items():
+                printf(f"SelenoidScheduler: {summary['count']} sessions, queue wait p95 {summary['p95']:.1f}s "
+                       f"max {summary['max']:.1f}s ({url})")
+            return path
+        except Exception as e:
+            printf(f"SelenoidScheduler: failed to write queue report: {e}")
+            return None
@@ -0,0 +1,144 @@
+import time
+import threading
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from features.commons.locators import LoginPageLocators
+from features.commons.routes import Routes
+from features.commons.scripts import SessionScripts
+from features.pages.base_page import BasePage
+from utils.logger import printf
+from utils.ui.config_reader import is_session_reuse_enabled, get_session_max_age
+
+# Keys accepted by WebDriver add_cookie; anything else returned by get_cookies is dropped
+_COOKIE_KEYS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+class SessionVault:
+    """
+    Per-process cache of authenticated browser state (cookies + localStorage + sessionStorage) keyed by
+    role and environment. The first successful UI login for a role is captured; later features restore
+    that state instead of driving the login form, and fall back to a real login if the probe fails.
+    """
+
+    PROBE_TIMEOUT = 5
+    _sessions = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _key(user_role):
+        return user_role, Routes.get_env()
+
+    @staticmethod
+    def capture(driver: WebDriver, user_role):
+        """Store the current authenticated state of `driver` for `user_role`. Returns True if captured."""
+        if not is_session_reuse_enabled():
+            return False
+        try:
+            storage = driver.execute_script(SessionScripts.CAPTURE_STORAGE)
+            state = {
+                "cookies": driver.get_cookies(),
+                "local_storage": storage.get("local", {}),
+                "session_storage": storage.get("session", {}),
+                "landing_url": driver.current_url,
+                "captured_at": time.time(),
+            }
+        except WebDriverException as e:
+            printf(f"SessionVault: failed to capture session for {user_role}: {e}")
+            return False
+
+        with SessionVault._lock:
+            SessionVault._sessions[SessionVault._key(user_role)] = state
+        printf(f"SessionVault: captured session for {user_role} ({len(state['cookies'])} cookies)")
+        return True
+
+    @staticmethod
+    def get_state(user_role):
+        """Return the cached state for `user_role` if present and not older than the configured max age."""
+        key = SessionVault._key(user_role)
+        with SessionVault._lock:
+            state = SessionVault._sessions.get(key)
+        if state is None:
+            return None
+        if time.time() - state["captured_at"] > get_session_max_age():
+            printf(f"SessionVault: cached session for {user_role} is older than max age, discarding")
+            SessionVault.invalidate(user_role)
+            return None
+        return state
+
+    @staticmethod
+    def put_state(user_role, state):
+        """Store an externally obtained state (same shape as capture) for `user_role`."""
+        with SessionVault._lock:
+            SessionVault._sessions[SessionVault._key(user_role)] = state
+
+    @staticmethod
+    def invalidate(user_role):
+        with SessionVault._lock:
+            SessionVault._sessions.pop(SessionVault._key(user_role), None)
+
+    @staticmethod
+    def clear():
+        with SessionVault._lock:
+            SessionVault._sessions.clear()
+
+    @staticmethod
+    def restore(driver: WebDriver, user_role):
+        """
+        Apply the cached state for `user_role` to `driver` and verify it with a cheap probe.
+
+        Returns:
+            bool: True if the driver is now authenticated, False if there was nothing to restore or the
+                  restored session was rejected (the cached entry is then invalidated).
+        """
+        if not is_session_reuse_enabled():
+            return False
+        state = SessionVault.get_state(user_role)
+        if state is None:
+            return False
+
+        printf(f"SessionVault: restoring cached session for {user_role}")
+        try:
+            SessionVault.apply_state(driver, state)
+            if SessionVault.probe(driver):
+                printf(f"SessionVault: restored session for {user_role} is valid")
+                return True
+        except WebDriverException as e:
+            printf(f"SessionVault: failed to restore session for {user_role}: {e}")
+
+        printf(f"SessionVault: cached session for {user_role} expired, falling back to UI login")
+        SessionVault.invalidate(user_role)
+        SessionVault.reset_browser_state(driver)
+        return False
+
+    @staticmethod
+    def apply_state(driver: WebDriver, state):
+        """Load the app origin, replace cookies and storage with `state`, then open its landing URL."""
+        # Cookies and storage can only be set for the origin that is currently loaded
+        driver.get(Routes.get_full_url(Routes.LOGIN))
+        driver.delete_all_cookies()
+        for cookie in state["cookies"]:
+            try:
+                driver.add_cookie({k: v for k, v in cookie.items() if k in _COOKIE_KEYS})
+            except WebDriverException as e:
+                printf(f"SessionVault: skipped cookie '{cookie.get('name')}': {e}")
+        driver.execute_script(SessionScripts.RESTORE_STORAGE, state["local_storage"], state["session_storage"])
+        driver.get(state["landing_url"])
+
+    @staticmethod
+    def probe(driver: WebDriver):
+        """Cheap validity check: not bounced back to the login form and the app header is rendered."""
+        login_url = Routes.get_full_url(Routes.LOGIN).rstrip("/")
+        if driver.current_url.rstrip("/") == login_url:
+            return False
+        return BasePage(driver).is_element_visible(LoginPageLocators.HEADER_LOGO, timeout=SessionVault.PROBE_TIMEOUT)
+
+    @staticmethod
+    def reset_browser_state(driver: WebDriver):
+        """Drop cookies and storage so a fresh UI login starts from a clean state."""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script(SessionScripts.CLEAR_STORAGE)
+        except WebDriverException as e:
+            printf(f"SessionVault: failed to reset browser state: {e}")
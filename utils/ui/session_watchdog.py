@@ -0,0 +1,195 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from selenium.webdriver.remote.command import Command
+from urllib3.exceptions import MaxRetryError, ProtocolError
+
+from utils.logger import printf
+from utils.ui.command_profiler import summarize
+from utils.ui.config_reader import is_session_recovery_enabled
+
+# W3C error codes and driver messages meaning the browser session is gone for good (Chrome crash,
+# Selenoid session timeout, node restart); retrying a locator against such a session can never succeed
+_LOST_SESSION_MARKERS = (
+    "invalid session id", "no such session", "session deleted", "session not found", "session timed out",
+    "chrome not reachable", "disconnected: not connected to devtools",
+)
+
+# Transport errors raised when the driver/browser process behind the session has died
+_TRANSPORT_ERRORS = (ConnectionError, MaxRetryError, ProtocolError)
+
+
+class SessionLostException(InvalidSessionIdException):
+    """Raised, without contacting the browser, for commands sent to a driver whose session is known to be gone."""
+
+
+def is_session_lost_error(error):
+    """True if `error` means the WebDriver session is dead (as opposed to a page/locator problem)."""
+    if isinstance(error, (InvalidSessionIdException,) + _TRANSPORT_ERRORS):
+        return True
+    return isinstance(error, WebDriverException) and _lost_session_reason(str(error)) is not None
+
+
+def _lost_session_reason(text):
+    text = (text or "").lower()
+    return next((marker for marker in _LOST_SESSION_MARKERS if marker in text), None)
+
+
+def _response_error(response):
+    """'<error>: <message>' of a failed command response, or None."""
+    value = response.get("value") if isinstance(response, dict) else None
+    if isinstance(value, dict) and value.get("error"):
+        return f"{value['error']}: {value.get('message', '')}"
+    return None
+
+
+class SessionWatchdog:
+    """
+    Detects dead browser sessions centrally (SESSION_RECOVERY=true or [Session] recover_lost_sessions = true).
+
+    DriverManager wraps each driver's command executor: the first response or transport error that means the
+    session is gone marks the driver as lost, and every later command fails immediately with
+    SessionLostException instead of waiting out locator timeouts. The last URL the driver loaded (driver.get)
+    or reported (driver.current_url, read by the page objects' URL checks) is kept, without extra commands,
+    so DriverManager.recover_driver can bring a replacement back to the same route. Steps that failed on a
+    lost session are re-run once after recovery (enable_step_retry). Each recovery is written to
+    Reports/profiles/session-recoveries-<pid>.json.
+    """
+
+    REPORT_DIR = "Reports/profiles"
+
+    _lock = threading.Lock()
+    _recoveries = []
+
+    @staticmethod
+    def is_enabled():
+        return is_session_recovery_enabled()
+
+    @staticmethod
+    def instrument(driver):
+        """Wrap driver.command_executor.execute once; later calls are no-ops."""
+        executor = driver.command_executor
+        if getattr(executor, "_hbox_watched", False):
+            return driver
+        original_execute = executor.execute
+        executor._hbox_session_lost = None
+        executor._hbox_last_url = None
+
+        def watched_execute(command, params):
+            if executor._hbox_session_lost and command != Command.QUIT:
+                raise SessionLostException(f"Browser session is gone ({executor._hbox_session_lost}); "
+                                           f"'{command}' not sent")
+            try:
+                response = original_execute(command, params)
+            except _TRANSPORT_ERRORS as e:
+                SessionWatchdog._mark_lost(executor, f"{type(e).__name__}: {e}")
+                raise SessionLostException(f"Browser session is gone ({type(e).__name__})") from e
+
+            error = _response_error(response)
+            if error:
+                if _lost_session_reason(error):
+                    SessionWatchdog._mark_lost(executor, error)
+            elif command == Command.GET:
+                executor._hbox_last_url = params.get("url")
+            elif command == Command.GET_CURRENT_URL:
+                executor._hbox_last_url = response.get("value")
+            return response
+
+        executor.execute = watched_execute
+        executor._hbox_watched = True
+        return driver
+
+    @staticmethod
+    def _mark_lost(executor, reason):
+        if not executor._hbox_session_lost:
+            executor._hbox_session_lost = reason.splitlines()[0] if reason else "unknown"
+            printf(f"[WARN] SessionWatchdog: browser session lost: {executor._hbox_session_lost}")
+
+    @staticmethod
+    def lost_reason(driver):
+        """Why the session of `driver` was marked as lost, or None if it is (as far as we know) alive."""
+        return getattr(getattr(driver, "command_executor", None), "_hbox_session_lost", None)
+
+    @staticmethod
+    def is_lost(driver):
+        return SessionWatchdog.lost_reason(driver) is not None
+
+    @staticmethod
+    def last_url(driver):
+        return getattr(getattr(driver, "command_executor", None), "_hbox_last_url", None)
+
+    # -------------------- Step retry --------------------
+
+    @staticmethod
+    def enable_step_retry(scenario, recover):
+        """
+        Re-run each step of `scenario` once if it failed and recover(step) restored a lost session.
+        Background steps are shared between scenarios, so every step is wrapped only once.
+        """
+        for step in scenario.all_steps:
+            if getattr(step, "_hbox_session_retry", False):
+                continue
+            original_run = step.run
+
+            def run(runner, quiet=False, capture=True, _step=step, _run=original_run):
+                if _run(runner, quiet, capture):
+                    return True
+                if not recover(_step):
+                    return False
+                printf(f"SessionWatchdog: retrying step '{_step.name}' on the recovered session")
+                return _run(runner, quiet, capture)
+
+            step.run = run
+            step._hbox_session_retry = True
+
+    # -------------------- Metrics --------------------
+
+    @staticmethod
+    def record_recovery(role, reason, seconds, recovered, authenticated=None, route=None, step=None):
+        entry = {
+            "role": role,
+            "reason": reason,
+            "seconds": round(seconds, 3),
+            "recovered": recovered,
+            "authenticated": authenticated,
+            "route": route,
+            "step": step,
+            "at": datetime.now().isoformat(),
+        }
+        with SessionWatchdog._lock:
+            SessionWatchdog._recoveries.append(entry)
+        printf(f"[WARN] SessionWatchdog: {'recovered' if recovered else 'could not recover'} driver for role "
+               f"'{role}' in {seconds:.1f}s (reason: {reason}, route: {route})")
+
+    @staticmethod
+    def write_run_report():
+        """Write Reports/profiles/session-recoveries-<pid>.json if any session had to be recovered."""
+        with SessionWatchdog._lock:
+            recoveries = list(SessionWatchdog._recoveries)
+        if not recoveries:
+            return None
+        by_role = {}
+        for entry in recoveries:
+            by_role[entry["role"]] = by_role.get(entry["role"], 0) + 1
+        report = {
+            "pid": os.getpid(),
+            "finished_at": datetime.now().isoformat(),
+            "recoveries": len(recoveries),
+            "failed": sum(1 for e in recoveries if not e["recovered"]),
+            "by_role": by_role,
+            "recovery_seconds": summarize([e["seconds"] for e in recoveries]),
+            "events": recoveries,
+        }
+        try:
+            os.makedirs(SessionWatchdog.REPORT_DIR, exist_ok=True)
+            path = os.path.join(SessionWatchdog.REPORT_DIR, f"session-recoveries-{os.getpid()}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            printf(f"SessionWatchdog: {len(recoveries)} session recovery(ies) this run, report: {path}")
+            return path
+        except Exception as e:
+            printf(f"SessionWatchdog: failed to write run report: {e}")
+            return None
@@ -0,0 +1,142 @@
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+import allure
+from allure_commons.types import AttachmentType
+
+from utils.logger import printf
+from utils.ui.config_reader import get_sleep_budget
+
+
+class SleepBudgetExceeded(AssertionError):
+    """Raised from after_scenario when a scenario's fixed-delay total exceeds the budget and the action is 'fail'."""
+
+
+def _call_site(frame):
+    filename = os.path.relpath(frame.f_code.co_filename)
+    return f"{filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+def pause(seconds, reason=None):
+    """
+    Timed pause for page objects and steps, used instead of time.sleep.
+
+    Every pause is recorded with its call site and counted against the current scenario's sleep budget
+    ([Profiling] sleep_budget_seconds); pause() itself never raises. The budget is checked when the scenario
+    ends (see SleepTracker.end_scenario). Polling loops wait with time.sleep, since their interval is not a
+    fixed delay.
+    """
+    SleepTracker.record(seconds, _call_site(sys._getframe(1)), reason)
+    time.sleep(seconds)
+
+
+class SleepTracker:
+    """Per-scenario and per-run accounting of fixed delays issued through pause()."""
+
+    REPORT_DIR = "Reports/profiles"
+
+    _lock = threading.Lock()
+    _scenario_name = "<outside scenarios>"
+    _scenario_total = 0.0
+    _scenario_sites = {}   # call_site -> [count, total]
+    _budget_warned = False
+    _run_sites = {}        # call_site -> [count, total]
+    _run_scenarios = {}    # scenario name -> total seconds
+
+    @staticmethod
+    def record(seconds, call_site, reason=None):
+        budget, _ = get_sleep_budget()
+        with SleepTracker._lock:
+            for sites in (SleepTracker._scenario_sites, SleepTracker._run_sites):
+                entry = sites.setdefault(call_site, [0, 0.0])
+                entry[0] += 1
+                entry[1] += seconds
+            SleepTracker._scenario_total += seconds
+            total = SleepTracker._scenario_total
+            warn = budget and total > budget and not SleepTracker._budget_warned
+            if warn:
+                SleepTracker._budget_warned = True
+
+        if warn:
+            printf(f"[WARN] Sleep budget exceeded in '{SleepTracker._scenario_name}': {total:.1f}s > {budget:.1f}s "
+                   f"at {call_site}" + (f" ({reason})" if reason else ""))
+
+    # -------------------- Behave Hook Integration --------------------
+
+    @staticmethod
+    def start_scenario(scenario):
+        with SleepTracker._lock:
+            SleepTracker._scenario_name = scenario.name
+            SleepTracker._scenario_total = 0.0
+            SleepTracker._scenario_sites = {}
+            SleepTracker._budget_warned = False
+
+    @staticmethod
+    def end_scenario(scenario):
+        """
+        Log and attach the scenario's pause breakdown, then return it.
+
+        Raises:
+            SleepBudgetExceeded: the scenario's total is over the budget and sleep_budget_action is 'fail'
+        """
+        budget, action = get_sleep_budget()
+        with SleepTracker._lock:
+            total = SleepTracker._scenario_total
+            sites = dict(SleepTracker._scenario_sites)
+            SleepTracker._run_scenarios[scenario.name] = SleepTracker._run_scenarios.get(scenario.name, 0.0) + total
+            SleepTracker._scenario_name = "<outside scenarios>"
+
+        if not sites:
+            return None
+        summary = {
+            "scenario": scenario.name,
+            "total_seconds": round(total, 2),
+            "by_call_site": SleepTracker._format_sites(sites),
+        }
+        printf(f"Fixed delays in '{scenario.name}': {total:.1f}s across {sum(c for c, _ in sites.values())} pauses")
+        try:
+            allure.attach(json.dumps(summary, indent=2), name=f"sleeps_{scenario.name}",
+                          attachment_type=AttachmentType.JSON)
+        except Exception as e:
+            printf(f"SleepTracker: failed to attach scenario summary: {e}")
+
+        if budget and total > budget and action == "fail":
+            top_site = next(iter(summary["by_call_site"]))
+            raise SleepBudgetExceeded(f"Sleep budget exceeded in '{scenario.name}': {total:.1f}s > {budget:.1f}s "
+                                      f"(largest: {top_site})")
+        return summary
+
+    @staticmethod
+    def write_run_report():
+        """Write Reports/profiles/sleeps-<pid>.json with per-scenario and per-call-site totals."""
+        with SleepTracker._lock:
+            sites = dict(SleepTracker._run_sites)
+            scenarios = dict(SleepTracker._run_scenarios)
+        if not sites:
+            return None
+        report = {
+            "pid": os.getpid(),
+            "finished_at": datetime.now().isoformat(),
+            "total_seconds": round(sum(total for _, total in sites.values()), 2),
+            "by_scenario": {k: round(v, 2) for k, v in sorted(scenarios.items(), key=lambda kv: -kv[1])},
+            "by_call_site": SleepTracker._format_sites(sites),
+        }
+        try:
+            os.makedirs(SleepTracker.REPORT_DIR, exist_ok=True)
+            path = os.path.join(SleepTracker.REPORT_DIR, f"sleeps-{os.getpid()}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            printf(f"SleepTracker: {report['total_seconds']}s of fixed delays - report written to {path}")
+            return path
+        except Exception as e:
+            printf(f"SleepTracker: failed to write run report: {e}")
+            return None
+
+    @staticmethod
+    def _format_sites(sites):
+        ordered = sorted(sites.items(), key=lambda kv: -kv[1][1])
+        return {site: {"count": count, "total_seconds": round(total, 2)} for site, (count, total) in ordered}
@@ -1,16 +1,19 @@
 import os
 import tempfile
 import time
-import requests
 from utils.logger import printf
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
-from utils.ui.config_reader import is_headless_mode, is_running_in_pipeline, read_configuration, get_browser_config, \
-    get_selenoid_url
+from utils.ui.config_reader import is_headless_mode, is_running_in_pipeline, get_browser_config, \
+    get_selenoid_url, Settings, is_network_events_enabled, get_browser_console_config
+from utils.ui.browser_console import enable_browser_logs
 from utils.ui.chromedriver_setup import setup_chromedriver
+from utils.ui.lean_profile import LeanProfile
+from utils.ui.network_events import enable_network_events
+from utils.ui.selenoid_scheduler import SelenoidScheduler, SelenoidSlotTimeout
 
 
 class WebDriverHelper:
@@ -18,14 +21,17 @@ class WebDriverHelper:
     WINDOW_SIZE_ARG = "--window-size=1920,1080"
 
     @staticmethod
-    def create_driver(browser_name, context):
-        """Create a local WebDriver (Chrome, Firefox, Edge)"""
+    def create_driver(browser_name, context, user_data_dir=None):
+        """
+        Create a local WebDriver (Chrome, Firefox, Edge).
+        Chrome uses `user_data_dir` as its profile when given (see ChromeProfileManager), else a new temp dir.
+        """
         browser_name = browser_name.lower()
         temp_user_data_dir = None
 
         if browser_name == "chrome":
             options = ChromeOptions()
-            temp_user_data_dir = tempfile.mkdtemp()
+            temp_user_data_dir = user_data_dir or tempfile.mkdtemp()
 
             prefs = {
                 "profile.default_content_setting_values.notifications": 1,
@@ -34,6 +40,9 @@ class WebDriverHelper:
                 "profile.default_content_setting_values.geolocation": 1,
                 "profile.default_content_setting_values.media_stream": 1
             }
+            lean = LeanProfile.is_active(context)
+            if lean:
+                LeanProfile.extend_prefs(prefs)
 
             options.add_experimental_option("prefs", prefs)
             options.add_argument(f"--user-data-dir={temp_user_data_dir}")
@@ -46,19 +55,18 @@ class WebDriverHelper:
             options.add_argument("--disable-logging")
             options.add_argument("--log-level=3")
             options.add_experimental_option("excludeSwitches", ["enable-logging"])
+            if is_network_events_enabled():
+                enable_network_events(options)
+            if get_browser_console_config()["enabled"]:
+                enable_browser_logs(options)
 
             if is_headless_mode():
                 options.add_argument("--headless=new")
                 printf("Running Chrome in headless mode")
 
-            if os.getenv('USE_SYSTEM_CHROMEDRIVER') or is_running_in_pipeline():
-                driver = webdriver.Chrome(options=options)
-            else:
-                if hasattr(context, 'chromedriver_path') and context.chromedriver_path:
-                    service = ChromeService(executable_path=context.chromedriver_path)
-                    driver = webdriver.Chrome(service=service, options=options)
-                else:
-                    driver = webdriver.Chrome(options=options)
+            driver = WebDriverHelper._start_chrome(context, options)
+            if lean:
+                LeanProfile.apply(driver)
 
         elif browser_name == "firefox":
             options = FirefoxOptions()
@@ -80,21 +88,36 @@ class WebDriverHelper:
 
         return driver, temp_user_data_dir
 
+    @staticmethod
+    def _start_chrome(context, options):
+        if os.getenv('USE_SYSTEM_CHROMEDRIVER') or is_running_in_pipeline():
+            return webdriver.Chrome(options=options)
+        if hasattr(context, 'chromedriver_path') and context.chromedriver_path:
+            service = ChromeService(executable_path=context.chromedriver_path)
+            return webdriver.Chrome(service=service, options=options)
+        return webdriver.Chrome(options=options)
+
+    @staticmethod
+    def build_profile_template(context, user_data_dir):
+        """Start headless Chrome once with an empty `user_data_dir` so it initialises the profile, then quit."""
+        options = ChromeOptions()
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        driver = WebDriverHelper._start_chrome(context, options)
+        try:
+            driver.get("about:blank")
+        finally:
+            driver.quit()
+
     @staticmethod
     def wait_for_selenoid_ready(selenoid_url, timeout=30):
-        """Wait until Selenoid is ready before creating a session"""
-        for _ in range(timeout):
-            try:
-                r = requests.get(f"{selenoid_url.replace('/wd/hub', '')}/status")
-                if r.status_code == 200:
-                    status = r.json()
-                    if status.get("total", 0) > 0:
-                        printf("Selenoid is ready")
-                        return True
-            except Exception as e:
-                printf("Error checking Selenoid status:", e)
-            time.sleep(1)
-        raise ConnectionError("Selenoid did not become ready in time")
+        """Wait until Selenoid is ready before creating a session (status is cached per process)"""
+        status = SelenoidScheduler.for_url(selenoid_url).wait_until_ready(timeout)
+        printf(f"Selenoid is ready ({status.free}/{status.total} slots free)")
+        return True
 
     @staticmethod
     def create_remote_driver(browser_name, session_name, context, selenoid_url=None):
@@ -107,11 +130,12 @@ class WebDriverHelper:
         printf(f"Creating remote driver for {browser_name} connecting to: {selenoid_url}")
         WebDriverHelper.wait_for_selenoid_ready(selenoid_url)
 
-        # Read capabilities dynamically from config.ini
-        enable_vnc = read_configuration("Selenoid", "enable_vnc").lower() in ("true", "1", "yes")
-        enable_video = read_configuration("Selenoid", "enable_video").lower() in ("true", "1", "yes")
-        enable_log = read_configuration("Selenoid", "enable_log").lower() in ("true", "1", "yes")
-        session_timeout = read_configuration("Selenoid", "session_timeout") or "300s"
+        # Read capabilities from the cached config.ini settings
+        settings = Settings.get()
+        enable_vnc = settings.selenoid_enable_vnc
+        enable_video = settings.selenoid_enable_video
+        enable_log = settings.selenoid_enable_log
+        session_timeout = settings.selenoid_session_timeout
 
         # Setup browser options
         if browser_name == "chrome":
@@ -136,7 +160,13 @@ class WebDriverHelper:
                 "profile.default_content_setting_values.geolocation": 1,
                 "profile.default_content_setting_values.media_stream": 1
             }
+            if LeanProfile.is_active(context):
+                LeanProfile.extend_prefs(prefs)
             options.add_experimental_option("prefs", prefs)
+            if is_network_events_enabled():
+                enable_network_events(options)
+            if get_browser_console_config()["enabled"]:
+                enable_browser_logs(options)
 
         elif browser_name == "firefox":
             options = FirefoxOptions()
@@ -158,17 +188,21 @@ class WebDriverHelper:
             'sessionTimeout': session_timeout
         })
 
-        # Retry loop for robustness with session timeout handling
+        # Retry loop for robustness with session timeout handling; each attempt waits its turn for a free slot
+        scheduler = SelenoidScheduler.for_url(selenoid_url)
         driver = None
         max_attempts = 3
         attempt = 0
 
         while attempt < max_attempts and not driver:
             try:
-                driver = webdriver.Remote(command_executor=selenoid_url, options=options)
+                with scheduler.slot(session_name):
+                    driver = webdriver.Remote(command_executor=selenoid_url, options=options)
                 driver.implicitly_wait(10)
                 printf(f"Successfully created remote {browser_name} driver via Selenoid")
                 break
+            except SelenoidSlotTimeout:
+                raise
             except Exception as e:
                 error_msg = str(e).lower()
                 attempt += 1
@@ -199,6 +233,9 @@ class WebDriverHelper:
         if not driver:
             raise ConnectionError(f"Failed to create remote driver for {browser_name} after {max_attempts} attempts")
 
+        if browser_name == "chrome" and LeanProfile.is_active(context):
+            LeanProfile.apply(driver)
+
         return driver, None  # No temp dir for remote drivers
 
     @staticmethod
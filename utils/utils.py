@@ -1,6 +1,6 @@
 from selenium.webdriver import ActionChains
 
-from utils.logger import printf
+from utils.logger import debug, printf
 import re
 from datetime import datetime, timedelta
 
@@ -223,11 +223,14 @@ def verify_search_results_in_table(base_page, search_value, table_rows_locator,
             printf("No search results found in the table")
             return False
 
+        # Read every row's cell texts in a single round trip
+        snapshot = base_page.snapshot_table(None, row_xpath=table_rows_locator[1])
+
         # Check each row for the search value using multiple formats if DOB
-        for i, row in enumerate(rows):
-            row_text = row.text.strip().replace("\n", " ").lower()
+        for i, cells in enumerate(snapshot["rows"]):
+            row_text = " ".join(cells).strip().replace("\n", " ").lower()
             normalized_row = normalize(row_text)
-            printf(f"[Row {i + 1}] Text: {row_text}")
+            debug("[Row {}] Text: {}", i + 1, row_text)
 
             # Check all search formats
             for search_format in search_formats:
@@ -309,66 +312,55 @@ def extract_table_row_as_dict(base_page, table_locator, header_locator=None, spe
 
         # Get table element
         table_element = base_page.find_element(table_locator)
+        header_row = base_page.find_element(header_locator) if header_locator else None
 
-        # Get all rows in the table
-        rows = table_element.find_elements(By.XPATH, ".//tr")
-        if len(rows) < 2:  # Need at least header + 1 data row
-            printf(f"❌ Not enough rows in table: {len(rows)}")
-            return None
-
-        # Determine header row
-        if header_locator:
-            # Use specific header locator
-            header_row = base_page.find_element(header_locator)
-            header_cells = header_row.find_elements(By.XPATH, ".//th | .//td")
+        # Get specific data row (skip header row)
+        row_element = None
+        if isinstance(specific_row, int):
+            data_row_index = specific_row if not header_locator else 0
         else:
-            # Assume first row is header
-            header_row = rows[0]
-            header_cells = header_row.find_elements(By.XPATH, ".//th | .//td")
-
-        # Extract header texts
-        headers = []
-        for cell in header_cells:
-            header_text = cell.text.strip()
-            if header_text:  # Only include non-empty headers
-                headers.append(header_text)
+            # specific_row is a WebElement, its index is resolved in the browser
+            data_row_index = 0
+            row_element = specific_row
+
+        # Headers and the data row are serialized in the browser in one call.
+        # Without header_locator the first row is the header row.
+        snapshot = base_page.snapshot_table(
+            table_element,
+            max_rows=1,
+            start_row=data_row_index,
+            row=row_element,
+            header_row=header_row,
+            header_row_xpath=".//tr",
+            header_cell_xpath=".//th | .//td",
+            row_xpath=".//tr",
+        )
+
+        total_rows = snapshot["total_rows"]
+        if total_rows < 2:  # Need at least header + 1 data row
+            printf(f"❌ Not enough rows in table: {total_rows}")
+            return None
 
-        printf(f"📋 Found {len(headers)} headers: {headers}")
+        headers = snapshot["headers"]
+        debug("📋 Found {} headers: {}", len(headers), headers)
 
         if not headers:
             printf("❌ No headers found in table")
             return None
 
-        # Get specific data row (skip header row)
-        if isinstance(specific_row, int):
-            data_row_index = specific_row if not header_locator else 0
-        else:
-            # specific_row is a WebElement, find its index
-            try:
-                data_row_index = rows.index(specific_row)
-            except ValueError:
-                printf("❌ Specified row WebElement not found in table rows")
-                return None
+        if snapshot["start_row"] < 0:
+            printf("❌ Specified row WebElement not found in table rows")
+            return None
 
-        if data_row_index >= len(rows):
+        if not snapshot["rows"]:
             printf("❌ No data rows found after header")
             return None
 
-        data_row = rows[data_row_index]
-        data_cells = data_row.find_elements(By.XPATH, ".//td")
-
-        printf(f"📊 Found {len(data_cells)} data cells in first row")
+        data_cells = snapshot["rows"][0]
+        debug("📊 Found {} data cells in first row", len(data_cells))
 
         # Map headers to data cells
-        row_dict = {}
-        for i, header in enumerate(headers):
-            if i < len(data_cells):
-                cell_value = data_cells[i].text.strip()
-                row_dict[header] = cell_value
-                printf(f"  {header}: {cell_value}")
-            else:
-                row_dict[header] = ""
-                printf(f"  {header}: (empty)")
+        row_dict = {header: data_cells[i] if i < len(data_cells) else "" for i, header in enumerate(headers)}
 
         printf(f"✅ Successfully extracted row data: {row_dict}")
         return row_dict